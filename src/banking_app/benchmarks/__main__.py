@@ -0,0 +1,141 @@
+"""
+Benchmark endpoints and manager methods on the seeded benchmark DB:
+    python -m src.banking_app.benchmarks --clients 100000 --output bench.json
+"""
+
+import json
+import platform
+import subprocess
+import sys
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import asdict
+
+from datetime import date
+from datetime import datetime
+from datetime import timezone
+
+from fastapi.testclient import TestClient
+
+from src.banking_app.benchmarks.cases import CaseFactory
+from src.banking_app.benchmarks.db import Session
+from src.banking_app.benchmarks.generator import DATASET_DATE
+from src.banking_app.benchmarks.generator import copy_seed
+from src.banking_app.benchmarks.db import engine
+from src.banking_app.benchmarks.db import prepare_db
+from src.banking_app.benchmarks.runner import run_case
+from src.banking_app.benchmarks.seed import Scale
+from src.banking_app.benchmarks.seed import seed
+from src.banking_app.connection import activate_session
+from src.banking_app.main import banking_app
+
+
+COPY_SEEDER = 'copy'
+SQL_SEEDER = 'sql'
+
+
+def parse_args() -> Namespace:
+    scale = Scale()
+    parser = ArgumentParser(prog='python -m src.banking_app.benchmarks')
+    parser.add_argument('--clients', type=int, default=scale.clients)
+    parser.add_argument('--statuses', type=int, default=scale.statuses)
+    parser.add_argument('--balances-per-client', type=int, default=scale.balances_per_client)
+    parser.add_argument('--cards-per-client', type=int, default=scale.cards_per_client)
+    parser.add_argument('--transactions-per-card', type=int, default=scale.transactions_per_card)
+    parser.add_argument('--skip-seed', action='store_true', help='Use data seeded by the previous run.')
+    parser.add_argument(
+        '--seeder', choices=(COPY_SEEDER, SQL_SEEDER), default=COPY_SEEDER,
+        help=f'{COPY_SEEDER} - random data generated in Python and streamed with COPY, '
+             f'{SQL_SEEDER} - uniform data generated by Postgres.',
+    )
+    parser.add_argument('--seed', type=int, default=0, help=f'Random seed of {COPY_SEEDER} seeder.')
+    parser.add_argument(
+        '--today', type=date.fromisoformat, default=DATASET_DATE,
+        help=f'Day which dates of {COPY_SEEDER} seeder are generated relative to.',
+    )
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--repetitions', type=int, default=100)
+    parser.add_argument(
+        '--max-unbounded-rows', type=int, default=100_000,
+        help='Skip cases reading whole table if it has more rows.',
+    )
+    parser.add_argument('--case', action='append', default=[], help='Run only cases containing substring.')
+    parser.add_argument('--output', help='JSON report path, stdout if not passed.')
+    return parser.parse_args()
+
+
+def get_commit() -> str | None:
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def main() -> None:
+    args = parse_args()
+    scale = Scale(
+        clients=args.clients,
+        statuses=args.statuses,
+        balances_per_client=args.balances_per_client,
+        cards_per_client=args.cards_per_client,
+        transactions_per_card=args.transactions_per_card,
+    )
+    prepare_db(engine)
+    session = Session()
+    if not args.skip_seed:
+        print(f'Seeding {scale.as_dict()} with {args.seeder} ...', file=sys.stderr)
+        if args.seeder == COPY_SEEDER:
+            copy_seed(session, scale, seed=args.seed, today=args.today)
+        else:
+            seed(session, scale)
+
+    def bench_session():
+        with Session() as session:
+            return session
+
+    banking_app.dependency_overrides[activate_session] = bench_session
+    factory = CaseFactory(TestClient(banking_app), session, scale)
+    biggest_table = max(scale.clients * scale.balances_per_client, scale.transactions)
+
+    results = list()
+    for case in factory.get_cases():
+        if args.case and not any(part in case.name for part in args.case):
+            continue
+        if case.unbounded and biggest_table > args.max_unbounded_rows:
+            print(f'Skip {case.name}: reads whole table.', file=sys.stderr)
+            continue
+        result = run_case(
+            case.name,
+            case.kind,
+            case.call,
+            warmup=args.warmup,
+            repetitions=args.repetitions,
+        )
+        print(f'{case.name}: p50={result.p50_ms}ms p99={result.p99_ms}ms', file=sys.stderr)
+        results.append(asdict(result))
+
+    report = dict(
+        commit=get_commit(),
+        started_at=datetime.now(tz=timezone.utc).isoformat(),
+        python=platform.python_version(),
+        scale=scale.as_dict(),
+        seeder=args.seeder,
+        seed=args.seed,
+        today=args.today.isoformat(),
+        warmup=args.warmup,
+        repetitions=args.repetitions,
+        results=results,
+    )
+    content = json.dumps(report, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        with open(args.output, 'w') as file:
+            file.write(content + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+from dataclasses import dataclass
+
+from fastapi.testclient import TestClient
+
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm.session import Session
+
+from typing import Any
+from typing import Callable
+
+from uuid import uuid4
+
+from src.banking_app.benchmarks.seed import Scale
+from src.banking_app.managers.balance import BalanceManager
+from src.banking_app.managers.client import ClientManager
+from src.banking_app.managers.status import StatusManager
+from src.banking_app.managers.transaction import TransactionManager
+from src.banking_app.managers.transaction_daily import TransactionDailyManager
+from src.banking_app.models.card import Card
+from src.banking_app.types.balance import TimeBucket
+
+
+ENDPOINT = 'endpoint'
+MANAGER = 'manager'
+
+BATCH_SIZE = 100
+CARDS_SAMPLE_SIZE = 1000
+
+
+@dataclass(slots=True, frozen=True)
+class BenchmarkCase:
+    name: str
+    kind: str
+    call: Callable[[int], Any]
+    # Case reads the whole table, it's skipped when the table is too big.
+    unbounded: bool = False
+
+
+class CaseFactory:
+    """
+    Build benchmark cases for the seeded data of passed scale. Ids used by
+    the i-th call are spread over the whole table but depend only on i.
+    """
+
+    def __init__(self, client: TestClient, session: Session, scale: Scale):
+        self.client = client
+        self.session = session
+        self.scale = scale
+        # Written rows must be unique between runs on the same DB.
+        self.run_id = uuid4().int % 10**9
+        # Card numbers depend on the seeder, so the sample is taken from DB.
+        self.card_numbers = self.session.scalars(
+            select(Card.card_number).
+            order_by(func.md5(Card.card_number)).
+            limit(CARDS_SAMPLE_SIZE)
+        ).all()
+        self.session.rollback()
+
+    def client_id(self, i: int) -> int:
+        return 1 + (i * 7919) % self.scale.clients
+
+    def card_number(self, i: int) -> str:
+        return self.card_numbers[i % len(self.card_numbers)]
+
+    def status(self, i: int) -> int:
+        return (1 + i % self.scale.statuses) * 100
+
+    def get_cases(self) -> list[BenchmarkCase]:
+        return self.get_endpoint_cases() + self.get_manager_cases()
+
+    def get_endpoint_cases(self) -> list[BenchmarkCase]:
+        get = self._get
+        post = self._post
+        cases = [
+            BenchmarkCase('GET /status/list', ENDPOINT, get(lambda i: '/status/list')),
+            BenchmarkCase('GET /status/{status_num}', ENDPOINT, get(lambda i: f'/status/{self.status(i)}')),
+            BenchmarkCase('GET /clients/list', ENDPOINT, get(lambda i: '/clients/list'), unbounded=True),
+            BenchmarkCase(
+                'GET /clients/list-filtered', ENDPOINT,
+                get(lambda i: f'/clients/list-filtered?status_code={self.status(i)}&sex=MALE'),
+                unbounded=True,
+            ),
+            BenchmarkCase('GET /clients/stats', ENDPOINT, get(lambda i: '/clients/stats?group_by=status')),
+            BenchmarkCase('GET /clients/{client_id}', ENDPOINT, get(lambda i: f'/clients/{self.client_id(i)}')),
+            BenchmarkCase(
+                'GET /clients/{client_id}/daily', ENDPOINT,
+                get(lambda i: f'/clients/{self.client_id(i)}/daily'),
+            ),
+            BenchmarkCase(
+                'GET /clients/{client_id}/balance-history', ENDPOINT,
+                get(lambda i: f'/clients/{self.client_id(i)}/balance-history?bucket=day'),
+            ),
+            BenchmarkCase('POST /clients/', ENDPOINT, post(lambda i: '/clients/', self._client_body)),
+            BenchmarkCase('GET /balances/list', ENDPOINT, get(lambda i: '/balances/list'), unbounded=True),
+            BenchmarkCase(
+                'GET /balances/list-balances-between', ENDPOINT,
+                get(lambda i: f'/balances/list-balances-between?min_amount={i % 1000}&max_amount={i % 1000}.10'),
+            ),
+            BenchmarkCase('GET /balances/stats', ENDPOINT, get(lambda i: '/balances/stats?function=sum')),
+            BenchmarkCase('POST /balances/', ENDPOINT, post(lambda i: '/balances/', self._balance_body)),
+            BenchmarkCase('GET /cards/', ENDPOINT, get(lambda i: '/cards/'), unbounded=True),
+            BenchmarkCase(
+                'GET /cards/{card_number}/transactions', ENDPOINT,
+                get(lambda i: f'/cards/{self.card_number(i)}/transactions?limit=100'),
+            ),
+            BenchmarkCase(
+                'GET /cards/{card_number}/daily', ENDPOINT,
+                get(lambda i: f'/cards/{self.card_number(i)}/daily'),
+            ),
+            BenchmarkCase('POST /cards/', ENDPOINT, post(lambda i: '/cards/', self._card_body)),
+            BenchmarkCase('GET /transactions/', ENDPOINT, get(lambda i: '/transactions/'), unbounded=True),
+            BenchmarkCase('POST /transactions/', ENDPOINT, post(lambda i: '/transactions/', self._transaction_body)),
+            BenchmarkCase(
+                'POST /transactions/batch', ENDPOINT,
+                post(lambda i: '/transactions/batch', self._transaction_batch_body),
+            ),
+        ]
+        return cases
+
+    def get_manager_cases(self) -> list[BenchmarkCase]:
+        client_manager = ClientManager()
+        status_manager = StatusManager()
+        balance_manager = BalanceManager()
+        transaction_manager = TransactionManager()
+        daily_manager = TransactionDailyManager()
+        scalars = self._scalars
+        rows = self._rows
+        cases = [
+            BenchmarkCase(
+                'StatusManager.filter(status)', MANAGER,
+                scalars(lambda i: status_manager.filter(status=self.status(i))),
+            ),
+            BenchmarkCase(
+                'ClientManager.filter(client_id)', MANAGER,
+                scalars(lambda i: client_manager.filter(client_id=self.client_id(i))),
+            ),
+            BenchmarkCase(
+                'ClientManager.filter(status)', MANAGER,
+                scalars(lambda i: client_manager.filter(status=self.status(i))),
+                unbounded=True,
+            ),
+            BenchmarkCase(
+                'ClientManager.count(group_by=status)', MANAGER,
+                rows(lambda i: client_manager.count(group_by=['status'])),
+            ),
+            BenchmarkCase(
+                'BalanceManager.sum(current_amount)', MANAGER,
+                rows(lambda i: balance_manager.sum('current_amount', actual_flag=True)),
+            ),
+            BenchmarkCase(
+                'BalanceManager.history(day)', MANAGER,
+                rows(lambda i: balance_manager.history(self.client_id(i), TimeBucket.DAY)),
+            ),
+            # Write path of POST /balances/ before and after the single statement version.
+            BenchmarkCase('BalanceManager.create + actualize_balance', MANAGER, self._add_balance_orm),
+            BenchmarkCase('BalanceManager.create_actual', MANAGER, self._add_balance_cte),
+            BenchmarkCase(
+                'TransactionManager.card_history', MANAGER,
+                scalars(lambda i: transaction_manager.card_history(self.card_number(i), limit=100)),
+            ),
+            BenchmarkCase(
+                'TransactionDailyManager.card_daily', MANAGER,
+                scalars(lambda i: daily_manager.card_daily(self.card_number(i))),
+            ),
+            BenchmarkCase(
+                'TransactionDailyManager.client_daily', MANAGER,
+                rows(lambda i: daily_manager.client_daily(self.client_id(i))),
+            ),
+        ]
+        return cases
+
+    def _get(self, path: Callable[[int], str]) -> Callable[[int], bool]:
+        return lambda i: self.client.get(path(i)).status_code < 400
+
+    def _post(
+            self,
+            path: Callable[[int], str],
+            body: Callable[[int], Any],
+    ) -> Callable[[int], bool]:
+        return lambda i: self.client.post(path(i), json=body(i)).status_code < 400
+
+    def _scalars(self, statement: Callable[[int], Any]) -> Callable[[int], Any]:
+        def call(i: int) -> Any:
+            try:
+                return self.session.scalars(statement(i)).unique().all()
+            finally:
+                self.session.rollback()
+        return call
+
+    def _rows(self, statement: Callable[[int], Any]) -> Callable[[int], Any]:
+        def call(i: int) -> Any:
+            try:
+                return self.session.execute(statement(i)).all()
+            finally:
+                self.session.rollback()
+        return call
+
+    def _add_balance_orm(self, i: int) -> Any:
+        try:
+            instance = self.session.scalar(BalanceManager().create(**self._balance_body(i)))
+            instance.client.actualize_balance()
+            self.session.flush()
+            return instance
+        finally:
+            self.session.rollback()
+
+    def _add_balance_cte(self, i: int) -> Any:
+        try:
+            return self.session.execute(BalanceManager().create_actual(**self._balance_body(i))).one()
+        finally:
+            self.session.rollback()
+
+    def _client_body(self, i: int) -> dict[str, Any]:
+        return dict(
+            full_name='Bench Client Number',
+            birth_date='1990-01-01',
+            sex='MALE',
+            phone=str(self.run_id + i).zfill(10)[-10:],
+            doc_num=str(i % 1_000_000).zfill(6),
+            doc_series='12 34',
+        )
+
+    def _balance_body(self, i: int) -> dict[str, Any]:
+        return dict(client_id=self.client_id(i), current_amount=f'{i % 1_000_000}.00')
+
+    def _card_body(self, i: int) -> dict[str, Any]:
+        return dict(
+            card_number='5' + str(self.run_id * 100_000 + i).zfill(15)[-15:],
+            card_type='DEBIT',
+            open_date='2024-01-01',
+            close_date='2029-01-01',
+            processed_datetime='2024-01-01T00:00:00',
+            client_id=self.client_id(i),
+        )
+
+    def _transaction_body(self, i: int, *, index: int = 0) -> dict[str, Any]:
+        return dict(
+            trans_amount=f'{i % 10_000}.{index % 100:02d}',
+            trans_datetime='2024-06-01T12:00:00',
+            processed_datetime='2024-06-01T12:00:00',
+            card_number=self.card_number(i + index),
+        )
+
+    def _transaction_batch_body(self, i: int) -> list[dict[str, Any]]:
+        return [
+            self._transaction_body(i, index=j) | dict(idempotency_key=f'bench-{self.run_id}-{i}-{j}')
+            for j in range(BATCH_SIZE)
+        ]
@@ -0,0 +1,33 @@
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy_utils import create_database  # type: ignore
+from sqlalchemy_utils import database_exists
+
+from src.banking_app.conf import BenchSettings
+from src.banking_app.models.base import Base
+
+
+bench_settings = BenchSettings()  # type: ignore[call-arg]
+
+engine = create_engine(
+    url=bench_settings.DB_URL,
+    echo=bench_settings.ENGINE_ECHO,
+    pool_size=bench_settings.ENGINE_POOL_SIZE,
+    max_overflow=bench_settings.ENGINE_MAX_OVERFLOW,
+    connect_args=bench_settings.connect_args,
+)
+
+Session = sessionmaker(
+    bind=engine,
+    autoflush=bench_settings.SESSION_AUTOFLUSH,
+    expire_on_commit=bench_settings.SESSION_EXPIRE_ON_COMMIT,
+)
+
+
+def prepare_db(engine: Engine) -> None:
+    """Create benchmark DB and tables if they don't exist, data is kept."""
+
+    if not database_exists(engine.url):
+        create_database(engine.url)
+    Base.metadata.create_all(engine)
@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+from random import Random
+
+from sqlalchemy.orm.session import Session
+
+from typing import Any
+from typing import Iterator
+
+from src.banking_app.benchmarks.seed import Scale
+from src.banking_app.benchmarks.seed import TRUNCATE
+from src.banking_app.benchmarks.seed import FIX_SEQUENCES
+from src.banking_app.benchmarks.seed import finish_seed
+from src.banking_app.models.client import Client
+from src.banking_app.types.card import CardType
+from src.banking_app.types.client import SexEnum
+
+
+# Amount of clients (with their balances, cards and transactions) per chunk.
+CHUNK_SIZE = 10_000
+
+FIRST_NAMES = ('Ivan', 'Petr', 'Anna', 'Olga', 'Oleg', 'Irina', 'Denis', 'Maria', 'Pavel', 'Elena')
+LAST_NAMES = ('Ivanov', 'Petrov', 'Sidorov', 'Smirnov', 'Popov', 'Volkov', 'Zimin', 'Orlov')
+MIDDLE_NAMES = ('Ivanovich', 'Petrovich', 'Olegovich', 'Denisovich', 'Pavlovich')
+SEXES = tuple(sex.value for sex in SexEnum)
+CARD_TYPES = tuple(card_type.value for card_type in CardType)
+
+ADULT_AGE_DAYS = 18 * 365
+OLDEST_BIRTH_DATE = date(1940, 1, 1)
+MAX_AMOUNT_CENTS = 100_000_000        # Balance.current_amount < 1 000 000.00
+MAX_TRANS_AMOUNT_CENTS = 1_000_000    # |Transaction.trans_amount| < 10 000.00
+CARD_VALIDITY_DAYS = (3 * 365, 5 * 365)
+# Dates are generated relative to this day, not to the real today, so the
+# dataset of the same seed doesn't change from day to day.
+DATASET_DATE = date(2025, 1, 1)
+
+Columns = dict[str, list[Any]]
+
+
+def luhn_check_digit(number: str) -> str:
+    """Check digit which makes `number + digit` valid by the Luhn algorithm."""
+
+    total = 0
+    for position, char in enumerate(reversed(number)):
+        digit = int(char)
+        if position % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return str((10 - total % 10) % 10)
+
+
+def format_cents(cents: int) -> str:
+    sign = '-' if cents < 0 else ''
+    cents = abs(cents)
+    return f'{sign}{cents // 100}.{cents % 100:02d}'
+
+
+@dataclass(slots=True)
+class Chunk:
+    clients: Columns
+    balances: Columns
+    cards: Columns
+    transactions: Columns
+
+
+class DataGenerator:
+    """
+    Deterministic generator of the whole dataset as columnar chunks: the same
+    `seed` and scale give the same rows, independently of the chunk size.
+
+    Generated rows keep invariants validated by the schemas: birth date is
+    18+ years before registration, registration isn't in the future, only the
+    last balance of client is actual and defines VIP flag, card is opened after
+    registration and closed after opening, card numbers pass the Luhn check,
+    transactions are made while card is open.
+    """
+
+    def __init__(self, scale: Scale, seed: int = 0, today: date = DATASET_DATE):
+        self.scale = scale
+        self.seed = seed
+        self.today = today
+        self.statuses = [(s + 1) * 100 for s in range(scale.statuses)]
+
+    def generate_statuses(self) -> Columns:
+        return dict(
+            status=self.statuses,
+            description=[f'Status number {status // 100}' for status in self.statuses],
+        )
+
+    def generate_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+        for start in range(1, self.scale.clients + 1, chunk_size):
+            stop = min(start + chunk_size, self.scale.clients + 1)
+            chunk = Chunk(
+                clients=_empty(CLIENT_COLUMNS),
+                balances=_empty(BALANCE_COLUMNS),
+                cards=_empty(CARD_COLUMNS),
+                transactions=_empty(TRANSACTION_COLUMNS),
+            )
+            for client_id in range(start, stop):
+                self._add_client(chunk, client_id)
+            yield chunk
+
+    def _add_client(self, chunk: Chunk, client_id: int) -> None:
+        # Own random per client gives the same data for any chunk size.
+        rng = Random(self.seed * 1_000_000_007 + client_id)
+        scale = self.scale
+
+        latest_birth = self.today.toordinal() - ADULT_AGE_DAYS
+        birth = rng.randrange(OLDEST_BIRTH_DATE.toordinal(), latest_birth)
+        reg = rng.randrange(birth + ADULT_AGE_DAYS, self.today.toordinal() + 1)
+        reg_datetime = datetime.fromordinal(reg)
+        seconds_since_reg = max(int((datetime.fromordinal(self.today.toordinal()) - reg_datetime).total_seconds()), 1)
+
+        amounts = [rng.randrange(MAX_AMOUNT_CENTS) for _ in range(scale.balances_per_client)]
+        moments = sorted(rng.randrange(seconds_since_reg) for _ in range(scale.balances_per_client))
+        for n, (amount, moment) in enumerate(zip(amounts, moments), start=1):
+            chunk.balances['current_amount'].append(format_cents(amount))
+            chunk.balances['actual_flag'].append(n == scale.balances_per_client)
+            chunk.balances['processed_datetime'].append(reg_datetime + timedelta(seconds=moment))
+            chunk.balances['client_id'].append(client_id)
+
+        clients = chunk.clients
+        clients['client_id'].append(client_id)
+        clients['full_name'].append(
+            f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(MIDDLE_NAMES)}'
+        )
+        clients['reg_date'].append(date.fromordinal(reg))
+        clients['doc_num'].append(f'{rng.randrange(1_000_000):06d}')
+        clients['doc_series'].append(f'{rng.randrange(100):02d} {rng.randrange(100):02d}')
+        clients['phone'].append(f'9{rng.randrange(1_000_000_000):09d}')
+        clients['VIP_flag'].append(bool(amounts) and amounts[-1] >= Client.VIP_if_balance * 100)
+        clients['birth_date'].append(date.fromordinal(birth))
+        clients['sex'].append(rng.choice(SEXES))
+        clients['status'].append(rng.choice(self.statuses))
+
+        for n in range(scale.cards_per_client):
+            card_index = (client_id - 1) * scale.cards_per_client + n
+            body = f'4{card_index:014d}'
+            card_number = body + luhn_check_digit(body)
+            open_date = rng.randrange(reg, self.today.toordinal() + 1)
+            close_date = open_date + rng.randrange(*CARD_VALIDITY_DAYS)
+
+            cards = chunk.cards
+            cards['card_number'].append(card_number)
+            cards['card_type'].append(rng.choice(CARD_TYPES))
+            cards['open_date'].append(date.fromordinal(open_date))
+            cards['close_date'].append(date.fromordinal(close_date))
+            cards['processed_datetime'].append(datetime.fromordinal(open_date))
+            cards['client_id'].append(client_id)
+
+            active_till = min(close_date, self.today.toordinal())
+            active_seconds = max((active_till - open_date) * 86_400, 1)
+            opened_at = datetime.fromordinal(open_date)
+            transactions = chunk.transactions
+            for _ in range(scale.transactions_per_card):
+                trans_datetime = opened_at + timedelta(seconds=rng.randrange(active_seconds))
+                amount = rng.randrange(-MAX_TRANS_AMOUNT_CENTS + 1, MAX_TRANS_AMOUNT_CENTS)
+                transactions['trans_amount'].append(format_cents(amount))
+                transactions['trans_datetime'].append(trans_datetime)
+                transactions['processed_datetime'].append(trans_datetime + timedelta(seconds=rng.randrange(60)))
+                transactions['card_number'].append(card_number)
+
+
+CLIENT_COLUMNS = (
+    'client_id', 'full_name', 'reg_date', 'doc_num', 'doc_series', 'phone',
+    'VIP_flag', 'birth_date', 'sex', 'status',
+)
+BALANCE_COLUMNS = ('current_amount', 'actual_flag', 'processed_datetime', 'client_id')
+CARD_COLUMNS = ('card_number', 'card_type', 'open_date', 'close_date', 'processed_datetime', 'client_id')
+TRANSACTION_COLUMNS = ('trans_amount', 'trans_datetime', 'processed_datetime', 'card_number')
+
+
+def _empty(columns: tuple[str, ...]) -> Columns:
+    return {column: list() for column in columns}
+
+
+def copy_columns(cursor, table: str, columns: Columns) -> None:
+    """Stream columnar data into the table with COPY FROM STDIN."""
+
+    names = ', '.join(f'"{name}"' for name in columns)
+    with cursor.copy(f'COPY "{table}" ({names}) FROM STDIN') as copy:
+        for row in zip(*columns.values()):
+            copy.write_row(row)
+
+
+def copy_seed(
+        session: Session,
+        scale: Scale,
+        seed: int = 0,
+        today: date = DATASET_DATE,
+        chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """Replace all data of the DB with generated data, streamed with COPY."""
+
+    generator = DataGenerator(scale, seed, today)
+    session.execute(TRUNCATE)
+    cursor = session.connection().connection.dbapi_connection.cursor()
+    try:
+        copy_columns(cursor, 'status_desc', generator.generate_statuses())
+        for chunk in generator.generate_chunks(chunk_size):
+            copy_columns(cursor, 'client', chunk.clients)
+            copy_columns(cursor, 'balance', chunk.balances)
+            copy_columns(cursor, 'card', chunk.cards)
+            copy_columns(cursor, 'transaction', chunk.transactions)
+    finally:
+        cursor.close()
+    session.execute(FIX_SEQUENCES, scale.as_dict())
+    session.commit()
+    finish_seed(session)
@@ -0,0 +1,251 @@
+"""
+Open-loop HTTP load generator for the running application:
+    python -m src.banking_app.benchmarks.load --url http://localhost:8000 \\
+        --rate 200 --duration 60 --concurrency 100 \\
+        --mix get_client=70,post_balance=20,list_filtered=10
+
+Latency is measured from the moment request was scheduled, so requests
+delayed by the saturated client or server are not hidden (no coordinated
+omission); service time is measured from the moment request was sent.
+"""
+
+import asyncio
+import json
+import re
+import sys
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from random import Random
+
+from time import perf_counter
+
+from typing import Any
+from typing import Callable
+
+import httpx
+
+from src.banking_app.benchmarks.runner import percentile
+from src.banking_app.utils.metrics import DURATION_BUCKETS
+from src.banking_app.utils.metrics import Histogram
+
+
+POOL_METRICS = re.compile(r'^\w+_(db_pool_\w+) ([\d.]+)$', re.MULTILINE)
+
+Request = tuple[str, str, dict[str, Any] | None]
+
+
+def get_client(rng: Random, clients: int) -> Request:
+    return 'GET', f'/clients/{rng.randint(1, clients)}', None
+
+
+def post_balance(rng: Random, clients: int) -> Request:
+    body = dict(client_id=rng.randint(1, clients), current_amount=f'{rng.randrange(1_000_000)}.00')
+    return 'POST', '/balances/', body
+
+
+def list_filtered(rng: Random, clients: int) -> Request:
+    sex = rng.choice(('MALE', 'FEMALE'))
+    return 'GET', f'/clients/list-filtered?status_code={rng.randint(1, 9) * 100}&sex={sex}', None
+
+
+def client_daily(rng: Random, clients: int) -> Request:
+    return 'GET', f'/clients/{rng.randint(1, clients)}/daily', None
+
+
+def balance_history(rng: Random, clients: int) -> Request:
+    return 'GET', f'/clients/{rng.randint(1, clients)}/balance-history?bucket=week', None
+
+
+def clients_stats(rng: Random, clients: int) -> Request:
+    return 'GET', '/clients/stats?group_by=status', None
+
+
+OPERATIONS: dict[str, Callable[[Random, int], Request]] = {
+    operation.__name__: operation
+    for operation in (
+        get_client,
+        post_balance,
+        list_filtered,
+        client_daily,
+        balance_history,
+        clients_stats,
+    )
+}
+
+
+@dataclass(slots=True)
+class OperationStats:
+    latencies: list[float] = field(default_factory=list)
+    service_times: list[float] = field(default_factory=list)
+    histogram: Histogram = field(default_factory=lambda: Histogram(DURATION_BUCKETS))
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def observe(self, latency: float, service_time: float, error: str | None) -> None:
+        self.latencies.append(latency)
+        self.service_times.append(service_time)
+        self.histogram.observe(latency)
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def report(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        service_times = sorted(self.service_times)
+        errors = sum(self.errors.values())
+        return dict(
+            requests=len(latencies),
+            errors=errors,
+            error_rate=round(errors / len(latencies), 4),
+            errors_by_kind=self.errors,
+            latency_ms={
+                f'p{p}': round(percentile(latencies, p) * 1000, 3) for p in (50, 95, 99)
+            } | dict(max=round(latencies[-1] * 1000, 3)),
+            service_time_ms={
+                f'p{p}': round(percentile(service_times, p) * 1000, 3) for p in (50, 95, 99)
+            },
+            # Non cumulative amount of requests with latency <= bound (seconds).
+            histogram=dict(zip([*map(str, DURATION_BUCKETS), '+Inf'], self.histogram.counts)),
+        )
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights = dict()
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        if name not in OPERATIONS:
+            raise ValueError(f'Unknown operation {name!r}, available: {", ".join(OPERATIONS)}.')
+        weights[name] = float(weight)
+    return weights
+
+
+class LoadTest:
+
+    def __init__(self, args: Namespace):
+        self.args = args
+        self.mix = parse_mix(args.mix)
+        self.rng = Random(args.seed)
+        self.stats = {name: OperationStats() for name in self.mix}
+        self.pool_samples: list[dict[str, float]] = list()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def run(self) -> dict[str, Any]:
+        args = self.args
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        timeout = httpx.Timeout(args.timeout)
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=timeout) as client:
+            semaphore = asyncio.Semaphore(args.concurrency)
+            sampler = asyncio.create_task(self.sample_pool(client))
+            start = perf_counter()
+            total = int(args.rate * args.duration)
+            names, weights = list(self.mix), list(self.mix.values())
+            tasks = list()
+            for k in range(total):
+                scheduled = start + k / args.rate
+                if (delay := scheduled - perf_counter()) > 0:
+                    await asyncio.sleep(delay)
+                name = self.rng.choices(names, weights)[0]
+                request = OPERATIONS[name](self.rng, args.clients)
+                tasks.append(asyncio.create_task(self.send(client, semaphore, name, request, scheduled)))
+            await asyncio.gather(*tasks)
+            elapsed = perf_counter() - start
+            sampler.cancel()
+
+        return dict(
+            url=args.url,
+            target_rate=args.rate,
+            achieved_rate=round(total / elapsed, 3),
+            duration_s=round(elapsed, 3),
+            concurrency=args.concurrency,
+            max_in_flight=self.max_in_flight,
+            mix=self.mix,
+            operations={name: stats.report() for name, stats in self.stats.items() if stats.latencies},
+            db_pool=self.report_pool(),
+        )
+
+    async def send(self, client, semaphore, name: str, request: Request, scheduled: float) -> None:
+        method, path, body = request
+        async with semaphore:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            sent = perf_counter()
+            error = None
+            try:
+                response = await client.request(method, path, json=body)
+                if response.status_code >= 400:
+                    error = str(response.status_code)
+            except httpx.TimeoutException:
+                error = 'timeout'
+            except httpx.HTTPError as exc:
+                error = type(exc).__name__
+            finally:
+                self.in_flight -= 1
+        finished = perf_counter()
+        self.stats[name].observe(finished - scheduled, finished - sent, error)
+
+    async def sample_pool(self, client) -> None:
+        """Scrape pool gauges from /metrics, requests aren't counted in stats."""
+
+        start = perf_counter()
+        while True:
+            try:
+                response = await client.get('/metrics')
+                sample = {name: float(value) for name, value in POOL_METRICS.findall(response.text)}
+                if sample:
+                    self.pool_samples.append(dict(t=round(perf_counter() - start, 3)) | sample)
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(self.args.pool_interval)
+
+    def report_pool(self) -> dict[str, Any]:
+        if not self.pool_samples:
+            return dict(samples=[], note='Pool gauges not found, is METRICS_ENABLED set?')
+        checked_out = [sample.get('db_pool_checked_out', 0) for sample in self.pool_samples]
+        size = max(sample.get('db_pool_size', 0) for sample in self.pool_samples)
+        saturated = sum(value >= size for value in checked_out)
+        return dict(
+            max_checked_out=max(checked_out),
+            mean_checked_out=round(sum(checked_out) / len(checked_out), 3),
+            max_overflow=max(sample.get('db_pool_overflow', 0) for sample in self.pool_samples),
+            # Share of samples when all pool connections were in use.
+            saturation=round(saturated / len(checked_out), 4),
+            samples=self.pool_samples,
+        )
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser(prog='python -m src.banking_app.benchmarks.load')
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--rate', type=float, default=100, help='Target requests per second.')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds.')
+    parser.add_argument('--concurrency', type=int, default=50, help='Max requests in flight.')
+    parser.add_argument('--mix', default='get_client=70,post_balance=20,list_filtered=10')
+    parser.add_argument('--clients', type=int, default=10_000, help='Client ids are taken from 1..N.')
+    parser.add_argument('--timeout', type=float, default=10, help='Seconds.')
+    parser.add_argument('--pool-interval', type=float, default=0.5, help='Seconds between pool samples.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='JSON report path, stdout if not passed.')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        parse_mix(args.mix)
+    except ValueError as error:
+        sys.exit(str(error))
+    report = asyncio.run(LoadTest(args).run())
+    content = json.dumps(report, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        with open(args.output, 'w') as file:
+            file.write(content + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+import resource
+
+from dataclasses import dataclass
+
+from math import ceil
+
+from time import perf_counter
+
+from typing import Any
+from typing import Callable
+
+
+PROC_CLEAR_REFS = '/proc/self/clear_refs'
+PROC_STATUS = '/proc/self/status'
+RESET_PEAK_RSS = '5'  # Reset VmHWM (peak RSS) of the process, Linux >= 4.0.
+
+
+@dataclass(slots=True)
+class CaseResult:
+    name: str
+    kind: str
+    repetitions: int
+    errors: int
+    min_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    throughput_rps: float
+    peak_rss_mb: float
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+
+    rank = max(ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def reset_peak_rss() -> None:
+    try:
+        with open(PROC_CLEAR_REFS, 'w') as file:
+            file.write(RESET_PEAK_RSS)
+    except OSError:
+        pass  # Not Linux, peak RSS of the whole process will be reported.
+
+
+def get_peak_rss_mb() -> float:
+    try:
+        with open(PROC_STATUS) as file:
+            for line in file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Kilobytes on Linux, bytes on macOS; here only Linux without procfs is left.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_case(
+        name: str,
+        kind: str,
+        call: Callable[[int], Any],
+        *,
+        warmup: int,
+        repetitions: int,
+) -> CaseResult:
+    """
+    Call `call(i)` `warmup` times without measurement, then `repetitions` times
+    measuring each call. Call is failed if it raises an exception or returns
+    False, failed calls are counted but their durations are kept.
+    """
+
+    for i in range(warmup):
+        call(i)
+
+    reset_peak_rss()
+    durations = list()
+    errors = 0
+    for i in range(warmup, warmup + repetitions):
+        start = perf_counter()
+        try:
+            ok = call(i) is not False
+        except Exception:
+            ok = False
+        durations.append(perf_counter() - start)
+        errors += not ok
+
+    durations_ms = sorted(duration * 1000 for duration in durations)
+    total = sum(durations)
+    return CaseResult(
+        name=name,
+        kind=kind,
+        repetitions=repetitions,
+        errors=errors,
+        min_ms=round(durations_ms[0], 3),
+        mean_ms=round(total * 1000 / repetitions, 3),
+        p50_ms=round(percentile(durations_ms, 50), 3),
+        p95_ms=round(percentile(durations_ms, 95), 3),
+        p99_ms=round(percentile(durations_ms, 99), 3),
+        max_ms=round(durations_ms[-1], 3),
+        throughput_rps=round(repetitions / total, 3) if total else 0.0,
+        peak_rss_mb=round(get_peak_rss_mb(), 3),
+    )
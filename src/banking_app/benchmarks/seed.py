@@ -0,0 +1,130 @@
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.orm.session import Session
+
+from src.banking_app.jobs.transaction_daily import catch_up_transaction_daily
+from src.banking_app.models.client import Client
+
+
+@dataclass(slots=True, frozen=True)
+class Scale:
+    clients: int = 10_000
+    statuses: int = 9
+    balances_per_client: int = 3
+    cards_per_client: int = 1
+    transactions_per_card: int = 10
+
+    @property
+    def cards(self) -> int:
+        return self.clients * self.cards_per_client
+
+    @property
+    def transactions(self) -> int:
+        return self.cards * self.transactions_per_card
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self) | dict(cards=self.cards, transactions=self.transactions)
+
+
+# Rows are generated by Postgres itself (generate_series), values are derived
+# from the row number only, so the same scale always gives the same data.
+TRUNCATE = text(
+    'TRUNCATE status_desc, client, balance, card, transaction, '
+    'transaction_daily, rollup_watermark RESTART IDENTITY CASCADE'
+)
+SEED_STATUSES = text("""
+    INSERT INTO status_desc (status, description)
+    SELECT s * 100, 'Status number ' || s
+    FROM generate_series(1, :statuses) AS s
+""")
+SEED_CLIENTS = text("""
+    INSERT INTO client (
+        client_id, full_name, reg_date, doc_num, doc_series, phone,
+        "VIP_flag", birth_date, sex, status
+    )
+    SELECT
+        i,
+        (ARRAY['Ivan', 'Petr', 'Anna', 'Olga', 'Oleg', 'Irina', 'Denis'])[1 + i % 7]
+            || ' ' || (ARRAY['Ivanov', 'Petrov', 'Sidorov', 'Smirnov', 'Popov'])[1 + i % 5]
+            || ' ' || (ARRAY['Ivanovich', 'Petrovich', 'Olegovich'])[1 + i % 3],
+        DATE '2015-01-01' + i % 3000,
+        lpad((i % 1000000)::text, 6, '0'),
+        lpad((i % 100)::text, 2, '0') || ' ' || lpad((i / 100 % 100)::text, 2, '0'),
+        '9' || lpad((i % 1000000000)::text, 9, '0'),
+        false,
+        DATE '1950-01-01' + i % 20000,
+        CASE WHEN i % 2 = 0 THEN 'MALE' ELSE 'FEMALE' END,
+        (1 + i % :statuses) * 100
+    FROM generate_series(1, :clients) AS i
+""")
+SEED_BALANCES = text("""
+    INSERT INTO balance (current_amount, actual_flag, processed_datetime, client_id)
+    SELECT
+        ((c * 7919 + n * 104729) % 100000000) / 100.0,
+        n = :balances_per_client,
+        TIMESTAMP '2024-01-01' + n * INTERVAL '1 day' + c * INTERVAL '1 second',
+        c
+    FROM generate_series(1, :clients) AS c, generate_series(1, :balances_per_client) AS n
+""")
+SEED_CARDS = text("""
+    INSERT INTO card (
+        card_number, card_type, open_date, close_date, processed_datetime, client_id
+    )
+    SELECT
+        '4' || lpad(((c - 1) * :cards_per_client + n)::text, 15, '0'),
+        CASE WHEN n % 2 = 1 THEN 'DEBIT' ELSE 'CREDIT' END,
+        DATE '2020-01-01' + c % 1000,
+        DATE '2025-01-01' + c % 1000,
+        TIMESTAMP '2020-01-01' + c * INTERVAL '1 second',
+        c
+    FROM generate_series(1, :clients) AS c, generate_series(1, :cards_per_client) AS n
+""")
+SEED_TRANSACTIONS = text("""
+    INSERT INTO transaction (trans_amount, trans_datetime, processed_datetime, card_number)
+    SELECT
+        ((k * 31 + t * 7919) % 1000000) / 100.0 - 5000,
+        TIMESTAMP '2024-01-01' + t * INTERVAL '1 day' + k * INTERVAL '1 second',
+        TIMESTAMP '2024-01-01' + t * INTERVAL '1 day' + k * INTERVAL '1 second',
+        '4' || lpad(k::text, 15, '0')
+    FROM generate_series(1, :cards) AS k, generate_series(1, :transactions_per_card) AS t
+""")
+SYNC_VIP_FLAGS = text("""
+    UPDATE client SET "VIP_flag" = true
+    FROM balance
+    WHERE balance.client_id = client.client_id
+        AND balance.actual_flag
+        AND balance.current_amount >= :vip_if_balance
+""")
+FIX_SEQUENCES = text(
+    "SELECT setval(pg_get_serial_sequence('client', 'client_id'), :clients)"
+)
+
+
+def seed(session: Session, scale: Scale) -> None:
+    """Replace all data of the DB with the generated data of passed scale."""
+
+    params = scale.as_dict() | dict(vip_if_balance=Client.VIP_if_balance)
+    session.execute(TRUNCATE)
+    for statement in (
+            SEED_STATUSES,
+            SEED_CLIENTS,
+            SEED_BALANCES,
+            SEED_CARDS,
+            SEED_TRANSACTIONS,
+            SYNC_VIP_FLAGS,
+            FIX_SEQUENCES,
+    ):
+        session.execute(statement, params)
+    session.commit()
+    finish_seed(session)
+
+
+def finish_seed(session: Session) -> None:
+    """Aggregate the rollup and refresh statistics of the seeded tables."""
+
+    catch_up_transaction_daily(session)
+    # Fresh statistics, otherwise planner works with the empty tables estimates.
+    session.execute(text('ANALYZE'))
+    session.commit()
@@ -0,0 +1,134 @@
+"""
+Cold start of the application, each run is a fresh interpreter:
+    python -m src.banking_app.benchmarks.startup --runs 10 --output startup.json
+
+Report contains percentiles of the import time of `src.banking_app.main` and
+of the first request, and the `-X importtime` profile of the last run: the
+slowest modules by self time and self time summed by top level package.
+"""
+
+import json
+import subprocess
+import sys
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from collections import Counter
+
+from typing import Any
+
+from src.banking_app.benchmarks.runner import percentile
+
+
+APP_MODULE = 'src.banking_app.main'
+FIRST_REQUEST_PATH = '/metrics'  # Doesn't touch DB, so DB state doesn't matter.
+
+COLD_START_SCRIPT = f'''
+import json
+from time import perf_counter
+
+start = perf_counter()
+from {APP_MODULE} import banking_app
+imported = perf_counter()
+
+from fastapi.testclient import TestClient  # Test tooling isn't measured.
+client_imported = perf_counter()
+with TestClient(banking_app) as client:
+    started = perf_counter()
+    status_code = client.get({FIRST_REQUEST_PATH!r}).status_code
+    responded = perf_counter()
+
+print(json.dumps(dict(
+    import_s=imported - start,
+    lifespan_s=started - client_imported,
+    first_request_s=responded - started,
+    status_code=status_code,
+)))
+'''
+
+
+def run_cold_start() -> dict[str, Any]:
+    result = subprocess.run(
+        [sys.executable, '-c', COLD_START_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def profile_imports(top: int) -> dict[str, Any]:
+    """Parse `python -X importtime` output (microseconds, nested by indent)."""
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {APP_MODULE}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = list()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|')
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    by_package: Counter[str] = Counter()
+    for name, self_us, _ in modules:
+        package = APP_MODULE.rsplit('.', 1)[0] if name.startswith('src.banking_app') else name.split('.')[0]
+        by_package[package] += self_us
+
+    slowest = sorted(modules, key=lambda module: module[1], reverse=True)[:top]
+    return dict(
+        total_ms=round(max(cumulative for _, _, cumulative in modules) / 1000, 3),
+        slowest_modules=[
+            dict(module=name, self_ms=round(self_us / 1000, 3), cumulative_ms=round(cumulative_us / 1000, 3))
+            for name, self_us, cumulative_us in slowest
+        ],
+        self_ms_by_package={
+            package: round(self_us / 1000, 3) for package, self_us in by_package.most_common(top)
+        },
+    )
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    values_ms = sorted(value * 1000 for value in values)
+    return {
+        'min_ms': round(values_ms[0], 3),
+        'p50_ms': round(percentile(values_ms, 50), 3),
+        'p95_ms': round(percentile(values_ms, 95), 3),
+        'max_ms': round(values_ms[-1], 3),
+    }
+
+
+def parse_args() -> Namespace:
+    parser = ArgumentParser(prog='python -m src.banking_app.benchmarks.startup')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=25, help='Amount of modules and packages in profile.')
+    parser.add_argument('--output', help='JSON report path, stdout if not passed.')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    runs = [run_cold_start() for _ in range(args.runs)]
+    report = dict(
+        python=sys.version.split()[0],
+        runs=args.runs,
+        import_time=summarize([run['import_s'] for run in runs]),
+        lifespan_time=summarize([run['lifespan_s'] for run in runs]),
+        first_request_time=summarize([run['first_request_s'] for run in runs]),
+        ready_time=summarize([run['import_s'] + run['lifespan_s'] + run['first_request_s'] for run in runs]),
+        import_profile=profile_imports(args.top),
+    )
+    content = json.dumps(report, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        with open(args.output, 'w') as file:
+            file.write(content + '\n')
+
+
+if __name__ == '__main__':
+    main()
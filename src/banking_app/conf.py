@@ -5,11 +5,16 @@ from datetime import timezone
 
 from enum import Enum
 
+from functools import cache
+
 from pathlib import Path
 
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 
+from secrets import compare_digest
+
+from typing import Any
 from typing import NewType
 
 
@@ -24,6 +29,17 @@ class TimeZone(Enum):
     MSC = timezone(offset=timedelta(hours=+3), name='MSC')
 
 
+class RoutePriority(str, Enum):
+    """Admission classes of routes, ordered from the highest priority."""
+    POINT_READ = 'point_read'
+    WRITE = 'write'
+    LIST = 'list'
+
+    @property
+    def rank(self) -> int:
+        return list(RoutePriority).index(self)
+
+
 class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: int
@@ -33,8 +49,41 @@ class Settings(BaseSettings):
     ENGINE_ECHO: bool = True
     ENGINE_POOL_SIZE: int = 5
     ENGINE_MAX_OVERFLOW: int = 10
+    ENGINE_POOL_TIMEOUT: float = 5
+    THREADPOOL_SIZE: int | None = None
+    RETRY_AFTER_SECONDS: int = 1
+    STATEMENT_TIMEOUT_MS: int | None = None
+    LOCK_TIMEOUT_MS: int | None = None
+    ROUTE_STATEMENT_TIMEOUTS_MS: dict[str, int] = {}
+    ROUTE_LOCK_TIMEOUTS_MS: dict[str, int] = {}
+    NEGATIVE_CACHE_ENABLED: bool = True
+    NEGATIVE_CACHE_SIZE: int = 10_000
+    NEGATIVE_CACHE_TTL_SECONDS: float = 5
+    SINGLE_FLIGHT_ENABLED: bool = True
+    SINGLE_FLIGHT_ROUTES: set[str] = set()
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_CONCURRENCY: int | None = None
+    ADMISSION_QUEUE_TIMEOUT: float = 5
+    ADMISSION_CLASS_LIMITS: dict[RoutePriority, int] = {RoutePriority.LIST: 2}
+    ADMISSION_ROUTE_LIMITS: dict[str, int] = {}
+    ADMISSION_ROUTE_PRIORITIES: dict[str, RoutePriority] = {
+        'GET /cards/{card_number}/transactions': RoutePriority.LIST,
+        'GET /cards/{card_number}/daily': RoutePriority.LIST,
+        'GET /clients/{client_id}/daily': RoutePriority.LIST,
+        'GET /clients/{client_id}/balance-history': RoutePriority.LIST,
+    }
+    ADMISSION_EXEMPT_ROUTES: set[str] = {'GET /metrics', 'GET /health/live', 'GET /health/ready'}
     SESSION_AUTOFLUSH: bool = True
     SESSION_EXPIRE_ON_COMMIT: bool = False
+    METRICS_ENABLED: bool = True
+    WARMUP_ENABLED: bool = True
+    SLOW_QUERY_LOG_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_LOG_SIZE: int = 100
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
+    ADMIN_TOKEN: str | None = None
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_INTERVAL_MS: float = 1
 
     @property
     def DB_URL(self) -> str:
@@ -49,14 +98,38 @@ class Settings(BaseSettings):
 
     @property
     def connect_args(self) -> dict[str, str]:
+        options = ['-c timezone=utc']
+        # Defaults of the whole connection, routes override them with SET LOCAL.
+        if self.STATEMENT_TIMEOUT_MS is not None:
+            options.append(f'-c statement_timeout={self.STATEMENT_TIMEOUT_MS}')
+        if self.LOCK_TIMEOUT_MS is not None:
+            options.append(f'-c lock_timeout={self.LOCK_TIMEOUT_MS}')
         return {
-            'options': '-c timezone=utc',
+            'options': ' '.join(options),
         }
 
+    @property
+    def threadpool_size(self) -> int:
+        # More threads than connections only wait in pool checkout.
+        if self.THREADPOOL_SIZE is not None:
+            return self.THREADPOOL_SIZE
+        return self.ENGINE_POOL_SIZE + self.ENGINE_MAX_OVERFLOW
+
+    @property
+    def admission_concurrency(self) -> int:
+        if self.ADMISSION_CONCURRENCY is not None:
+            return self.ADMISSION_CONCURRENCY
+        return self.threadpool_size
+
     @property
     def TZ(self) -> timezone:
         return TimeZone.UTC.value
 
+    def is_admin_token(self, token: str | None) -> bool:
+        if self.ADMIN_TOKEN is None or token is None:
+            return False
+        return compare_digest(token, self.ADMIN_TOKEN)
+
     def get_datetime_now(self) -> datetime:
         return datetime.now(tz=self.TZ)
 
@@ -71,5 +144,21 @@ class TestSettings(Settings):
     model_config = SettingsConfigDict(env_file=APP_DIR / '.env.test')
 
 
+class BenchSettings(Settings):
+
+    model_config = SettingsConfigDict(env_file=APP_DIR / '.env.bench')
+
+
 settings = Settings()  # type: ignore[call-arg]
-test_settings = TestSettings()  # type: ignore[call-arg]
+
+
+@cache
+def get_test_settings() -> TestSettings:
+    return TestSettings()  # type: ignore[call-arg]
+
+
+def __getattr__(name: str) -> Any:
+    """Read `.env.test` only when `test_settings` are imported (by tests)."""
+    if name == 'test_settings':
+        return get_test_settings()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
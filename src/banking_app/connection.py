@@ -1,27 +1,44 @@
+from fastapi import Request
+
 from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 
 from src.banking_app.conf import settings
+from src.banking_app.utils.metrics import MeasuredQueuePool
+from src.banking_app.utils.metrics import instrument_engine
+from src.banking_app.utils.query_deadline import QUERY_DEADLINE_KEY
+from src.banking_app.utils.query_deadline import apply_query_deadline
+from src.banking_app.utils.query_deadline import get_query_deadline
+from src.banking_app.utils.slow_queries import slow_query_recorder
 
 
 Engine = create_engine(
     url=settings.DB_URL,
-    echo=True,
-    pool_size=5,
-    max_overflow=10,
+    echo=settings.ENGINE_ECHO,
+    pool_size=settings.ENGINE_POOL_SIZE,
+    max_overflow=settings.ENGINE_MAX_OVERFLOW,
+    pool_timeout=settings.ENGINE_POOL_TIMEOUT,
+    poolclass=MeasuredQueuePool,
     connect_args=settings.connect_args,
 )
+if settings.METRICS_ENABLED:
+    instrument_engine(Engine)
+if settings.SLOW_QUERY_LOG_ENABLED:
+    slow_query_recorder.instrument(Engine)
 
 
 Session = sessionmaker(
     bind=Engine,
-    autoflush=True,  # Call method session.flush() after session.execute(stmt);
-    expire_on_commit=False,
+    autoflush=settings.SESSION_AUTOFLUSH,  # Call method session.flush() after session.execute(stmt);
+    expire_on_commit=settings.SESSION_EXPIRE_ON_COMMIT,
 )
+event.listen(Session, 'after_begin', apply_query_deadline)
 
 
-def activate_session():
+def activate_session(request: Request):
     with Session() as session:
+        session.info[QUERY_DEADLINE_KEY] = get_query_deadline(request)
         return session
 
 
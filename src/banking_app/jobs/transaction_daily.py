@@ -0,0 +1,59 @@
+from sqlalchemy.orm.session import Session
+
+from src.banking_app.connection import Session as SessionMaker
+from src.banking_app.managers.transaction_daily import TransactionDailyManager
+
+
+# Amount of trans_id processed per one DB transaction of the job.
+CATCH_UP_CHUNK_SIZE = 100_000
+# Amount of trans_id before the watermark recomputed on each run, they may be
+# committed after higher ids the watermark was moved to.
+CATCH_UP_TRAILING_IDS = 10_000
+
+manager = TransactionDailyManager()
+
+
+def catch_up_transaction_daily(
+        session: Session,
+        chunk_size: int = CATCH_UP_CHUNK_SIZE,
+        trailing_ids: int = CATCH_UP_TRAILING_IDS,
+) -> int:
+    """
+    Aggregate into `transaction_daily` all transactions inserted after the
+    watermark (e.g. loaded bypassing the API), moving the watermark forward
+    chunk by chunk. Returns the amount of processed trans_id.
+
+    Ids are taken from the sequence before the commit, so a load committed
+    late may have ids below the watermark. Last `trailing_ids` before the
+    watermark are recomputed on each run to pick up such transactions.
+
+    Run it periodically:
+        python -m src.banking_app.jobs.transaction_daily
+    """
+
+    # Wait until ingestions in progress commit their increments.
+    session.execute(manager.lock_for_catch_up())
+    watermark = session.scalar(manager.watermark()) or 0
+    if watermark > 0 and trailing_ids > 0:
+        session.execute(manager.recompute(max(watermark - trailing_ids, 0), watermark))
+    session.commit()
+
+    processed = 0
+    while True:
+        session.execute(manager.lock_for_catch_up())
+        watermark = session.scalar(manager.watermark()) or 0
+        last_trans_id = session.scalar(manager.last_trans_id()) or 0
+        if last_trans_id <= watermark:
+            session.commit()
+            return processed
+
+        till = min(watermark + chunk_size, last_trans_id)
+        session.execute(manager.recompute(watermark, till))
+        session.execute(manager.move_watermark(till))
+        session.commit()
+        processed += till - watermark
+
+
+if __name__ == '__main__':
+    with SessionMaker() as session:
+        catch_up_transaction_daily(session)
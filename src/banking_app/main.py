@@ -1,15 +1,80 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from anyio.to_thread import current_default_thread_limiter
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from starlette.concurrency import run_in_threadpool
+
+from src.banking_app.conf import settings
+from src.banking_app.connection import Engine
+from src.banking_app.connection import Session
+from src.banking_app.routers.admin import router as router_admin
 from src.banking_app.routers.balance import router as router_balance
 from src.banking_app.routers.card import router as router_card
 from src.banking_app.routers.client import router as router_client
+from src.banking_app.routers.metrics import router as router_metrics
 from src.banking_app.routers.status import router as router_status_description
 from src.banking_app.routers.transaction import router as router_transaction
+from src.banking_app.utils.admission import AdmissionMiddleware
+from src.banking_app.utils.admission import admission_controller
+from src.banking_app.utils.exceptions import pool_timeout_handler
+from src.banking_app.utils.exceptions import query_timeout_handler
+from src.banking_app.utils.metrics import QueryMetricsMiddleware
+from src.banking_app.utils.metrics import instrument_threadpool
+from src.banking_app.utils.metrics import metrics
+from src.banking_app.utils.profiling import ProfilingMiddleware
+from src.banking_app.utils.single_flight import SingleFlightMiddleware
+from src.banking_app.utils.warmup import warm_up
 
 
-banking_app = FastAPI(title='Banking application')
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up before serving, `GET /health/ready` responds 503 until then."""
+
+    app.state.ready = False
+    # Limiter of sync endpoints and dependencies, is bound to the running event loop.
+    limiter = current_default_thread_limiter()
+    limiter.total_tokens = settings.threadpool_size
+    if settings.METRICS_ENABLED:
+        instrument_threadpool(limiter)
+    if settings.WARMUP_ENABLED:
+        await run_in_threadpool(warm_up, Engine, Session, settings.ENGINE_POOL_SIZE)
+        app.openapi()
+    app.state.ready = True
+    yield
+
+
+banking_app = FastAPI(title='Banking application', lifespan=lifespan)
 banking_app.include_router(router_balance)
 banking_app.include_router(router_card)
 banking_app.include_router(router_client)
 banking_app.include_router(router_status_description)
 banking_app.include_router(router_transaction)
+banking_app.include_router(router_metrics)
+banking_app.include_router(router_admin)
+banking_app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+banking_app.add_exception_handler(OperationalError, query_timeout_handler)
+
+if settings.ADMISSION_ENABLED:
+    # Added before metrics middleware, so request durations include waiting for admission.
+    banking_app.add_middleware(AdmissionMiddleware, controller=admission_controller)
+    if settings.METRICS_ENABLED:
+        admission_controller.instrument()
+if settings.SINGLE_FLIGHT_ENABLED:
+    # Outside of admission control, so followers don't take admission slots.
+    banking_app.add_middleware(
+        SingleFlightMiddleware,
+        registry=metrics if settings.METRICS_ENABLED else None,
+    )
+if settings.METRICS_ENABLED:
+    banking_app.add_middleware(QueryMetricsMiddleware)
+if settings.PROFILING_ENABLED:
+    # Added last to be the outermost middleware and profile the others too.
+    banking_app.add_middleware(
+        ProfilingMiddleware,
+        sample_interval=settings.PROFILING_SAMPLE_INTERVAL_MS / 1000,
+    )
@@ -1,17 +1,30 @@
+from datetime import datetime
+
 from typing import Any
 
+from sqlalchemy import func
+from sqlalchemy import insert
 from sqlalchemy import Insert
+from sqlalchemy import Row
+from sqlalchemy import select
 from sqlalchemy import Select
+from sqlalchemy import update
 from sqlalchemy.orm import selectinload
 
+from src.banking_app.conf import NotSpecifiedParam
+from src.banking_app.conf import settings
 from src.banking_app.managers.base import SeCrUpStmt
 from src.banking_app.managers.base import SeCrUpManager
 from src.banking_app.models.balance import Balance
 from src.banking_app.models.client import Client
+from src.banking_app.types.balance import TimeBucket
+
+
+CLIENT_COLUMN_PREFIX = 'client__'
 
 
 class BalanceManager(SeCrUpManager):
-    model: type[Balance]
+    model: type[Balance] = Balance
 
     def filter(self, **kwargs) -> Select:
         statement = self._enrich_statement(super().filter(**kwargs))
@@ -25,6 +38,126 @@ class BalanceManager(SeCrUpManager):
         statement = self._enrich_statement(super().bulk_create(list_kwargs))
         return statement
 
+    def create_actual(self, **kwargs) -> Select:
+        """
+        Insert balance, reset `actual_flag` of the previous client balances and
+        update client `VIP_flag` in one statement with data-modifying CTEs, as
+        `Client.actualize_balance` does in several round trips. Statement
+        returns one row: balance columns and client columns prefixed with
+        `CLIENT_COLUMN_PREFIX`, which are parsed by `parse_actual`.
+
+        All CTEs see the same snapshot, so the new balance isn't reset, and
+        the client row is read before the update, `VIP_flag` is taken from
+        the update if it happened.
+        """
+
+        # Column defaults are set explicitly, not to rely on their prefetch for INSERT nested in CTE.
+        kwargs.setdefault('actual_flag', True)
+        kwargs.setdefault('processed_datetime', settings.get_datetime_now())
+        inserted = (
+            insert(self.model).
+            values(**kwargs).
+            returning(*self.model.__table__.columns).
+            cte('inserted')
+        )
+        reset_actual = (
+            update(self.model).
+            where(
+                self.model.client_id == inserted.c.client_id,
+                self.model.actual_flag.is_(True),
+            ).
+            values(actual_flag=False).
+            cte('reset_actual')
+        )
+        vip_flag = inserted.c.current_amount >= Client.VIP_if_balance
+        updated_client = (
+            update(Client).
+            where(
+                Client.client_id == inserted.c.client_id,
+                Client.VIP_flag.is_distinct_from(vip_flag),
+            ).
+            values(VIP_flag=vip_flag).
+            returning(Client.client_id, Client.VIP_flag).
+            cte('updated_client')
+        )
+        client_columns = [
+            func.coalesce(updated_client.c.VIP_flag, column) if column.key == 'VIP_flag' else column
+            for column in Client.__table__.columns
+        ]
+        statement = (
+            select(
+                *inserted.c,
+                *[
+                    column.label(f'{CLIENT_COLUMN_PREFIX}{table_column.key}')
+                    for column, table_column in zip(client_columns, Client.__table__.columns)
+                ],
+            ).
+            join_from(inserted, Client, Client.client_id == inserted.c.client_id).
+            outerjoin(updated_client, updated_client.c.client_id == inserted.c.client_id).
+            add_cte(reset_actual)
+        )
+        return statement
+
+    @staticmethod
+    def parse_actual(row: Row) -> dict[str, Any]:
+        """Nest client columns of `create_actual` row under `client` key."""
+
+        balance, client = dict(), dict()
+        for key, value in row._mapping.items():
+            if key.startswith(CLIENT_COLUMN_PREFIX):
+                client[key.removeprefix(CLIENT_COLUMN_PREFIX)] = value
+            else:
+                balance[key] = value
+        balance['client'] = client
+        return balance
+
+    def history(
+            self,
+            client_id: int,
+            bucket: TimeBucket,
+            *,
+            date_from: datetime = NotSpecifiedParam,                            # type: ignore
+            date_to: datetime = NotSpecifiedParam,                              # type: ignore
+    ) -> Select:
+        """
+        Select the last balance of each time bucket and its change against the
+        previous bucket, ordered from oldest to newest bucket.
+        """
+
+        bucket_start = func.date_trunc(bucket.value, self.model.processed_datetime)
+        ranked = (
+            self.filter(
+                client_id=client_id,
+                processed_datetime__ge=date_from,
+                processed_datetime__lt=date_to,
+            ).
+            with_only_columns(
+                bucket_start.label('bucket_start'),
+                self.model.current_amount,
+                func.row_number().over(
+                    partition_by=bucket_start,
+                    order_by=(
+                        self.model.processed_datetime.desc(),
+                        self.model.row_id.desc(),
+                    ),
+                ).label('position'),
+            ).
+            subquery()
+        )
+        previous_amount = func.lag(ranked.c.current_amount).over(
+            order_by=ranked.c.bucket_start,
+        )
+        statement = (
+            select(
+                ranked.c.bucket_start,
+                ranked.c.current_amount,
+                (ranked.c.current_amount - previous_amount).label('delta'),
+            ).
+            where(ranked.c.position == 1).
+            order_by(ranked.c.bucket_start)
+        )
+        return statement
+
     def _enrich_statement(self, statement: SeCrUpStmt) -> SeCrUpStmt:
         """Enrich passed statement and return enriched statement."""
 
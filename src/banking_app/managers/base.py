@@ -3,14 +3,26 @@ from re import sub
 
 from abc import ABC
 
+from collections import defaultdict
+
 from typing import Any
+from typing import Sequence
 from typing import TypeVar
 
+from sqlalchemy import any_
+from sqlalchemy import bindparam
+from sqlalchemy import Boolean
+from sqlalchemy import cast
+from sqlalchemy import column
 from sqlalchemy import delete
+from sqlalchemy import func
 from sqlalchemy import insert
+from sqlalchemy import literal_column
 from sqlalchemy import select
 from sqlalchemy import Select
 from sqlalchemy import update
+from sqlalchemy import values
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.dml import ReturningDelete
 from sqlalchemy.sql.dml import ReturningInsert
@@ -18,12 +30,31 @@ from sqlalchemy.sql.dml import ReturningUpdate
 
 from src.banking_app.conf import NotSpecifiedParam
 from src.banking_app.models.base import Base
+from src.banking_app.types.general import AggregateFunction
 from src.banking_app.utils.kwargs_parser import KwargsParser
 
 
 UPDATE_WITH_EMPTY_BODY_MSG = (
     'Without new values, updating can\'t proceed, new values = {values}.'
 )
+AGGREGATE_WITHOUT_FIELD_MSG = (
+    'Aggregate function `{function}` can\'t proceed without field.'
+)
+
+# Row version of a row written by INSERT ... ON CONFLICT is zero only if it
+# was inserted, updated rows keep the id of the updating transaction.
+INSERTED_COLUMN = literal_column('xmax = 0', Boolean).label('inserted')
+
+# Bulk statements are split to keep bound parameters of each one far below
+# the 65535 parameters limit of the PostgreSQL protocol.
+BULK_PARAMETERS_LIMIT = 30_000
+
+AGGREGATE_FUNCTIONS = {
+    AggregateFunction.COUNT: func.count,
+    AggregateFunction.SUM: func.sum,
+    AggregateFunction.MIN: func.min,
+    AggregateFunction.MAX: func.max,
+}
 
 
 class AbstractManager(ABC):
@@ -55,6 +86,48 @@ class SelectManager(AbstractManager):
         )
         return statement
 
+    def aggregate(
+            self,
+            function: AggregateFunction,
+            field: str | None = None,
+            *,
+            group_by: Sequence[str] = tuple(),
+            **kwargs,
+    ) -> Select:
+        """
+        Calculate `function` of `field` over the rows matched by the `kwargs`
+        (same syntax as in `filter`), optionally per group of `group_by` fields.
+        Rows are never loaded, statement returns columns (*group_by, value).
+        """
+
+        if field is None and function != AggregateFunction.COUNT:
+            raise ValueError(AGGREGATE_WITHOUT_FIELD_MSG.format(function=function))
+
+        self._remove_not_specified_params(kwargs)
+        conditions = KwargsParser().parse_kwargs(**kwargs)
+        target = [] if field is None else [getattr(self.model, field)]
+        groups = [getattr(self.model, g) for g in group_by]
+        statement = (
+            select(*groups, AGGREGATE_FUNCTIONS[function](*target).label('value')).
+            select_from(self.model).
+            where(*eval(conditions)).
+            group_by(*groups).
+            order_by(*groups)
+        )
+        return statement
+
+    def count(self, *, group_by: Sequence[str] = tuple(), **kwargs) -> Select:
+        return self.aggregate(AggregateFunction.COUNT, group_by=group_by, **kwargs)
+
+    def sum(self, field: str, *, group_by: Sequence[str] = tuple(), **kwargs) -> Select:
+        return self.aggregate(AggregateFunction.SUM, field, group_by=group_by, **kwargs)
+
+    def min(self, field: str, *, group_by: Sequence[str] = tuple(), **kwargs) -> Select:
+        return self.aggregate(AggregateFunction.MIN, field, group_by=group_by, **kwargs)
+
+    def max(self, field: str, *, group_by: Sequence[str] = tuple(), **kwargs) -> Select:
+        return self.aggregate(AggregateFunction.MAX, field, group_by=group_by, **kwargs)
+
     @staticmethod
     def _remove_not_specified_params(kwargs: dict[str, Any]) -> None:
         """Pop from dictionary keys which value has NotSpecifiedParam type."""
@@ -80,6 +153,82 @@ class CreateManager(AlterManager):
         )
         return statement
 
+    def bulk_upsert(
+            self,
+            list_kwargs: list[dict[str, Any]],
+            *,
+            conflict_target: Sequence[str] | None = None,
+            update_columns: Sequence[str] | None = None,
+    ) -> list[ReturningInsert]:
+        """
+        Multi-row inserts per chunk, rows conflicting by `conflict_target`
+        columns (primary key by default) are updated with `update_columns`
+        (all passed columns except the target by default) or skipped if
+        `update_columns` is empty. Of rows with the same target inside of the
+        batch the last one is used, see `unique_rows`.
+
+        Statements return columns of written rows and boolean `inserted`,
+        skipped rows aren't returned. They should be executed in one transaction.
+        """
+
+        if conflict_target is None:
+            conflict_target = self._get_primary_key_columns()
+        list_kwargs = self.unique_rows(list_kwargs, conflict_target=conflict_target)
+        if update_columns is None:
+            passed_columns = dict.fromkeys(key for kwargs in list_kwargs for key in kwargs)
+            update_columns = [key for key in passed_columns if key not in conflict_target]
+
+        statements = list()
+        # Columns with defaults are bound for each row too, so all are counted.
+        chunk_size = BULK_PARAMETERS_LIMIT // len(self.model.__table__.columns)
+        for i in range(0, len(list_kwargs), chunk_size):
+            statement = postgresql.insert(self.model).values(list_kwargs[i:i + chunk_size])
+            if len(update_columns) > 0:
+                statement = statement.on_conflict_do_update(
+                    index_elements=conflict_target,
+                    set_={key: statement.excluded[key] for key in update_columns},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=conflict_target)
+            statements.append(statement.returning(*self.model.__table__.columns, INSERTED_COLUMN))
+        return statements
+
+    def unique_rows(
+            self,
+            list_kwargs: list[dict[str, Any]],
+            *,
+            conflict_target: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Keep the last of rows with the same `conflict_target` columns (primary
+        key by default), since one INSERT can't affect a row twice.
+        """
+
+        if conflict_target is None:
+            conflict_target = self._get_primary_key_columns()
+        unique_kwargs = {tuple(kwargs[key] for key in conflict_target): kwargs for kwargs in list_kwargs}
+        return list(unique_kwargs.values())
+
+    def _get_primary_key_columns(self) -> list[str]:
+        return [column.key for column in self.model.__table__.primary_key]
+
+    def advance_sequence(self, value: int) -> Select:
+        """
+        Move sequence of the integer primary key forward to `value`, since rows
+        inserted with explicit key don't move it. Sequence never moves back.
+        """
+
+        primary_key = self.model.__table__.primary_key.columns[0]
+        sequence = cast(
+            func.pg_get_serial_sequence(self.model.__tablename__, primary_key.name),
+            postgresql.REGCLASS,
+        )
+        statement = (
+            select(func.setval(sequence, value)).
+            where(func.coalesce(func.pg_sequence_last_value(sequence), 0) < value)
+        )
+        return statement
+
 
 class UpdateManager(AlterManager):
 
@@ -101,6 +250,48 @@ class UpdateManager(AlterManager):
         )
         return statement
 
+    def bulk_update(self, list_kwargs: list[dict[str, Any]]) -> list[ReturningUpdate]:
+        """
+        Update rows by primary key, each of `list_kwargs` holds the key and new
+        values of one row. Rows changing the same columns are updated by one
+        `UPDATE ... FROM (VALUES ...)` statement per chunk, of rows with the
+        same key the last one is used, rows without new values are ignored.
+
+        Statements return columns of updated rows, missing rows aren't returned.
+        """
+
+        primary_key = self.model.__table__.primary_key.columns[0]
+        unique_kwargs = {kwargs[primary_key.key]: kwargs for kwargs in list_kwargs}
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+        for kwargs in unique_kwargs.values():
+            changed_columns = tuple(sorted(key for key in kwargs if key != primary_key.key))
+            if len(changed_columns) > 0:
+                groups[changed_columns].append(kwargs)
+
+        statements = list()
+        for changed_columns, group in groups.items():
+            keys = (primary_key.key, *changed_columns)
+            chunk_size = BULK_PARAMETERS_LIMIT // len(keys)
+            for i in range(0, len(group), chunk_size):
+                # Typed columns make psycopg cast the bound parameters, otherwise
+                # VALUES would guess their types.
+                new_values = values(
+                    *[column(key, self.model.__table__.c[key].type) for key in keys],
+                    name='new_values',
+                ).data([
+                    tuple(kwargs[key] for key in keys)
+                    for kwargs in group[i:i + chunk_size]
+                ])
+                statement = (
+                    update(self.model).
+                    where(primary_key == new_values.c[primary_key.key]).
+                    values({key: new_values.c[key] for key in changed_columns}).
+                    returning(*self.model.__table__.columns).
+                    execution_options(synchronize_session=False)
+                )
+                statements.append(statement)
+        return statements
+
 
 class DeleteManager(AlterManager):
 
@@ -113,6 +304,28 @@ class DeleteManager(AlterManager):
         )
         return statement
 
+    def bulk_delete(self, primary_keys: Sequence[Any]) -> ReturningDelete:
+        """
+        Delete rows by primary key, keys are passed as a single array parameter
+        of `= ANY(...)`, so statement is the same for any amount of keys.
+
+        Statement returns columns of deleted rows, missing rows aren't returned.
+        """
+
+        primary_key = self.model.__table__.primary_key.columns[0]
+        keys = bindparam(
+            'primary_keys',
+            value=list(dict.fromkeys(primary_keys)),
+            type_=postgresql.ARRAY(primary_key.type),
+        )
+        statement = (
+            delete(self.model).
+            where(primary_key == any_(keys)).
+            returning(*self.model.__table__.columns).
+            execution_options(synchronize_session=False)
+        )
+        return statement
+
 
 AllStatements = TypeVar(
     'AllStatements',
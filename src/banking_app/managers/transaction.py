@@ -0,0 +1,96 @@
+from typing import Any
+from typing import Iterable
+
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy import Select
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql.dml import ReturningInsert
+
+from src.banking_app.conf import NotSpecifiedParam
+from src.banking_app.managers.base import SeCrUpManager
+from src.banking_app.models.card import Card
+from src.banking_app.models.transaction import Transaction
+from src.banking_app.utils.pagination import KeysetCursor
+
+
+# 5 bound parameters per row, keeps each INSERT far below the 65535
+# parameters limit of the PostgreSQL protocol.
+BATCH_CHUNK_SIZE = 1000
+
+
+class TransactionManager(SeCrUpManager):
+    model: type[Transaction] = Transaction
+
+    def bulk_create_skip_duplicates(
+            self,
+            list_kwargs: list[dict[str, Any]],
+    ) -> ReturningInsert:
+        """
+        Multi-row insert which silently skips rows with an `idempotency_key`
+        already stored in the DB, returns trans_id of really inserted rows only.
+        """
+
+        statement = (
+            insert(self.model).
+            values(list_kwargs).
+            on_conflict_do_nothing(index_elements=[self.model.idempotency_key]).
+            returning(self.model.trans_id)
+        )
+        return statement
+
+    def card_history(
+            self,
+            card_number: str,
+            *,
+            limit: int,
+            date_from: datetime = NotSpecifiedParam,                            # type: ignore
+            date_to: datetime = NotSpecifiedParam,                              # type: ignore
+            after: KeysetCursor | None = None,
+    ) -> Select:
+        """
+        Select page of card transactions from newest to oldest, which is served
+        by the (card_number, trans_datetime, trans_id) index only. Selects one
+        row more than `limit` to know if the next page exists.
+
+        Relations are not loaded, so rows of other cards are never touched.
+        """
+
+        statement = (
+            self.filter(
+                card_number=card_number,
+                trans_datetime__ge=date_from,
+                trans_datetime__lt=date_to,
+            ).
+            options(raiseload('*')).
+            order_by(self.model.trans_datetime.desc()).
+            order_by(self.model.trans_id.desc()).
+            limit(limit + 1)
+        )
+        if after is not None:
+            key = tuple_(self.model.trans_datetime, self.model.trans_id)
+            statement = statement.where(key < tuple_(*after))
+        return statement
+
+    def existing_card_numbers(self, card_numbers: Iterable[str]) -> Select:
+        """Select those of the passed card numbers which exist in the DB."""
+
+        statement = (
+            select(Card.card_number).
+            where(Card.card_number.in_(set(card_numbers)))
+        )
+        return statement
+
+    @staticmethod
+    def split_into_chunks(
+            list_kwargs: list[dict[str, Any]],
+            chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> list[list[dict[str, Any]]]:
+        """Split list of rows into the chunks with at most `chunk_size` rows."""
+        return [
+            list_kwargs[i:i + chunk_size]
+            for i in range(0, len(list_kwargs), chunk_size)
+        ]
@@ -0,0 +1,172 @@
+from datetime import date
+
+from sqlalchemy import any_
+from sqlalchemy import bindparam
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import Select
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.types import Date
+from sqlalchemy.types import Integer
+
+from src.banking_app.conf import NotSpecifiedParam
+from src.banking_app.managers.base import SelectManager
+from src.banking_app.models.card import Card
+from src.banking_app.models.rollup_watermark import RollupWatermark
+from src.banking_app.models.transaction import Transaction
+from src.banking_app.models.transaction_daily import TransactionDaily
+
+
+ROLLUP_NAME = 'transaction_daily'
+
+# Key of the PostgreSQL advisory lock which serializes the catch-up job
+# (exclusive) with the incremental updates made on ingestion (shared).
+ROLLUP_LOCK_KEY = 280001
+
+_trans_date = cast(Transaction.trans_datetime, Date)
+
+
+class TransactionDailyManager(SelectManager):
+    model: type[TransactionDaily] = TransactionDaily
+
+    def card_daily(
+            self,
+            card_number: str,
+            *,
+            date_from: date = NotSpecifiedParam,                                # type: ignore
+            date_to: date = NotSpecifiedParam,                                  # type: ignore
+    ) -> Select:
+        statement = (
+            self.filter(
+                card_number=card_number,
+                trans_date__ge=date_from,
+                trans_date__le=date_to,
+            ).
+            order_by(self.model.trans_date.asc())
+        )
+        return statement
+
+    def client_daily(
+            self,
+            client_id: int,
+            *,
+            date_from: date = NotSpecifiedParam,                                # type: ignore
+            date_to: date = NotSpecifiedParam,                                  # type: ignore
+    ) -> Select:
+        """Select daily totals of all client cards."""
+
+        statement = (
+            self.filter(
+                client_id=client_id,
+                trans_date__ge=date_from,
+                trans_date__le=date_to,
+            ).
+            with_only_columns(
+                self.model.trans_date,
+                func.sum(self.model.trans_count).label('trans_count'),
+                func.sum(self.model.trans_amount_sum).label('trans_amount_sum'),
+            ).
+            group_by(self.model.trans_date).
+            order_by(self.model.trans_date.asc())
+        )
+        return statement
+
+    def increment(self, trans_ids: list[int]) -> Insert:
+        """
+        Add the transactions with passed ids to the rollup, must be executed in
+        the same DB transaction in which these transactions are inserted and
+        after `lock_for_increment`.
+        """
+
+        ids = bindparam('trans_ids', value=trans_ids, type_=ARRAY(Integer))
+        aggregated = self._aggregate(Transaction.trans_id == any_(ids))
+        statement = self._upsert(aggregated)
+        statement = statement.on_conflict_do_update(
+            index_elements=[self.model.card_number, self.model.trans_date],
+            set_={
+                'trans_count': self.model.trans_count + statement.excluded.trans_count,
+                'trans_amount_sum': self.model.trans_amount_sum + statement.excluded.trans_amount_sum,
+            },
+        )
+        return statement
+
+    def recompute(self, after_trans_id: int, till_trans_id: int) -> Insert:
+        """
+        Recompute from scratch the (card, day) rows touched by transactions with
+        `after_trans_id < trans_id <= till_trans_id`. Overwrites the rollup,
+        so applying it more than once is harmless.
+        """
+
+        touched = (
+            select(Transaction.card_number, _trans_date).
+            where(Transaction.trans_id > after_trans_id).
+            where(Transaction.trans_id <= till_trans_id)
+        )
+        aggregated = self._aggregate(
+            tuple_(Transaction.card_number, _trans_date).in_(touched)
+        )
+        statement = self._upsert(aggregated)
+        statement = statement.on_conflict_do_update(
+            index_elements=[self.model.card_number, self.model.trans_date],
+            set_={
+                'trans_count': statement.excluded.trans_count,
+                'trans_amount_sum': statement.excluded.trans_amount_sum,
+            },
+        )
+        return statement
+
+    def lock_for_increment(self) -> Select:
+        return select(func.pg_advisory_xact_lock_shared(ROLLUP_LOCK_KEY))
+
+    def lock_for_catch_up(self) -> Select:
+        return select(func.pg_advisory_xact_lock(ROLLUP_LOCK_KEY))
+
+    def watermark(self) -> Select:
+        statement = (
+            select(RollupWatermark.last_trans_id).
+            where(RollupWatermark.rollup_name == ROLLUP_NAME)
+        )
+        return statement
+
+    def move_watermark(self, last_trans_id: int) -> Insert:
+        statement = insert(RollupWatermark).values(
+            rollup_name=ROLLUP_NAME,
+            last_trans_id=last_trans_id,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[RollupWatermark.rollup_name],
+            set_={'last_trans_id': statement.excluded.last_trans_id},
+        )
+        return statement
+
+    def last_trans_id(self) -> Select:
+        return select(func.max(Transaction.trans_id))
+
+    def _aggregate(self, *conditions) -> Select:
+        statement = (
+            select(
+                Transaction.card_number,
+                _trans_date,
+                Card.client_id,
+                func.count(),
+                func.sum(Transaction.trans_amount),
+            ).
+            join(Card, Card.card_number == Transaction.card_number).
+            where(*conditions).
+            group_by(Transaction.card_number, _trans_date, Card.client_id)
+        )
+        return statement
+
+    def _upsert(self, aggregated: Select) -> Insert:
+        columns = [
+            self.model.card_number,
+            self.model.trans_date,
+            self.model.client_id,
+            self.model.trans_count,
+            self.model.trans_amount_sum,
+        ]
+        return insert(self.model).from_select(columns, aggregated)
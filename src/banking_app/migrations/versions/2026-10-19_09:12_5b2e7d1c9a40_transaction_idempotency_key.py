@@ -0,0 +1,39 @@
+"""Transaction idempotency key
+
+Revision ID: 5b2e7d1c9a40
+Revises: 485c0e5953a7
+Create Date: 2026-10-19 09:12:05.118243
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e7d1c9a40'
+down_revision: Union[str, None] = '485c0e5953a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'transaction',
+        sa.Column('idempotency_key', sa.VARCHAR(length=64), nullable=True),
+    )
+    op.create_unique_constraint(
+        'transaction_idempotency_key_key',
+        'transaction',
+        ['idempotency_key'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'transaction_idempotency_key_key',
+        'transaction',
+        type_='unique',
+    )
+    op.drop_column('transaction', 'idempotency_key')
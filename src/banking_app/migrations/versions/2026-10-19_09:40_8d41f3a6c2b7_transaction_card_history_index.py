@@ -0,0 +1,32 @@
+"""Transaction card history index
+
+Revision ID: 8d41f3a6c2b7
+Revises: 5b2e7d1c9a40
+Create Date: 2026-10-19 09:40:51.604137
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f3a6c2b7'
+down_revision: Union[str, None] = '5b2e7d1c9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'transaction_card_number_trans_datetime_idx',
+        'transaction',
+        ['card_number', 'trans_datetime', 'trans_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'transaction_card_number_trans_datetime_idx',
+        table_name='transaction',
+    )
@@ -0,0 +1,60 @@
+"""Transaction daily rollup
+
+Revision ID: c3f9a0e2b815
+Revises: 8d41f3a6c2b7
+Create Date: 2026-10-19 10:05:32.907412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f9a0e2b815'
+down_revision: Union[str, None] = '8d41f3a6c2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'transaction_daily',
+        sa.Column('card_number', sa.VARCHAR(length=16), nullable=False),
+        sa.Column('trans_date', sa.DATE(), nullable=False),
+        sa.Column('trans_count', sa.INTEGER(), nullable=False),
+        sa.Column('trans_amount_sum', sa.NUMERIC(precision=14, scale=2), nullable=False),
+        sa.Column('client_id', sa.INTEGER(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['card_number'], ['card.card_number'],
+            name='transaction_daily_card_number_fkey',
+            ondelete='CASCADE',
+        ),
+        sa.ForeignKeyConstraint(
+            ['client_id'], ['client.client_id'],
+            name='transaction_daily_client_id_fkey',
+            ondelete='CASCADE',
+        ),
+        sa.PrimaryKeyConstraint('card_number', 'trans_date', name='transaction_daily_pkey'),
+    )
+    op.create_index(
+        'transaction_daily_client_id_trans_date_idx',
+        'transaction_daily',
+        ['client_id', 'trans_date'],
+    )
+    op.create_table(
+        'rollup_watermark',
+        sa.Column('rollup_name', sa.VARCHAR(length=100), nullable=False),
+        sa.Column('last_trans_id', sa.INTEGER(), nullable=False),
+        sa.PrimaryKeyConstraint('rollup_name', name='rollup_watermark_pkey'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rollup_watermark')
+    op.drop_index(
+        'transaction_daily_client_id_trans_date_idx',
+        table_name='transaction_daily',
+    )
+    op.drop_table('transaction_daily')
@@ -0,0 +1,32 @@
+"""Balance history index
+
+Revision ID: e71b4c8f0d29
+Revises: c3f9a0e2b815
+Create Date: 2026-10-19 10:31:14.552019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e71b4c8f0d29'
+down_revision: Union[str, None] = 'c3f9a0e2b815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'balance_client_id_processed_datetime_idx',
+        'balance',
+        ['client_id', 'processed_datetime'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'balance_client_id_processed_datetime_idx',
+        table_name='balance',
+    )
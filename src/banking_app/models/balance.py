@@ -1,4 +1,5 @@
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
@@ -16,6 +17,13 @@ if TYPE_CHECKING:
 
 class Balance(Base):
     __tablename__ = 'balance'
+    __table_args__ = (
+        Index(
+            'balance_client_id_processed_datetime_idx',
+            'client_id',
+            'processed_datetime',
+        ),
+    )
     repr_fields = ('row_id', 'actual_flag', 'client_id')
 
     row_id: Mapped[int_pk]
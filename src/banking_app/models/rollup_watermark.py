@@ -0,0 +1,15 @@
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from src.banking_app.models.base import Base
+from src.banking_app.models.base import str_100
+
+
+class RollupWatermark(Base):
+    """The last `trans_id` which is already aggregated into the rollup."""
+
+    __tablename__ = 'rollup_watermark'
+    repr_fields = ('rollup_name', 'last_trans_id')
+
+    rollup_name: Mapped[str_100] = mapped_column(primary_key=True)
+    last_trans_id: Mapped[int] = mapped_column(default=0)
@@ -1,9 +1,11 @@
 from datetime import datetime
 
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import String
 
 from typing import TYPE_CHECKING
 
@@ -17,12 +19,24 @@ if TYPE_CHECKING:
 
 class Transaction(Base):
     __tablename__ = 'transaction'
+    __table_args__ = (
+        Index(
+            'transaction_card_number_trans_datetime_idx',
+            'card_number',
+            'trans_datetime',
+            'trans_id',
+        ),
+    )
     repr_fields = ('trans_id', 'trans_amount')
 
     trans_id: Mapped[int_pk]
     trans_amount: Mapped[decimal_8_2]
     trans_datetime: Mapped[datetime]
     processed_datetime: Mapped[datetime]
+    idempotency_key: Mapped[str | None] = mapped_column(
+        String(64),
+        unique=True,
+    )
 
     card_number: Mapped[str] = mapped_column(
         ForeignKey('card.card_number', ondelete='CASCADE')
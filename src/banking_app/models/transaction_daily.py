@@ -0,0 +1,41 @@
+from datetime import date
+
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.types import DECIMAL
+from sqlalchemy.types import String
+
+from src.banking_app.models.base import Base
+
+
+class TransactionDaily(Base):
+    """Daily rollup of card transactions, one row per card and day."""
+
+    __tablename__ = 'transaction_daily'
+    __table_args__ = (
+        Index(
+            'transaction_daily_client_id_trans_date_idx',
+            'client_id',
+            'trans_date',
+        ),
+    )
+    repr_fields = ('card_number', 'trans_date', 'trans_count')
+
+    card_number: Mapped[str] = mapped_column(
+        String(16),
+        ForeignKey('card.card_number', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    trans_date: Mapped[date] = mapped_column(primary_key=True)
+    trans_count: Mapped[int]
+    trans_amount_sum: Mapped[Decimal] = mapped_column(
+        DECIMAL(precision=14, scale=2),
+    )
+
+    client_id: Mapped[int] = mapped_column(
+        ForeignKey('client.client_id', ondelete='CASCADE'),
+    )
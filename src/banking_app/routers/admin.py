@@ -0,0 +1,40 @@
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Header
+from fastapi import HTTPException
+from fastapi import status
+
+from src.banking_app.conf import settings
+from src.banking_app.routers.base import DeferredTypeAdapter
+from src.banking_app.schemas import SlowQueryRetrieve
+from src.banking_app.utils.slow_queries import slow_query_recorder
+
+
+def verify_admin_token(x_admin_token: str | None = Header(None)) -> None:
+    if not settings.is_admin_token(x_admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+
+router = APIRouter(
+    prefix='/admin',
+    tags=['Admin'],
+    dependencies=[Depends(verify_admin_token)],
+)
+RetrieveSlowQueries = DeferredTypeAdapter(list[SlowQueryRetrieve]).validate_python
+
+
+@router.get(
+    path='/slow-queries',
+    status_code=status.HTTP_200_OK,
+    response_model=list[SlowQueryRetrieve],
+)
+def get_slow_queries():
+    return RetrieveSlowQueries(slow_query_recorder.get_records())
+
+
+@router.delete(
+    path='/slow-queries',
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def clear_slow_queries():
+    slow_query_recorder.clear()
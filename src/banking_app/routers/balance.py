@@ -1,24 +1,34 @@
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Query
 from fastapi import status
 
-from pydantic import TypeAdapter
-
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.session import Session
 
 from typing import TypeAlias
 from typing import Sequence
 
+from src.banking_app.conf import NotSpecifiedParam
 from src.banking_app.connection import activate_session
 from src.banking_app.managers.balance import BalanceManager
 from src.banking_app.models.balance import Balance
+from src.banking_app.routers.base import DeferredTypeAdapter
+from src.banking_app.routers.base import LIST_STATEMENT_TIMEOUT_MS
+from src.banking_app.routers.base import get_bulk_row_error
+from src.banking_app.routers.base import get_stats_response
+from src.banking_app.routers.base import write_in_savepoints
+from src.banking_app.schemas import BalanceBulkCreateReport
 from src.banking_app.schemas import BalanceCreate
 from src.banking_app.schemas import BalanceRetrieve
+from src.banking_app.schemas import StatsRetrieve
+from src.banking_app.types.balance import BalanceGroupField
+from src.banking_app.types.general import AggregateFunction
 from src.banking_app.types.general import MoneyAmount
 from src.banking_app.utils.exceptions import BaseExceptionRaiser
 from src.banking_app.utils.exceptions import ErrorType
 from src.banking_app.utils.exceptions import NotFoundMessage
+from src.banking_app.utils.query_deadline import query_deadline
 
 
 manager = BalanceManager()
@@ -30,8 +40,8 @@ router = APIRouter(
 RetrieveOneModel: TypeAlias = BalanceRetrieve
 RetrieveManyModel: TypeAlias = Sequence[RetrieveOneModel]
 
-RetrieveOne = TypeAdapter(RetrieveOneModel).validate_python
-RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
+RetrieveOne = DeferredTypeAdapter(RetrieveOneModel).validate_python
+RetrieveMany = DeferredTypeAdapter(RetrieveManyModel).validate_python
 
 
 @router.get(
@@ -39,6 +49,7 @@ RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
     status_code=status.HTTP_200_OK,
     response_model=RetrieveManyModel,
 )
+@query_deadline(statement_timeout_ms=LIST_STATEMENT_TIMEOUT_MS)
 def get_balances_with_amount_between(
         min_amount: MoneyAmount,
         max_amount: MoneyAmount,
@@ -51,6 +62,33 @@ def get_balances_with_amount_between(
     return RetrieveMany(instances)
 
 
+@router.get(
+    path='/stats',
+    status_code=status.HTTP_200_OK,
+    response_model=StatsRetrieve,
+)
+def get_balances_stats(
+        function: AggregateFunction = AggregateFunction.SUM,
+        group_by: list[BalanceGroupField] = Query([]),
+        min_amount: MoneyAmount = NotSpecifiedParam,                            # type: ignore
+        max_amount: MoneyAmount = NotSpecifiedParam,                            # type: ignore
+        is_actual: bool = NotSpecifiedParam,                                    # type: ignore
+        session: Session = Depends(activate_session),
+):
+    field = 'current_amount'
+    group_by_fields = [f.value for f in group_by]
+    statement = manager.aggregate(
+        function,
+        field,
+        group_by=group_by_fields,
+        current_amount__ge=min_amount,
+        current_amount__le=max_amount,
+        actual_flag=is_actual,
+    )
+    rows = session.execute(statement).all()
+    return get_stats_response(function, field, group_by_fields, rows)
+
+
 @router.get(
     path='/list',
     status_code=status.HTTP_200_OK,
@@ -94,6 +132,46 @@ def add_list_of_balances(
         ).raise_exception()
 
 
+@router.post(
+    path='/list-partial',
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_model=BalanceBulkCreateReport,
+)
+def add_list_of_balances_partially(
+        balances_list: list[BalanceCreate],
+        session: Session = Depends(activate_session),
+):
+    """
+    Create balances, rows which can't be created are reported in `failed`
+    instead of rolling back the whole list.
+    """
+
+    list_kwargs = [balance.model_dump() for balance in balances_list]
+    balances, errors = write_in_savepoints(
+        session,
+        list_kwargs,
+        lambda chunk: session.scalars(manager.bulk_create(chunk)).unique().all(),
+    )
+    failed = list()
+    for index, error in errors.items():
+        if 'client_id' not in error._message():
+            raise error
+        raiser = BaseExceptionRaiser(
+            model=Balance,
+            error_type=ErrorType.UNIQUE_VIOLATION_400,
+            kwargs=manager.parse_integrity_error(error),
+        )
+        failed.append(get_bulk_row_error(index, raiser))
+
+    clients = set(balance.client for balance in balances)
+    for client in clients:
+        # Collection was loaded by the first chunk of the client, later chunks didn't update it.
+        session.refresh(client, ['balances'])
+        client.actualize_balance()
+    session.commit()
+    return BalanceBulkCreateReport(received=len(balances_list), created=balances, failed=failed)
+
+
 @router.post(
     path='/',
     status_code=status.HTTP_201_CREATED,
@@ -106,12 +184,11 @@ def add_balance(
         balance_data: BalanceCreate,
         session: Session = Depends(activate_session),
 ):
-    statement = manager.create(**balance_data.model_dump())
+    statement = manager.create_actual(**balance_data.model_dump())
     try:
-        instance: Balance = session.scalar(statement)
-        instance.client.actualize_balance()
+        row = session.execute(statement).one()
         session.commit()
-        return RetrieveOne(instance)
+        return RetrieveOne(manager.parse_actual(row))
     except IntegrityError as error:
         session.rollback()
         if 'client_id' not in error._message():
@@ -0,0 +1,150 @@
+from fastapi.routing import APIRoute
+
+from pydantic import TypeAdapter
+
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.session import Session
+
+from starlette.routing import Match
+from starlette.types import Scope
+
+from threading import Lock
+
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Sequence
+
+from src.banking_app.schemas import StatsRetrieve
+from src.banking_app.types.general import AggregateFunction
+from src.banking_app.utils.exceptions import BaseExceptionRaiser
+
+
+# Lists read whole tables, don't let them hold connections for minutes.
+LIST_STATEMENT_TIMEOUT_MS = 10_000
+# Updates of a single row fail fast instead of queueing behind a long lock.
+WRITE_LOCK_TIMEOUT_MS = 2_000
+
+# Rows per SAVEPOINT of partial bulk writes, a failing chunk is bisected
+# in about log2 of it extra statements.
+SAVEPOINT_CHUNK_SIZE = 500
+
+# Scope key of the route matched by middlewares, which run before routers.
+ROUTE_SCOPE_KEY = 'banking_app.api_route'
+
+
+class DeferredTypeAdapter:
+    """
+    TypeAdapter which is built on the first use instead of the module import,
+    all instances are registered to be built by the warmup in one place.
+    """
+
+    instances: ClassVar[list['DeferredTypeAdapter']] = list()
+
+    def __init__(self, type_: Any):
+        self.type_ = type_
+        self._adapter: TypeAdapter | None = None
+        self._lock = Lock()
+        self.instances.append(self)
+
+    @property
+    def adapter(self) -> TypeAdapter:
+        if self._adapter is None:
+            with self._lock:
+                if self._adapter is None:
+                    self._adapter = TypeAdapter(self.type_)
+        return self._adapter
+
+    def validate_python(self, value: Any) -> Any:
+        return self.adapter.validate_python(value)
+
+
+def match_api_route(scope: Scope) -> APIRoute | None:
+    """Find API route of request in middleware, result is cached in the scope."""
+    if ROUTE_SCOPE_KEY not in scope:
+        scope[ROUTE_SCOPE_KEY] = None
+        for route in scope['app'].routes:
+            if isinstance(route, APIRoute) and route.matches(scope)[0] == Match.FULL:
+                scope[ROUTE_SCOPE_KEY] = route
+                break
+    return scope[ROUTE_SCOPE_KEY]
+
+
+def get_stats_response(
+        function: AggregateFunction,
+        field: str | None,
+        group_by: Sequence[str],
+        rows: Sequence[Row],
+) -> StatsRetrieve:
+    """Convert rows of `SelectManager.aggregate` statement into response."""
+
+    return StatsRetrieve(
+        function=function,
+        field=field,
+        rows=[
+            dict(
+                group={g: row._mapping[g] for g in group_by},
+                value=row.value,
+            )
+            for row in rows
+        ],
+    )
+
+
+def get_bulk_upsert_response(received: int, unique: int, rows: Sequence[Row]) -> dict[str, Any]:
+    """
+    Split rows of `CreateManager.bulk_upsert` statements into inserted and
+    updated. Of `received` rows `unique` ones are written, the others are
+    duplicates of them, not written unique rows are skipped on conflict.
+    """
+
+    return dict(
+        received=received,
+        inserted=[row for row in rows if row.inserted],
+        updated=[row for row in rows if not row.inserted],
+        skipped=unique - len(rows),
+        duplicates=received - unique,
+    )
+
+
+def write_in_savepoints(
+        session: Session,
+        list_kwargs: list[dict[str, Any]],
+        write: Callable[[list[dict[str, Any]]], Sequence[Any]],
+        chunk_size: int = SAVEPOINT_CHUNK_SIZE,
+) -> tuple[list[Any], dict[int, IntegrityError]]:
+    """
+    Pass rows to `write` chunk by chunk, each chunk under its own SAVEPOINT.
+    Chunk violating a constraint is rolled back and bisected until failing
+    rows are isolated, so the rest of rows is still written. Transaction
+    isn't committed.
+
+    Return results of `write` and errors of failed rows by their index.
+    """
+
+    written: list[Any] = list()
+    failed: dict[int, IntegrityError] = dict()
+    # Stack of (index of the first row, rows), popped in the order of rows.
+    chunks = [
+        (i, list_kwargs[i:i + chunk_size])
+        for i in reversed(range(0, len(list_kwargs), chunk_size))
+    ]
+    while len(chunks) > 0:
+        start, rows = chunks.pop()
+        try:
+            with session.begin_nested():
+                written.extend(write(rows))
+        except IntegrityError as error:
+            if len(rows) == 1:
+                failed[start] = error
+                continue
+            middle = len(rows) // 2
+            chunks.append((start + middle, rows[middle:]))
+            chunks.append((start, rows[:middle]))
+    return written, failed
+
+
+def get_bulk_row_error(index: int, raiser: BaseExceptionRaiser) -> dict[str, Any]:
+    """Report failed row of partial bulk write as its own endpoint would respond."""
+    return dict(index=index, status_code=raiser.status_code, detail=raiser.detail)
@@ -1,21 +1,37 @@
+from datetime import date
+from datetime import datetime
+
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import Query
 from fastapi import status
 
-from pydantic import TypeAdapter
-
 from sqlalchemy import select
 from sqlalchemy.orm.session import Session
 
 from typing import TypeAlias
 from typing import Sequence
 
+from src.banking_app.conf import NotSpecifiedParam
 from src.banking_app.connection import activate_session
+from src.banking_app.managers.transaction import TransactionManager
+from src.banking_app.managers.transaction_daily import TransactionDailyManager
 from src.banking_app.models.card import Card
+from src.banking_app.models.transaction import Transaction
+from src.banking_app.routers.base import DeferredTypeAdapter
 from src.banking_app.schemas import CardCreate
 from src.banking_app.schemas import CardRetrieve
+from src.banking_app.schemas import TransactionDailyRetrieve
+from src.banking_app.schemas import TransactionPage
+from src.banking_app.utils.exceptions import BaseExceptionRaiser
+from src.banking_app.utils.exceptions import ErrorType
+from src.banking_app.utils.exceptions import InvalidCursorMessage
+from src.banking_app.utils.exceptions import NotFoundMessage
+from src.banking_app.utils.pagination import KeysetCursor
 
 
+transaction_manager = TransactionManager()
+daily_manager = TransactionDailyManager()
 router = APIRouter(
     prefix='/cards',
     tags=['Cards of client'],
@@ -24,8 +40,10 @@ router = APIRouter(
 RetrieveOneModel: TypeAlias = CardRetrieve
 RetrieveManyModel: TypeAlias = Sequence[RetrieveOneModel]
 
-RetrieveOne = TypeAdapter(RetrieveOneModel).validate_python
-RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
+RetrieveOne = DeferredTypeAdapter(RetrieveOneModel).validate_python
+RetrieveMany = DeferredTypeAdapter(RetrieveManyModel).validate_python
+RetrieveTransactionPage = DeferredTypeAdapter(TransactionPage).validate_python
+RetrieveDaily = DeferredTypeAdapter(Sequence[TransactionDailyRetrieve]).validate_python
 
 
 @router.get(
@@ -52,3 +70,78 @@ def add_card(
     session.add(instance)
     session.commit()
     return RetrieveOne(instance)
+
+
+@router.get(
+    path='/{card_number}/transactions',
+    status_code=status.HTTP_200_OK,
+    response_model=TransactionPage,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {'model': InvalidCursorMessage},
+        status.HTTP_404_NOT_FOUND: {'model': NotFoundMessage},
+    },
+)
+def get_card_transactions(
+        card_number: str,
+        date_from: datetime = Query(NotSpecifiedParam, alias='from'),          # type: ignore
+        date_to: datetime = Query(NotSpecifiedParam, alias='to'),              # type: ignore
+        cursor: str | None = None,
+        limit: int = Query(100, gt=0, le=1000),
+        session: Session = Depends(activate_session),
+):
+    after = None
+    if cursor is not None:
+        try:
+            after = KeysetCursor.decode(cursor)
+        except ValueError:
+            BaseExceptionRaiser(
+                model=Transaction,
+                error_type=ErrorType.INVALID_CURSOR_400,
+                kwargs=dict(cursor=cursor),
+            ).raise_exception()
+
+    statement = transaction_manager.card_history(
+        card_number,
+        limit=limit,
+        date_from=date_from,
+        date_to=date_to,
+        after=after,
+    )
+    instances: Sequence[Transaction] = session.scalars(statement).all()
+
+    # Empty first page is the only case when it's unknown if card exists.
+    if len(instances) == 0 and after is None:
+        statement = transaction_manager.existing_card_numbers([card_number])
+        if session.scalar(statement) is None:
+            BaseExceptionRaiser(
+                model=Card,
+                error_type=ErrorType.NOT_FOUND_404,
+                kwargs=dict(card_number=card_number),
+            ).raise_exception()
+
+    next_cursor = None
+    if len(instances) > limit:
+        instances = instances[:limit]
+        last = instances[-1]
+        next_cursor = KeysetCursor(last.trans_datetime, last.trans_id).encode()
+    return RetrieveTransactionPage(dict(items=instances, next_cursor=next_cursor))
+
+
+@router.get(
+    path='/{card_number}/daily',
+    status_code=status.HTTP_200_OK,
+    response_model=Sequence[TransactionDailyRetrieve],
+)
+def get_card_daily_transactions(
+        card_number: str,
+        date_from: date = Query(NotSpecifiedParam, alias='from'),              # type: ignore
+        date_to: date = Query(NotSpecifiedParam, alias='to'),                  # type: ignore
+        session: Session = Depends(activate_session),
+):
+    statement = daily_manager.card_daily(
+        card_number,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    instances = session.scalars(statement).all()
+    return RetrieveDaily(instances)
@@ -1,8 +1,12 @@
+from datetime import date
+from datetime import datetime
+
 from fastapi import APIRouter
+from fastapi import Body
 from fastapi import Depends
+from fastapi import Query
 from fastapi import status
 
-from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.session import Session
 
@@ -11,21 +15,44 @@ from typing import TypeAlias
 
 from src.banking_app.conf import NotSpecifiedParam
 from src.banking_app.connection import activate_session
+from src.banking_app.managers.balance import BalanceManager
 from src.banking_app.managers.client import ClientManager
+from src.banking_app.managers.transaction_daily import TransactionDailyManager
 from src.banking_app.models.client import Client
 from src.banking_app.models.status import Status
+from src.banking_app.routers.base import DeferredTypeAdapter
+from src.banking_app.routers.base import LIST_STATEMENT_TIMEOUT_MS
+from src.banking_app.routers.base import WRITE_LOCK_TIMEOUT_MS
+from src.banking_app.routers.base import get_bulk_upsert_response
+from src.banking_app.routers.base import get_stats_response
+from src.banking_app.schemas import BalanceHistory
+from src.banking_app.schemas import BaseClientModel
+from src.banking_app.schemas import ClientBulkPartialUpdate
+from src.banking_app.schemas import ClientBulkUpsertResult
 from src.banking_app.schemas import ClientCreate
 from src.banking_app.schemas import ClientFullUpdate
 from src.banking_app.schemas import ClientPartialUpdate
 from src.banking_app.schemas import ClientRetrieve
+from src.banking_app.schemas import ClientUpsert
+from src.banking_app.schemas import StatsRetrieve
+from src.banking_app.schemas import TransactionDailyRetrieve
+from src.banking_app.types.balance import TimeBucket
+from src.banking_app.types.client import ClientGroupField
 from src.banking_app.types.client import SexEnum
+from src.banking_app.types.general import AggregateFunction
+from src.banking_app.types.general import ConflictAction
 from src.banking_app.utils.exceptions import BaseExceptionRaiser
 from src.banking_app.utils.exceptions import EmptyBodyOnPatchMessage
 from src.banking_app.utils.exceptions import ErrorType
 from src.banking_app.utils.exceptions import NotFoundMessage
+from src.banking_app.utils.negative_cache import not_found_cache
+from src.banking_app.utils.query_deadline import query_deadline
+from src.banking_app.utils.single_flight import single_flight
 
 
 manager = ClientManager()
+balance_manager = BalanceManager()
+daily_manager = TransactionDailyManager()
 router = APIRouter(
     prefix='/clients',
     tags=['Client'],
@@ -34,8 +61,9 @@ router = APIRouter(
 RetrieveOneModel: TypeAlias = ClientRetrieve
 RetrieveManyModel: TypeAlias = Sequence[RetrieveOneModel]
 
-RetrieveOne = TypeAdapter(RetrieveOneModel).validate_python
-RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
+RetrieveOne = DeferredTypeAdapter(RetrieveOneModel).validate_python
+RetrieveMany = DeferredTypeAdapter(RetrieveManyModel).validate_python
+RetrieveDaily = DeferredTypeAdapter(Sequence[TransactionDailyRetrieve]).validate_python
 
 
 @router.get(
@@ -43,6 +71,7 @@ RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
     status_code=status.HTTP_200_OK,
     response_model=RetrieveManyModel,
 )
+@query_deadline(statement_timeout_ms=LIST_STATEMENT_TIMEOUT_MS)
 def get_clients_filtered_by(
         status_code: int = NotSpecifiedParam,                                   # type: ignore
         phone_number: str = NotSpecifiedParam,                                  # type: ignore
@@ -60,11 +89,42 @@ def get_clients_filtered_by(
     return RetrieveMany(instances)
 
 
+@router.get(
+    path='/stats',
+    status_code=status.HTTP_200_OK,
+    response_model=StatsRetrieve,
+)
+def get_clients_count(
+        group_by: list[ClientGroupField] = Query([]),
+        status_code: int = NotSpecifiedParam,                                   # type: ignore
+        phone_number: str = NotSpecifiedParam,                                  # type: ignore
+        has_vip_status: bool = NotSpecifiedParam,                               # type: ignore
+        sex: SexEnum = NotSpecifiedParam,                                       # type: ignore
+        session: Session = Depends(activate_session),
+):
+    group_by_fields = [field.value for field in group_by]
+    statement = manager.count(
+        group_by=group_by_fields,
+        status=status_code,
+        phone=phone_number,
+        VIP_flag=has_vip_status,
+        sex=sex,
+    )
+    rows = session.execute(statement).all()
+    return get_stats_response(
+        AggregateFunction.COUNT,
+        None,
+        group_by_fields,
+        rows,
+    )
+
+
 @router.get(
     path='/list',
     status_code=status.HTTP_200_OK,
     response_model=RetrieveManyModel,
 )
+@query_deadline(statement_timeout_ms=LIST_STATEMENT_TIMEOUT_MS)
 def get_all_clients(session: Session = Depends(activate_session)):
     statement = manager.filter()
     instances: Sequence[Client] = session.scalars(statement).unique().all()
@@ -84,9 +144,100 @@ def add_clients(
     statement = manager.bulk_create(list_kwargs)
     instances: Sequence[Client] = session.scalars(statement).unique().all()
     session.commit()
+    not_found_cache.discard((Client.__name__, instance.client_id) for instance in instances)
     return RetrieveMany(instances)
 
 
+@router.put(
+    path='/list',
+    status_code=status.HTTP_200_OK,
+    response_model=ClientBulkUpsertResult,
+    responses={
+        status.HTTP_404_NOT_FOUND: {'model': NotFoundMessage},
+    },
+)
+def upsert_clients(
+        clients_list: list[ClientUpsert],
+        on_conflict: ConflictAction = ConflictAction.UPDATE,
+        session: Session = Depends(activate_session),
+):
+    """
+    Create clients with passed `client_id`, existing clients are updated or
+    skipped by `on_conflict`.
+    """
+
+    list_kwargs = manager.unique_rows([data.model_dump() for data in clients_list])
+    update_columns = None if on_conflict == ConflictAction.UPDATE else []
+    statements = manager.bulk_upsert(list_kwargs, update_columns=update_columns)
+    try:
+        rows = [row for statement in statements for row in session.execute(statement).all()]
+    except IntegrityError as error:
+        session.rollback()
+        if 'status' not in error._message():
+            raise
+        BaseExceptionRaiser(
+            model=Status,
+            error_type=ErrorType.NOT_FOUND_404,
+            kwargs=manager.parse_integrity_error(error),
+        ).raise_exception()
+
+    inserted_ids = [row.client_id for row in rows if row.inserted]
+    if len(inserted_ids) > 0:
+        session.execute(manager.advance_sequence(max(inserted_ids)))
+    session.commit()
+    not_found_cache.discard((Client.__name__, client_id) for client_id in inserted_ids)
+    return get_bulk_upsert_response(len(clients_list), len(list_kwargs), rows)
+
+
+@router.patch(
+    path='/list',
+    status_code=status.HTTP_200_OK,
+    response_model=Sequence[BaseClientModel],
+    responses={
+        status.HTTP_404_NOT_FOUND: {'model': NotFoundMessage},
+    },
+)
+@query_deadline(lock_timeout_ms=WRITE_LOCK_TIMEOUT_MS)
+def partial_update_clients(
+        clients_list: list[ClientBulkPartialUpdate],
+        session: Session = Depends(activate_session),
+):
+    """Update clients by `client_id`, missing clients aren't returned."""
+
+    list_kwargs = [data.model_dump(exclude_none=True) for data in clients_list]
+    try:
+        rows = [row for statement in manager.bulk_update(list_kwargs) for row in session.execute(statement)]
+    except IntegrityError as error:
+        session.rollback()
+        if 'status' not in error._message():
+            raise
+        BaseExceptionRaiser(
+            model=Status,
+            error_type=ErrorType.NOT_FOUND_404,
+            kwargs=manager.parse_integrity_error(error),
+        ).raise_exception()
+
+    session.commit()
+    return rows
+
+
+@router.delete(
+    path='/list',
+    status_code=status.HTTP_200_OK,
+    response_model=Sequence[BaseClientModel],
+)
+@query_deadline(lock_timeout_ms=WRITE_LOCK_TIMEOUT_MS)
+def delete_clients(
+        client_ids: list[int] = Body(),
+        session: Session = Depends(activate_session),
+):
+    """Delete clients by `client_id`, missing clients aren't returned."""
+
+    rows = session.execute(manager.bulk_delete(client_ids)).all()
+    session.commit()
+    return rows
+
+
 @router.post(
     path='/',
     status_code=status.HTTP_201_CREATED,
@@ -100,6 +251,7 @@ def add_client(
     instance = session.scalar(statement)
     if isinstance(instance, Client):
         session.commit()
+        not_found_cache.discard([(Client.__name__, instance.client_id)])
         return RetrieveOne(instance)
     raise ValueError(
         f'Something went wrong when try post to\n'
@@ -116,19 +268,27 @@ def add_client(
         status.HTTP_404_NOT_FOUND: {'model': NotFoundMessage},
     },
 )
+@single_flight
 def get_client_with_client_id(
         client_id: int,
         session: Session = Depends(activate_session),
 ):
+    cache_key = (Client.__name__, client_id)
+    if (response := not_found_cache.get(cache_key)) is not None:
+        return response
+    generation = not_found_cache.generation
+
     statement = manager.filter(client_id=client_id)
     instance = session.scalar(statement)
     if isinstance(instance, Client):
         return RetrieveOne(instance)
-    BaseExceptionRaiser(
+    raiser = BaseExceptionRaiser(
         model=Client,
         error_type=ErrorType.NOT_FOUND_404,
         kwargs=dict(client_id=client_id),
-    ).raise_exception()
+    )
+    not_found_cache.add(cache_key, raiser, generation)
+    raiser.raise_exception()
 
 
 @router.put(
@@ -139,6 +299,7 @@ def get_client_with_client_id(
         status.HTTP_404_NOT_FOUND: {'model': NotFoundMessage},
     },
 )
+@query_deadline(lock_timeout_ms=WRITE_LOCK_TIMEOUT_MS)
 def full_update_client_with_client_id(
     client_id: int,
     client_data: ClientFullUpdate,
@@ -180,6 +341,7 @@ def full_update_client_with_client_id(
         status.HTTP_400_BAD_REQUEST: {'model': EmptyBodyOnPatchMessage}
     },
 )
+@query_deadline(lock_timeout_ms=WRITE_LOCK_TIMEOUT_MS)
 def partial_update_client_with_client_id(
     client_id: int,
     client_data: ClientPartialUpdate,
@@ -232,6 +394,7 @@ def partial_update_client_with_client_id(
         status.HTTP_404_NOT_FOUND: {'model': NotFoundMessage},
     },
 )
+@query_deadline(lock_timeout_ms=WRITE_LOCK_TIMEOUT_MS)
 def delete_client_with_client_id(
         client_id: int,
         session: Session = Depends(activate_session),
@@ -247,3 +410,50 @@ def delete_client_with_client_id(
         error_type=ErrorType.NOT_FOUND_404,
         kwargs=dict(client_id=client_id),
     ).raise_exception()
+
+
+@router.get(
+    path='/{client_id}/daily',
+    status_code=status.HTTP_200_OK,
+    response_model=Sequence[TransactionDailyRetrieve],
+)
+def get_client_daily_transactions(
+        client_id: int,
+        date_from: date = Query(NotSpecifiedParam, alias='from'),              # type: ignore
+        date_to: date = Query(NotSpecifiedParam, alias='to'),                  # type: ignore
+        session: Session = Depends(activate_session),
+):
+    statement = daily_manager.client_daily(
+        client_id,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    rows = session.execute(statement).all()
+    return RetrieveDaily(rows)
+
+
+@router.get(
+    path='/{client_id}/balance-history',
+    status_code=status.HTTP_200_OK,
+    response_model=BalanceHistory,
+)
+def get_client_balance_history(
+        client_id: int,
+        bucket: TimeBucket = TimeBucket.DAY,
+        date_from: datetime = Query(NotSpecifiedParam, alias='from'),          # type: ignore
+        date_to: datetime = Query(NotSpecifiedParam, alias='to'),              # type: ignore
+        session: Session = Depends(activate_session),
+):
+    statement = balance_manager.history(
+        client_id,
+        bucket,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    rows = session.execute(statement).all()
+    return BalanceHistory(
+        bucket=bucket,
+        timestamps=[row.bucket_start for row in rows],
+        amounts=[row.current_amount for row in rows],
+        deltas=[row.delta for row in rows],
+    )
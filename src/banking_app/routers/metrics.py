@@ -0,0 +1,50 @@
+from fastapi import APIRouter
+from fastapi import Request
+from fastapi import status
+from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
+
+from src.banking_app.utils.metrics import metrics
+
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+router = APIRouter(
+    tags=['Monitoring'],
+)
+
+
+@router.get(
+    path='/metrics',
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+)
+def get_metrics():
+    return PlainTextResponse(
+        content=metrics.render(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
+
+
+@router.get(
+    path='/health/live',
+    status_code=status.HTTP_200_OK,
+)
+def get_liveness():
+    return dict(status='alive')
+
+
+@router.get(
+    path='/health/ready',
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {'description': 'Warmup isn\'t finished.'},
+    },
+)
+def get_readiness(request: Request):
+    if not getattr(request.app.state, 'ready', False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=dict(status='warming up'),
+        )
+    return dict(status='ready')
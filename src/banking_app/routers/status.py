@@ -1,9 +1,8 @@
 from fastapi import APIRouter
+from fastapi import Body
 from fastapi import Depends
 from fastapi import status
 
-from pydantic import TypeAdapter
-
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.session import Session
 
@@ -13,15 +12,28 @@ from typing import TypeAlias
 from src.banking_app.connection import activate_session
 from src.banking_app.managers.status import StatusManager
 from src.banking_app.models.status import Status
+from src.banking_app.routers.base import DeferredTypeAdapter
+from src.banking_app.routers.base import LIST_STATEMENT_TIMEOUT_MS
+from src.banking_app.routers.base import get_bulk_row_error
+from src.banking_app.routers.base import get_bulk_upsert_response
+from src.banking_app.routers.base import write_in_savepoints
+from src.banking_app.schemas import BaseStatusModel
+from src.banking_app.schemas import StatusBulkCreateReport
+from src.banking_app.schemas import StatusBulkPartialUpdate
+from src.banking_app.schemas import StatusBulkUpsertResult
 from src.banking_app.schemas import StatusCreate
 from src.banking_app.schemas import StatusFullUpdate
 from src.banking_app.schemas import StatusPartialUpdate
 from src.banking_app.schemas import StatusRetrieve
+from src.banking_app.types.general import ConflictAction
 from src.banking_app.utils.exceptions import BaseExceptionRaiser
 from src.banking_app.utils.exceptions import EmptyBodyOnPatchMessage
 from src.banking_app.utils.exceptions import ErrorType
 from src.banking_app.utils.exceptions import NotFoundMessage
 from src.banking_app.utils.exceptions import UniquesViolationMessage
+from src.banking_app.utils.negative_cache import not_found_cache
+from src.banking_app.utils.query_deadline import query_deadline
+from src.banking_app.utils.single_flight import single_flight
 
 
 manager = StatusManager()
@@ -33,8 +45,8 @@ router = APIRouter(
 RetrieveOneModel: TypeAlias = StatusRetrieve
 RetrieveManyModel: TypeAlias = Sequence[RetrieveOneModel]
 
-RetrieveOne = TypeAdapter(RetrieveOneModel).validate_python
-RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
+RetrieveOne = DeferredTypeAdapter(RetrieveOneModel).validate_python
+RetrieveMany = DeferredTypeAdapter(RetrieveManyModel).validate_python
 
 
 @router.get(
@@ -42,6 +54,8 @@ RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
     status_code=status.HTTP_200_OK,
     response_model=RetrieveManyModel,
 )
+@query_deadline(statement_timeout_ms=LIST_STATEMENT_TIMEOUT_MS)
+@single_flight
 def get_all_statuses(session: Session = Depends(activate_session)):
     statement = manager.filter()
     instances: Sequence[Status] = session.scalars(statement).unique().all()
@@ -65,6 +79,7 @@ def add_statuses(
         statement = manager.bulk_create(kwargs_list)
         instances: Sequence[Status] = session.scalars(statement).unique().all()
         session.commit()
+        not_found_cache.discard((Status.__name__, instance.status) for instance in instances)
         return RetrieveMany(instances)
 
     except IntegrityError as error:
@@ -78,6 +93,96 @@ def add_statuses(
         ).raise_exception()
 
 
+@router.post(
+    path='/list-partial',
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_model=StatusBulkCreateReport,
+)
+def add_statuses_partially(
+        statuses_data: list[StatusCreate],
+        session: Session = Depends(activate_session),
+):
+    """
+    Create statuses, rows which can't be created are reported in `failed`
+    instead of rolling back the whole list.
+    """
+
+    kwargs_list = [status.model_dump() for status in statuses_data]
+    instances, errors = write_in_savepoints(
+        session,
+        kwargs_list,
+        lambda chunk: session.scalars(manager.bulk_create(chunk)).unique().all(),
+    )
+    failed = list()
+    for index, error in errors.items():
+        if 'status' not in error._message():
+            raise error
+        raiser = BaseExceptionRaiser(
+            model=Status,
+            error_type=ErrorType.UNIQUE_VIOLATION_400,
+            kwargs=manager.parse_integrity_error(error),
+        )
+        failed.append(get_bulk_row_error(index, raiser))
+    session.commit()
+
+    not_found_cache.discard((Status.__name__, instance.status) for instance in instances)
+    return StatusBulkCreateReport(received=len(statuses_data), created=instances, failed=failed)
+
+
+@router.put(
+    path='/list',
+    status_code=status.HTTP_200_OK,
+    response_model=StatusBulkUpsertResult,
+)
+def upsert_statuses(
+        statuses_data: list[StatusCreate],
+        on_conflict: ConflictAction = ConflictAction.UPDATE,
+        session: Session = Depends(activate_session),
+):
+    """Create statuses, existing statuses are updated or skipped by `on_conflict`."""
+
+    kwargs_list = manager.unique_rows([status.model_dump() for status in statuses_data])
+    update_columns = None if on_conflict == ConflictAction.UPDATE else []
+    statements = manager.bulk_upsert(kwargs_list, update_columns=update_columns)
+    rows = [row for statement in statements for row in session.execute(statement).all()]
+    session.commit()
+    not_found_cache.discard((Status.__name__, row.status) for row in rows if row.inserted)
+    return get_bulk_upsert_response(len(statuses_data), len(kwargs_list), rows)
+
+
+@router.patch(
+    path='/list',
+    status_code=status.HTTP_200_OK,
+    response_model=Sequence[BaseStatusModel],
+)
+def partial_update_statuses(
+        statuses_data: list[StatusBulkPartialUpdate],
+        session: Session = Depends(activate_session),
+):
+    """Update statuses by `status`, missing statuses aren't returned."""
+
+    list_kwargs = [status.model_dump(exclude_none=True) for status in statuses_data]
+    rows = [row for statement in manager.bulk_update(list_kwargs) for row in session.execute(statement)]
+    session.commit()
+    return rows
+
+
+@router.delete(
+    path='/list',
+    status_code=status.HTTP_200_OK,
+    response_model=Sequence[BaseStatusModel],
+)
+def delete_statuses(
+        status_numbers: list[int] = Body(),
+        session: Session = Depends(activate_session),
+):
+    """Delete statuses by `status`, missing statuses aren't returned."""
+
+    rows = session.execute(manager.bulk_delete(status_numbers)).all()
+    session.commit()
+    return rows
+
+
 @router.post(
     path='/',
     status_code=status.HTTP_201_CREATED,
@@ -95,6 +200,7 @@ def add_status(
         instance = session.scalar(statement)
         if isinstance(instance, Status):
             session.commit()
+            not_found_cache.discard([(Status.__name__, instance.status)])
             return RetrieveOne(instance)
 
     except IntegrityError as error:
@@ -120,16 +226,23 @@ def get_status_with_status_number(
         status_num: int,
         session: Session = Depends(activate_session),
 ):
+    cache_key = (Status.__name__, status_num)
+    if (response := not_found_cache.get(cache_key)) is not None:
+        return response
+    generation = not_found_cache.generation
+
     statement = manager.filter(status=status_num)
     instance = session.scalar(statement)
     if isinstance(instance, Status):
         return RetrieveOne(instance)
 
-    BaseExceptionRaiser(
+    raiser = BaseExceptionRaiser(
         model=Status,
         error_type=ErrorType.NOT_FOUND_404,
         kwargs=dict(status=status_num)
-    ).raise_exception()
+    )
+    not_found_cache.add(cache_key, raiser, generation)
+    raiser.raise_exception()
 
 
 @router.put(
@@ -152,6 +265,7 @@ def full_update_status_with_status_number(
     instance = session.scalar(statement)
     if isinstance(instance, Status):
         session.commit()
+        not_found_cache.discard([(Status.__name__, instance.status)])
         return RetrieveOne(instance)
     BaseExceptionRaiser(
         model=Status,
@@ -184,6 +298,7 @@ def partial_update_status_with_status_number(
         instance = session.scalar(statement)
         if isinstance(instance, Status):
             session.commit()
+            not_found_cache.discard([(Status.__name__, instance.status)])
             return RetrieveOne(instance)
 
         BaseExceptionRaiser(
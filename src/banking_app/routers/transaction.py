@@ -2,8 +2,6 @@ from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import status
 
-from pydantic import TypeAdapter
-
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import select
 
@@ -11,11 +9,22 @@ from typing import Sequence
 from typing import TypeAlias
 
 from src.banking_app.connection import activate_session
+from src.banking_app.managers.transaction import TransactionManager
+from src.banking_app.managers.transaction_daily import TransactionDailyManager
+from src.banking_app.models.card import Card
 from src.banking_app.models.transaction import Transaction
+from src.banking_app.routers.base import DeferredTypeAdapter
+from src.banking_app.schemas import TransactionBatchCreate
+from src.banking_app.schemas import TransactionBatchResult
 from src.banking_app.schemas import TransactionCreate
 from src.banking_app.schemas import TransactionRetrieve
+from src.banking_app.utils.exceptions import BaseExceptionRaiser
+from src.banking_app.utils.exceptions import ErrorType
+from src.banking_app.utils.exceptions import NotFoundMessage
 
 
+manager = TransactionManager()
+daily_manager = TransactionDailyManager()
 router = APIRouter(
     prefix='/transactions',
     tags=['Card transactions'],
@@ -24,8 +33,8 @@ router = APIRouter(
 RetrieveOneModel: TypeAlias = TransactionRetrieve
 RetrieveManyModel: TypeAlias = Sequence[RetrieveOneModel]
 
-RetrieveOne = TypeAdapter(RetrieveOneModel).validate_python
-RetrieveMany = TypeAdapter(RetrieveManyModel).validate_python
+RetrieveOne = DeferredTypeAdapter(RetrieveOneModel).validate_python
+RetrieveMany = DeferredTypeAdapter(RetrieveManyModel).validate_python
 
 
 @router.get(
@@ -50,5 +59,50 @@ def add_transaction(
 ):
     instance = Transaction(**transaction_data.model_dump())
     session.add(instance)
+    session.flush()
+    session.execute(daily_manager.lock_for_increment())
+    session.execute(daily_manager.increment([instance.trans_id]))
     session.commit()
     return RetrieveOne(instance)
+
+
+@router.post(
+    path='/batch',
+    status_code=status.HTTP_201_CREATED,
+    response_model=TransactionBatchResult,
+    responses={
+        status.HTTP_404_NOT_FOUND: {'model': NotFoundMessage},
+    },
+)
+def add_transactions_batch(
+        transactions_list: list[TransactionBatchCreate],
+        session: Session = Depends(activate_session),
+):
+    # Repeated keys inside of the same batch are retries too.
+    unique_kwargs = {t.idempotency_key: t.model_dump() for t in transactions_list}
+    list_kwargs = list(unique_kwargs.values())
+
+    card_numbers = set(kwargs['card_number'] for kwargs in list_kwargs)
+    statement = manager.existing_card_numbers(card_numbers)
+    unexistent_cards = card_numbers - set(session.scalars(statement).all())
+    if len(unexistent_cards) > 0:
+        BaseExceptionRaiser(
+            model=Card,
+            error_type=ErrorType.NOT_FOUND_404,
+            kwargs=dict(card_number=sorted(unexistent_cards)),
+        ).raise_exception()
+
+    trans_ids: list[int] = list()
+    for chunk in manager.split_into_chunks(list_kwargs):
+        statement = manager.bulk_create_skip_duplicates(chunk)
+        trans_ids.extend(session.scalars(statement).all())
+    if len(trans_ids) > 0:
+        session.execute(daily_manager.lock_for_increment())
+        session.execute(daily_manager.increment(trans_ids))
+    session.commit()
+
+    return TransactionBatchResult(
+        received=len(transactions_list),
+        inserted=len(trans_ids),
+        duplicates=len(transactions_list) - len(trans_ids),
+    )
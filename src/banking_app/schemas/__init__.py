@@ -1,9 +1,13 @@
 from src.banking_app.schemas.base import Base
 
+from src.banking_app.schemas.bulk import BulkRowError
+
 from src.banking_app.schemas.balance import BaseBalanceModel
 from src.banking_app.schemas.balance import BalanceModelWithRelations
 from src.banking_app.schemas.balance import BalanceRetrieve
 from src.banking_app.schemas.balance import BalanceCreate
+from src.banking_app.schemas.balance import BalanceHistory
+from src.banking_app.schemas.balance import BalanceBulkCreateReport
 
 from src.banking_app.schemas.card import BaseCardModel
 from src.banking_app.schemas.card import CardModelWithRelations
@@ -16,6 +20,9 @@ from src.banking_app.schemas.client import ClientRetrieve
 from src.banking_app.schemas.client import ClientCreate
 from src.banking_app.schemas.client import ClientFullUpdate
 from src.banking_app.schemas.client import ClientPartialUpdate
+from src.banking_app.schemas.client import ClientBulkPartialUpdate
+from src.banking_app.schemas.client import ClientUpsert
+from src.banking_app.schemas.client import ClientBulkUpsertResult
 
 from src.banking_app.schemas.status import BaseStatusModel
 from src.banking_app.schemas.status import StatusModelWithRelations
@@ -23,17 +30,35 @@ from src.banking_app.schemas.status import StatusRetrieve
 from src.banking_app.schemas.status import StatusCreate
 from src.banking_app.schemas.status import StatusFullUpdate
 from src.banking_app.schemas.status import StatusPartialUpdate
+from src.banking_app.schemas.status import StatusBulkPartialUpdate
+from src.banking_app.schemas.status import StatusBulkUpsertResult
+from src.banking_app.schemas.status import StatusBulkCreateReport
 
 from src.banking_app.schemas.transaction import BaseTransactionModel
 from src.banking_app.schemas.transaction import TransactionModelWithRelations
 from src.banking_app.schemas.transaction import TransactionRetrieve
 from src.banking_app.schemas.transaction import TransactionCreate
+from src.banking_app.schemas.transaction import TransactionBatchCreate
+from src.banking_app.schemas.transaction import TransactionBatchResult
+from src.banking_app.schemas.transaction import TransactionPage
+
+from src.banking_app.schemas.stats import BaseStatsRowModel
+from src.banking_app.schemas.stats import StatsRetrieve
+
+from src.banking_app.schemas.transaction_daily import BaseTransactionDailyModel
+from src.banking_app.schemas.transaction_daily import TransactionDailyRetrieve
 
+from src.banking_app.schemas.slow_query import SlowQueryRetrieve
+
+
+BulkRowError.model_rebuild()
 
 BaseBalanceModel.model_rebuild()
 BalanceModelWithRelations.model_rebuild()
 BalanceRetrieve.model_rebuild()
 BalanceCreate.model_rebuild()
+BalanceHistory.model_rebuild()
+BalanceBulkCreateReport.model_rebuild()
 
 BaseCardModel.model_rebuild()
 CardModelWithRelations.model_rebuild()
@@ -46,6 +71,9 @@ ClientRetrieve.model_rebuild()
 ClientCreate.model_rebuild()
 ClientFullUpdate.model_rebuild()
 ClientPartialUpdate.model_rebuild()
+ClientBulkPartialUpdate.model_rebuild()
+ClientUpsert.model_rebuild()
+ClientBulkUpsertResult.model_rebuild()
 
 BaseStatusModel.model_rebuild()
 StatusModelWithRelations.model_rebuild()
@@ -53,20 +81,38 @@ StatusRetrieve.model_rebuild()
 StatusCreate.model_rebuild()
 StatusFullUpdate.model_rebuild()
 StatusPartialUpdate.model_rebuild()
+StatusBulkPartialUpdate.model_rebuild()
+StatusBulkUpsertResult.model_rebuild()
+StatusBulkCreateReport.model_rebuild()
 
 BaseTransactionModel.model_rebuild()
 TransactionModelWithRelations.model_rebuild()
 TransactionRetrieve.model_rebuild()
 TransactionCreate.model_rebuild()
+TransactionBatchCreate.model_rebuild()
+TransactionBatchResult.model_rebuild()
+TransactionPage.model_rebuild()
+
+BaseStatsRowModel.model_rebuild()
+StatsRetrieve.model_rebuild()
+
+BaseTransactionDailyModel.model_rebuild()
+TransactionDailyRetrieve.model_rebuild()
+
+SlowQueryRetrieve.model_rebuild()
 
 
 __all__ = (
     'Base',
 
+    'BulkRowError',
+
     'BaseBalanceModel',
     'BalanceModelWithRelations',
     'BalanceRetrieve',
     'BalanceCreate',
+    'BalanceHistory',
+    'BalanceBulkCreateReport',
 
     'BaseCardModel',
     'CardModelWithRelations',
@@ -79,6 +125,9 @@ __all__ = (
     'ClientCreate',
     'ClientFullUpdate',
     'ClientPartialUpdate',
+    'ClientBulkPartialUpdate',
+    'ClientUpsert',
+    'ClientBulkUpsertResult',
 
     'BaseStatusModel',
     'StatusModelWithRelations',
@@ -86,9 +135,23 @@ __all__ = (
     'StatusCreate',
     'StatusFullUpdate',
     'StatusPartialUpdate',
+    'StatusBulkPartialUpdate',
+    'StatusBulkUpsertResult',
+    'StatusBulkCreateReport',
 
     'BaseTransactionModel',
     'TransactionModelWithRelations',
     'TransactionRetrieve',
     'TransactionCreate',
+    'TransactionBatchCreate',
+    'TransactionBatchResult',
+    'TransactionPage',
+
+    'BaseStatsRowModel',
+    'StatsRetrieve',
+
+    'BaseTransactionDailyModel',
+    'TransactionDailyRetrieve',
+
+    'SlowQueryRetrieve',
 )
@@ -9,10 +9,12 @@ from typing import TYPE_CHECKING
 
 from src.banking_app.conf import settings
 from src.banking_app.schemas import Base
+from src.banking_app.types.balance import TimeBucket
 from src.banking_app.types.general import MoneyAmount
 
 if TYPE_CHECKING:
     from src.banking_app.schemas import BaseClientModel
+    from src.banking_app.schemas import BulkRowError
 
 
 _row_id = Annotated[
@@ -45,6 +47,33 @@ _client_id = Annotated[
         examples=[24],
     )
 ]
+_bucket = Annotated[
+    TimeBucket, Field(
+        examples=[TimeBucket.DAY],
+    )
+]
+_timestamps = Annotated[
+    list[datetime], Field(
+        examples=[['2024-01-01T00:00:00', '2024-01-02T00:00:00']],
+    )
+]
+_amount_of_rows = Annotated[
+    int, Field(
+        ge=0,
+        examples=[10],
+    )
+]
+_amounts = Annotated[
+    list[MoneyAmount], Field(
+        examples=[[1000.5, 900.0]],
+    )
+]
+_deltas = Annotated[
+    list[MoneyAmount | None], Field(
+        examples=[[None, -100.5]],
+        description='Change against the previous bucket, null for the first.',
+    )
+]
 
 
 class BaseBalanceModel(Base):
@@ -67,3 +96,18 @@ class BalanceCreate(BaseBalanceModel):
     row_id: _row_id = Field(default=None, exclude=True)
     actual_flag: _actual_flag = Field(default=None, exclude=True)
     processed_datetime: _processed_datetime = Field(default=None, exclude=True)
+
+
+class BalanceHistory(Base):
+    """Columnar time series, i-th items of the lists belong to one bucket."""
+
+    bucket: _bucket
+    timestamps: _timestamps
+    amounts: _amounts
+    deltas: _deltas
+
+
+class BalanceBulkCreateReport(Base):
+    received: _amount_of_rows
+    created: list[BaseBalanceModel]
+    failed: list[BulkRowError]
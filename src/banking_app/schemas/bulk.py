@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from typing import Annotated
+
+from src.banking_app.schemas import Base
+
+
+_index = Annotated[
+    int, Field(
+        ge=0,
+        examples=[3],
+        description='Position of the row in the request body.',
+    )
+]
+_status_code = Annotated[
+    int, Field(
+        examples=[400],
+    )
+]
+_detail = Annotated[
+    str, Field(
+        examples=['Status with status=100 already exists.'],
+    )
+]
+
+
+class BulkRowError(Base):
+    index: _index
+    status_code: _status_code
+    detail: _detail
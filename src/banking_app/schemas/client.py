@@ -87,6 +87,13 @@ _status_number = Annotated[
     )
 ]
 
+_amount_of_rows = Annotated[
+    int, Field(
+        ge=0,
+        examples=[10],
+    )
+]
+
 
 class BaseClientModel(Base):
     client_id: _client_id
@@ -171,3 +178,20 @@ class ClientPartialUpdate(BaseClientModel):
     reg_date: _reg_date = Field(default=None, exclude=True)
     VIP_flag: _VIP_flag = Field(default=None, exclude=True)
     status: _status_number = Field(default=None)
+
+
+class ClientBulkPartialUpdate(ClientPartialUpdate):
+    client_id: _client_id
+
+
+class ClientUpsert(BaseClientModel):
+    reg_date: _reg_date = Field(default=None, exclude=True)
+    VIP_flag: _VIP_flag = Field(default=None, exclude=True)
+
+
+class ClientBulkUpsertResult(Base):
+    received: _amount_of_rows
+    inserted: list[BaseClientModel]
+    updated: list[BaseClientModel]
+    skipped: _amount_of_rows
+    duplicates: _amount_of_rows
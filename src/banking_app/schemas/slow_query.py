@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from typing import Annotated
+from typing import Any
+
+from src.banking_app.schemas import Base
+
+
+_fingerprint = Annotated[
+    str, Field(
+        examples=['3f1c2a9e0b7d4c51'],
+        description='Hash of the normalized statement.',
+    )
+]
+_statement = Annotated[
+    str, Field(
+        examples=['SELECT client.client_id FROM client WHERE client.status = ? LIMIT ?'],
+        description='Statement with literals and parameters replaced by "?".',
+    )
+]
+_parameters_shape = Annotated[
+    dict[str, str], Field(
+        examples=[{'status_1': 'int', 'param_1': 'int'}],
+        description='Types of bound parameters, values are never recorded.',
+    )
+]
+_batch_size = Annotated[
+    int, Field(
+        examples=[1],
+        description='Amount of parameter sets, greater than 1 for executemany.',
+    )
+]
+_duration_ms = Annotated[
+    float, Field(
+        examples=[512.173],
+    )
+]
+_captured_at = Annotated[
+    datetime, Field(
+        examples=[datetime(2026, 10, 19, 12, 0, 0)],
+    )
+]
+_plan = Annotated[
+    Any, Field(
+        examples=[[{'Plan': {'Node Type': 'Seq Scan', 'Relation Name': 'client'}}]],
+        description='Output of EXPLAIN (FORMAT JSON), null if statement can\'t be explained.',
+    )
+]
+
+
+class SlowQueryRetrieve(Base):
+    fingerprint: _fingerprint
+    statement: _statement
+    parameters_shape: _parameters_shape
+    batch_size: _batch_size
+    duration_ms: _duration_ms
+    captured_at: _captured_at
+    plan: _plan = None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pydantic import Field
+
+from typing import Annotated
+from typing import Any
+
+from src.banking_app.schemas import Base
+from src.banking_app.types.general import AggregateFunction
+from src.banking_app.types.general import MoneyAmount
+
+
+_function = Annotated[
+    AggregateFunction, Field(
+        examples=[AggregateFunction.COUNT],
+    )
+]
+_field = Annotated[
+    str, Field(
+        examples=['current_amount'],
+    )
+]
+_group = Annotated[
+    dict[str, Any], Field(
+        examples=[{'status': 100, 'VIP_flag': True}],
+        description='Values of group_by fields, empty if not grouped.',
+    )
+]
+_value = Annotated[
+    int | MoneyAmount | None, Field(
+        examples=[42],
+    )
+]
+
+
+class BaseStatsRowModel(Base):
+    group: _group
+    value: _value
+
+
+class StatsRetrieve(Base):
+    function: _function
+    field: _field | None = None
+    rows: list[BaseStatsRowModel]
@@ -9,6 +9,7 @@ from src.banking_app.schemas import Base
 
 if TYPE_CHECKING:
     from src.banking_app.schemas import BaseClientModel
+    from src.banking_app.schemas import BulkRowError
 
 
 _status = Annotated[
@@ -25,6 +26,13 @@ _description = Annotated[
     )
 ]
 
+_amount_of_rows = Annotated[
+    int, Field(
+        ge=0,
+        examples=[10],
+    )
+]
+
 
 class BaseStatusModel(Base):
     status: _status
@@ -50,3 +58,21 @@ class StatusFullUpdate(BaseStatusModel):
 class StatusPartialUpdate(BaseStatusModel):
     status: _status = Field(default=None)
     description: _description = Field(default=None)
+
+
+class StatusBulkPartialUpdate(StatusPartialUpdate):
+    status: _status
+
+
+class StatusBulkUpsertResult(Base):
+    received: _amount_of_rows
+    inserted: list[BaseStatusModel]
+    updated: list[BaseStatusModel]
+    skipped: _amount_of_rows
+    duplicates: _amount_of_rows
+
+
+class StatusBulkCreateReport(Base):
+    received: _amount_of_rows
+    created: list[BaseStatusModel]
+    failed: list[BulkRowError]
@@ -30,6 +30,24 @@ _processed_datetime = Annotated[
 _card_number = Annotated[
     str, Field()
 ]
+_idempotency_key = Annotated[
+    str, Field(
+        min_length=1,
+        max_length=64,
+        examples=['a3a5c2e4-8c6e-4b2f-9d5e-1f0b7c9d2e61'],
+    )
+]
+_cursor = Annotated[
+    str, Field(
+        examples=['MjAyNC0wMS0zMVQxMjozMDowMHwxMjM0'],
+    )
+]
+_amount_of_rows = Annotated[
+    int, Field(
+        ge=0,
+        examples=[1000],
+    )
+]
 
 
 class BaseTransactionModel(Base):
@@ -38,6 +56,7 @@ class BaseTransactionModel(Base):
     trans_datetime: _trans_datetime
     processed_datetime: _processed_datetime
     card_number: _card_number
+    idempotency_key: _idempotency_key | None = None
 
 
 class TransactionModelWithRelations(BaseTransactionModel):
@@ -50,3 +69,18 @@ class TransactionRetrieve(TransactionModelWithRelations):
 
 class TransactionCreate(BaseTransactionModel):
     trans_id: _trans_id = Field(default=None, exclude=True)
+
+
+class TransactionBatchCreate(TransactionCreate):
+    idempotency_key: _idempotency_key
+
+
+class TransactionBatchResult(Base):
+    received: _amount_of_rows
+    inserted: _amount_of_rows
+    duplicates: _amount_of_rows
+
+
+class TransactionPage(Base):
+    items: list[BaseTransactionModel]
+    next_cursor: _cursor | None = None
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import date
+
+from pydantic import Field
+
+from typing import Annotated
+
+from src.banking_app.schemas import Base
+from src.banking_app.types.general import MoneyAmount
+
+
+_trans_date = Annotated[
+    date, Field(
+        examples=[date(2024, 1, 31)],
+    )
+]
+_trans_count = Annotated[
+    int, Field(
+        ge=0,
+        examples=[12],
+    )
+]
+_trans_amount_sum = Annotated[
+    MoneyAmount, Field(
+        examples=[1234.56],
+    )
+]
+
+
+class BaseTransactionDailyModel(Base):
+    trans_date: _trans_date
+    trans_count: _trans_count
+    trans_amount_sum: _trans_amount_sum
+
+
+class TransactionDailyRetrieve(BaseTransactionDailyModel):
+    ...
@@ -1,36 +1,67 @@
+import os
 import pytest
 
+from functools import partial
+
+from hashlib import sha1
+
 from sqlalchemy import create_engine
-from sqlalchemy_utils import create_database  # type: ignore
-from sqlalchemy_utils import database_exists
-from sqlalchemy_utils import drop_database
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import make_url
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm.session import Session
 from sqlalchemy.orm.session import sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import CreateTable
 
-from time import sleep
+from typing import Callable
+from typing import Iterator
 
 from src.banking_app.conf import test_settings
 from src.banking_app.connection import activate_session
 from src.banking_app.main import banking_app
 from src.banking_app.models.base import Base
+from src.banking_app.tests.helpers import QueryCounter
+from src.banking_app.utils.negative_cache import not_found_cache
 
+from src.banking_app.tests.test_balance.conftest import balances_orm
+from src.banking_app.tests.test_card.conftest import cards_orm
 from src.banking_app.tests.test_client.conftest import clients_dto_simple
 from src.banking_app.tests.test_client.conftest import clients_dto
+from src.banking_app.tests.test_client.conftest import clients_orm
 from src.banking_app.tests.test_status.conftest import statuses_dto
 from src.banking_app.tests.test_status.conftest import statuses_orm
 
 
 __all__ = [
+    'balances_orm',
+    'cards_orm',
     'clients_dto_simple',
     'clients_dto',
+    'clients_orm',
     'statuses_dto',
     'statuses_orm',
 ]
 
 
+# With pytest-xdist (pytest -n auto) each worker (gw0, gw1, ...) works with
+# its own DB, all of them are cloned from the same template DB.
+WORKER_ID = os.environ.get('PYTEST_XDIST_WORKER')
+TEMPLATE_DB_NAME = f'{test_settings.DB_NAME}_template'
+TEMPLATE_LOCK_KEY = 380001
+
+
+def get_db_url() -> str:
+    url = make_url(test_settings.DB_URL)
+    if WORKER_ID is not None:
+        url = url.set(database=f'{url.database}_{WORKER_ID}')
+    return url.render_as_string(hide_password=False)
+
+
 engine = create_engine(
-    url=test_settings.DB_URL,
+    url=get_db_url(),
     echo=test_settings.ENGINE_ECHO,
     connect_args=test_settings.connect_args,
     pool_size=test_settings.ENGINE_POOL_SIZE,
@@ -47,7 +78,9 @@ session_obj = sessionmaker(
 
 def pytest_sessionstart(session):
     """Before than test session is started create DB."""
-    create_db(engine)  # Drop DB if exist and then create DB.
+    if is_xdist_controller(session.config):
+        return  # Only workers run tests.
+    create_db(engine)  # Drop DB if exist and then clone it from the template.
     message = f' Tests are started at: {test_settings.get_datetime_now()} '
     print('\n{:*^79}\n'.format(message))
 
@@ -56,77 +89,122 @@ def pytest_sessionfinish(session, exitstatus):
     """Drop database when test session is ended."""
     message = f' Tests are finished at: {test_settings.get_datetime_now()} '
     print('\n\n{:*^79}\n'.format(message))
+    if is_xdist_controller(session.config):
+        return
     drop_db(engine)
 
 
-@pytest.fixture(scope='session')
-def session():
-    """Initialize context of sqlalchemy.orm.Session."""
-    with session_obj() as session:
-        yield session
-
+def is_xdist_controller(config: pytest.Config) -> bool:
+    numprocesses = getattr(config.option, 'numprocesses', None)
+    return bool(numprocesses) and not hasattr(config, 'workerinput')
 
-@pytest.fixture(scope='session', autouse=True)
-def switch_used_session_in_dependencies(session) -> None:
-    """Switch used session into endpoints depends."""
 
-    def test_session():
-        yield session
-
-    banking_app.dependency_overrides[activate_session] = test_session
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """
+    Session bound to the connection with an outer transaction, which is rolled
+    back after the test, so tables are never recreated. Inside of the test
+    session.commit() and session.rollback() work with SAVEPOINT, endpoints use
+    the same session.
+    """
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        reset_sequences(connection)
+        # Objects of rolled back tests get the same keys, cached misses must not outlive them.
+        not_found_cache.clear()
+        with session_obj(bind=connection, join_transaction_mode='create_savepoint') as session:
+            banking_app.dependency_overrides[activate_session] = lambda: session
+            try:
+                yield session
+            finally:
+                banking_app.dependency_overrides.pop(activate_session, None)
+        transaction.rollback()
 
 
 @pytest.fixture
-def create_and_drop_tables(session: Session):
-
-    try:
-        engine.echo = False
-        create_tables(engine, session)
-        engine.echo = test_settings.ENGINE_ECHO
-        yield
-        engine.echo = False
-        drop_tables(engine, session)
-        engine.echo = test_settings.ENGINE_ECHO
-    except Exception:
-        pass
-    finally:
-        engine.echo = test_settings.ENGINE_ECHO
+def count_queries() -> Callable[[], QueryCounter]:
+    """Factory of context managers counting statements sent to the test DB."""
+    return partial(QueryCounter, engine)
 
 
-def create_db(engine: Engine) -> None:
-    """Execute command in command line which create DB."""
+def reset_sequences(connection: Connection) -> None:
+    """
+    Sequences aren't rolled back with the transaction, but tests expect PK
+    values to start from 1 as in just created tables.
+    """
 
-    drop_db(engine)
-    sleep(1)  # Sleep is required!
-    create_database(engine.url)
-    engine.logger.info(f'|| DB CREATED SUCCESSFULLY (url={engine.url}) ||')
+    columns = [
+        f"setval(pg_get_serial_sequence('{table.name}', '{column.name}'), 1, false)"
+        for table in Base.metadata.sorted_tables
+        if (column := table.autoincrement_column) is not None
+    ]
+    connection.execute(text(f'SELECT {", ".join(columns)}'))
 
 
-def drop_db(engine: Engine) -> None:
-    """Execute command in command line which drop DB."""
-
-    if database_exists(engine.url):
-        drop_database(engine.url)
-        engine.logger.info(f'|| DB DROPPED SUCCESSFULLY (url={engine.url}) ||')
+def get_schema_hash(engine: Engine) -> str:
+    """Hash of DDL of all registered into Base.metadata tables and indexes."""
 
+    ddl = list()
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=engine.dialect)))
+        ddl.extend(str(CreateIndex(index).compile(dialect=engine.dialect)) for index in table.indexes)
+    return sha1('\n'.join(ddl).encode()).hexdigest()
 
-def create_tables(engine: Engine, session: Session) -> None:
-    """Create all registered into Base.metadata tables."""
 
-    drop_tables(engine, session)
-    Base.metadata.create_all(engine)
-    session.commit()
+def get_admin_engine(engine: Engine) -> Engine:
+    """Engine connected to the maintenance DB, CREATE/DROP DATABASE can't run in transaction."""
+    return create_engine(
+        url=engine.url.set(database='postgres'),
+        isolation_level='AUTOCOMMIT',
+        poolclass=NullPool,
+    )
 
-    message = '\n{:*^79}'.format(' Base.metadata.create_all() OK! ')
-    engine.logger.info(message)
 
+def create_db(engine: Engine) -> None:
+    """
+    Create test DB as a copy of the template DB with all tables, template is
+    (re)built only when DDL of models changed (hash is kept in its comment).
+    Workers take the lock, so only the first of them builds the template.
+    """
 
-def drop_tables(engine: Engine, session: Session) -> None:
-    """Drop all registered into Base.metadata tables."""
+    drop_db(engine)
+    template_url = engine.url.set(database=TEMPLATE_DB_NAME)
+    schema_hash = get_schema_hash(engine)
+
+    admin_engine = get_admin_engine(engine)
+    with admin_engine.connect() as connection:
+        connection.execute(text('SELECT pg_advisory_lock(:key)'), dict(key=TEMPLATE_LOCK_KEY))
+        template_hash = connection.scalar(
+            text(
+                "SELECT shobj_description(oid, 'pg_database') "
+                'FROM pg_database WHERE datname = :name'
+            ),
+            dict(name=template_url.database),
+        )
+        if template_hash != schema_hash:
+            connection.execute(text(f'DROP DATABASE IF EXISTS "{template_url.database}" WITH (FORCE)'))
+            connection.execute(text(f'CREATE DATABASE "{template_url.database}"'))
+            template_engine = create_engine(template_url, poolclass=NullPool)
+            Base.metadata.create_all(template_engine)
+            template_engine.dispose()
+            connection.execute(text(f'COMMENT ON DATABASE "{template_url.database}" IS \'{schema_hash}\''))
+            engine.logger.info(f'|| TEMPLATE DB CREATED SUCCESSFULLY (url={template_url}) ||')
+
+        connection.execute(text(
+            f'CREATE DATABASE "{engine.url.database}" TEMPLATE "{template_url.database}"'
+        ))
+        connection.execute(text('SELECT pg_advisory_unlock(:key)'), dict(key=TEMPLATE_LOCK_KEY))
+    admin_engine.dispose()
+    engine.logger.info(f'|| DB CREATED SUCCESSFULLY (url={engine.url}) ||')
 
-    session.rollback()
-    Base.metadata.drop_all(engine)
-    session.commit()
 
-    message = '\n{:*^79}'.format(' Base.metadata.drop_all() OK! ')
-    engine.logger.info(message)
+def drop_db(engine: Engine) -> None:
+    """Drop DB, terminating connections which are still open."""
+
+    engine.dispose()
+    admin_engine = get_admin_engine(engine)
+    with admin_engine.connect() as connection:
+        connection.execute(text(f'DROP DATABASE IF EXISTS "{engine.url.database}" WITH (FORCE)'))
+    admin_engine.dispose()
+    engine.logger.info(f'|| DB DROPPED SUCCESSFULLY (url={engine.url}) ||')
@@ -1,13 +1,16 @@
 import json as _json
 
 from random import choice
+from typing import Any
 from typing import Callable
+from typing import Sequence
 from fastapi import status
 from pydantic import BaseModel, TypeAdapter
 
 from sqlalchemy.orm.session import make_transient
 from sqlalchemy.orm.session import Session
 
+from src.banking_app.models.base import Base
 from src.banking_app.tests.helpers import BaseTestHelper
 
 
@@ -269,3 +272,55 @@ class BaseTestDelete(BaseTestHelper):
             instances_after = session.scalars(statement).unique().all()
             assert len(instances_after) == len(models_orm)
             self.compare_list_before_after(models_orm, instances_after)
+
+
+class BaseTestQueryBudget(BaseTestHelper):
+
+    def test_budget_not_depends_on_rows(self, session: Session, count_queries, models_orm):
+        assert len(self.query_budget) > 0
+
+        # Count statements of each endpoint, then double the amount of rows in
+        # the DB and count them again.
+        counted_small = self.count_endpoint_queries(count_queries, models_orm)
+        self.duplicate_rows(session, models_orm)
+        counted_large = self.count_endpoint_queries(count_queries, models_orm)
+
+        for endpoint, budget in self.query_budget.items():
+            assert counted_small[endpoint] <= budget, endpoint
+            # Growing amount of statements means N+1 (lazy load per row).
+            assert counted_large[endpoint] == counted_small[endpoint], endpoint
+
+    def count_endpoint_queries(
+            self,
+            count_queries: Callable,
+            models_orm: Sequence[Base],
+    ) -> dict[str, int]:
+        counted = dict()
+        for endpoint in self.query_budget:
+            method, path = endpoint.split(' ')
+            for pk in self.primary_keys:
+                path = path.replace('{pk}', str(getattr(choice(models_orm), pk)))
+            url = f'{self.prefix}{path}'
+            json = self.get_budget_json(endpoint, models_orm)
+
+            with count_queries() as counter:
+                response = self.client.request(method, url, json=json)
+            assert response.is_success, endpoint
+            counted[endpoint] = counter.count
+        return counted
+
+    def get_budget_json(self, endpoint: str, models_orm: Sequence[Base]) -> Any:
+        """Body of write endpoint, its size must not depend on rows in the DB."""
+        return None
+
+    def duplicate_rows(self, session: Session, models_orm: Sequence[Base]) -> Sequence[Base]:
+        list_kwargs = [
+            self.get_orm_data_from_dto(
+                self.get_dto_from_single(instance),
+                exclude=self.primary_keys,
+            )
+            for instance in models_orm
+        ]
+        instances = session.scalars(self.manager.bulk_create(list_kwargs)).unique().all()
+        session.commit()
+        return instances
@@ -5,6 +5,8 @@ from polyfactory.factories.pydantic_factory import ModelFactory
 from pydantic import BaseModel
 from pydantic import TypeAdapter
 
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import delete
 
@@ -17,6 +19,34 @@ from src.banking_app.managers.base import BaseManager
 from src.banking_app.models.base import Base
 
 
+SAVEPOINT_STATEMENTS = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+
+
+class QueryCounter:
+    """Context manager which collects SQL statements executed by the engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: list[str] = list()
+
+    def __enter__(self) -> 'QueryCounter':
+        event.listen(self.engine, 'after_cursor_execute', self._collect)
+        return self
+
+    def __exit__(self, *args) -> None:
+        event.remove(self.engine, 'after_cursor_execute', self._collect)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _collect(self, conn, cursor, statement, parameters, context, executemany):
+        # Savepoints are emitted by the test session isolation, not by the app.
+        if statement.startswith(SAVEPOINT_STATEMENTS):
+            return
+        self.statements.append(statement)
+
+
 class BaseTestHelper(ABC):
     client: TestClient
     factory: ModelFactory
@@ -25,6 +55,10 @@ class BaseTestHelper(ABC):
     model_orm: type[Base]
     prefix: str
 
+    # Max amount of SQL statements per endpoint, which must not depend on the
+    # amount of rows in the DB, e.g. {'GET /list': 3, 'GET /{pk}': 3}.
+    query_budget: dict[str, int] = dict()
+
     DataType: TypeAlias = Base | BaseModel | dict[str, Any]
 
     @property
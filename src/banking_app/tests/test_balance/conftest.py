@@ -0,0 +1,23 @@
+import pytest
+
+from decimal import Decimal
+from typing import Sequence
+
+from src.banking_app.models.balance import Balance
+
+
+@pytest.fixture
+def balances_orm(session, clients_orm) -> Sequence[Balance]:
+    """Fixture creates one actual balance of each client."""
+    instances = [
+        Balance(
+            current_amount=Decimal(client.client_id * 100),
+            actual_flag=True,
+            client_id=client.client_id,
+        )
+        for client in clients_orm
+    ]
+    session.add_all(instances)
+    session.commit()
+
+    return instances
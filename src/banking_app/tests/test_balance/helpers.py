@@ -0,0 +1,53 @@
+import pytest
+
+from fastapi.testclient import TestClient
+
+from sqlalchemy.orm.session import Session
+
+from typing import Any
+from typing import Sequence
+
+from src.banking_app.main import banking_app
+from src.banking_app.managers.balance import BalanceManager
+from src.banking_app.models.balance import Balance
+from src.banking_app.models.client import Client
+from src.banking_app.schemas import BalanceModelWithRelations
+from src.banking_app.tests.helpers import BaseTestHelper
+
+
+manager = BalanceManager()
+
+
+@pytest.mark.usefixtures('session')
+class BalanceTestHelper(BaseTestHelper):
+    client = TestClient(banking_app)
+    manager: BalanceManager = manager
+    model_dto: type[BalanceModelWithRelations] = BalanceModelWithRelations
+    model_orm: type[Balance] = Balance
+    prefix = '/balances'
+    query_budget = {
+        'GET /list': 3,
+        'GET /list-balances-between?min_amount=0&max_amount=1000000': 3,
+        'GET /stats': 1,
+        'POST /': 3,
+        'POST /list': 8,
+    }
+
+    @pytest.fixture
+    def clients(self, clients_orm) -> Sequence[Client]:
+        return clients_orm
+
+    @pytest.fixture
+    def models_orm(self, balances_orm) -> Sequence[Balance]:
+        return balances_orm
+
+    def get_budget_json(self, endpoint: str, models_orm: Sequence[Balance]) -> Any:
+        if endpoint == 'POST /':
+            return dict(client_id=models_orm[0].client_id, current_amount='10.00')
+        if endpoint == 'POST /list':
+            return [dict(client_id=b.client_id, current_amount='20.00') for b in models_orm[:2]]
+        return None
+
+    def get_balances(self, session: Session, client_id: int) -> Sequence[Balance]:
+        statement = self.manager.filter(client_id=client_id)
+        return session.scalars(statement).unique().all()
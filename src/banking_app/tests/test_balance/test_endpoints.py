@@ -0,0 +1,86 @@
+import pytest
+
+from fastapi import status
+from random import choice
+from sqlalchemy.orm.session import Session
+
+from src.banking_app.tests.general.endpoints import BaseTestQueryBudget
+from src.banking_app.tests.test_balance.helpers import BalanceTestHelper
+
+
+@pytest.mark.run(order=2.02_00)
+class TestPost(BalanceTestHelper):
+
+    def post_balance(self, client_id: int, current_amount: str) -> dict:
+        json = dict(client_id=client_id, current_amount=current_amount)
+        response = self.client.post(f'{self.prefix}/', json=json)
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    def test_only_new_balance_is_actual(self, session: Session, clients):
+        client = choice(clients)
+        first = self.post_balance(client.client_id, '10.00')
+        second = self.post_balance(client.client_id, '20.00')
+        assert first['actual_flag'] is True and second['actual_flag'] is True
+
+        session.expire_all()
+        balances = self.get_balances(session, client.client_id)
+        actual = {b.row_id: b.actual_flag for b in balances}
+        assert actual == {first['row_id']: False, second['row_id']: True}
+
+    def test_vip_flag_follows_balance(self, session: Session, clients):
+        client = choice(clients)
+        border = client.VIP_if_balance
+
+        body = self.post_balance(client.client_id, f'{border:.2f}')
+        assert body['client']['VIP_flag'] is True
+        body = self.post_balance(client.client_id, f'{border - 1:.2f}')
+        assert body['client']['VIP_flag'] is False
+
+        session.expire_all()
+        session.refresh(client)
+        assert client.VIP_flag is False
+
+    def test_unexistent_client(self, session: Session, clients):
+        unexistent = self.get_unexistent_numeric_value('client_id', clients)
+        json = dict(client_id=unexistent, current_amount='10.00')
+        response = self.client.post(f'{self.prefix}/', json=json)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {'detail': self.not_unique_msg(client_id=unexistent)}
+
+        assert len(self.get_balances(session, unexistent)) == 0
+
+
+@pytest.mark.run(order=2.02_01)
+class TestPartialBulkCreate(BalanceTestHelper):
+
+    def test_client_on_both_sides_of_failed_row(self, session: Session, clients):
+        client = choice(clients)
+        unexistent = self.get_unexistent_numeric_value('client_id', clients)
+        # Failed row splits the chunk, the last balance is written by another SAVEPOINT.
+        json = [
+            dict(client_id=client.client_id, current_amount='1.00'),
+            dict(client_id=client.client_id, current_amount='2.00'),
+            dict(client_id=unexistent, current_amount='3.00'),
+            dict(client_id=client.client_id, current_amount='950000.00'),
+        ]
+
+        response = self.client.post(f'{self.prefix}/list-partial', json=json)
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        result = response.json()
+        assert [b['current_amount'] for b in result['created']] == [1.0, 2.0, 950000.0]
+        assert [e['index'] for e in result['failed']] == [2]
+
+        session.expire_all()
+        balances = self.get_balances(session, client.client_id)
+        actual = [b for b in balances if b.actual_flag is True]
+        assert len(actual) == 1
+        assert actual[0].current_amount == 950000
+        assert actual[0].client.VIP_flag is True
+
+
+@pytest.mark.run(order=2.02_02)
+class TestQueryBudget(BalanceTestHelper, BaseTestQueryBudget):
+
+    def test_budget_not_depends_on_rows(self, session: Session, count_queries, models_orm):
+        return super().test_budget_not_depends_on_rows(session, count_queries, models_orm)
@@ -0,0 +1,28 @@
+import pytest
+
+from datetime import date
+from datetime import datetime
+from typing import Sequence
+
+from src.banking_app.models.card import Card
+from src.banking_app.types.card import CardType
+
+
+@pytest.fixture
+def cards_orm(session, clients_orm) -> Sequence[Card]:
+    """Fixture creates one card of each client."""
+    instances = [
+        Card(
+            card_number=f'4{client.client_id:015d}',
+            card_type=CardType.DEBIT,
+            open_date=date(2024, 1, 1),
+            close_date=date(2029, 1, 1),
+            processed_datetime=datetime(2024, 1, 1),
+            client_id=client.client_id,
+        )
+        for client in clients_orm
+    ]
+    session.add_all(instances)
+    session.commit()
+
+    return instances
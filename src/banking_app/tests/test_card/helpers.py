@@ -0,0 +1,54 @@
+import pytest
+
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from sqlalchemy.orm.session import Session
+
+from typing import Sequence
+
+from src.banking_app.main import banking_app
+from src.banking_app.managers.transaction import TransactionManager
+from src.banking_app.models.card import Card
+from src.banking_app.models.transaction import Transaction
+from src.banking_app.schemas import CardModelWithRelations
+from src.banking_app.tests.helpers import BaseTestHelper
+
+
+transaction_manager = TransactionManager()
+
+
+@pytest.mark.usefixtures('session')
+class CardTestHelper(BaseTestHelper):
+    client = TestClient(banking_app)
+    model_dto: type[CardModelWithRelations] = CardModelWithRelations
+    model_orm: type[Card] = Card
+    prefix = '/cards'
+
+    @pytest.fixture
+    def cards(self, cards_orm) -> Sequence[Card]:
+        return cards_orm
+
+    @staticmethod
+    def add_transactions(
+            session: Session,
+            card_number: str,
+            trans_datetimes: Sequence[datetime],
+            trans_amount: str = '10.00',
+    ) -> Sequence[Transaction]:
+        """Insert transactions bypassing the API, ids grow in the order of datetimes."""
+
+        list_kwargs = [
+            dict(
+                trans_amount=trans_amount,
+                trans_datetime=trans_datetime,
+                processed_datetime=trans_datetime,
+                card_number=card_number,
+            )
+            for trans_datetime in trans_datetimes
+        ]
+        statement = transaction_manager.bulk_create(list_kwargs)
+        instances = session.scalars(statement).unique().all()
+        session.commit()
+        return sorted(instances, key=lambda i: i.trans_id)
@@ -0,0 +1,180 @@
+import pytest
+
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+from fastapi import status
+from sqlalchemy.orm.session import Session
+
+from src.banking_app.jobs.transaction_daily import catch_up_transaction_daily
+from src.banking_app.models.card import Card
+from src.banking_app.models.transaction import Transaction
+from src.banking_app.tests.test_card.helpers import CardTestHelper
+
+
+START = datetime(2024, 6, 1, 12)
+
+
+@pytest.mark.run(order=2.03_00)
+class TestTransactionsPage(CardTestHelper):
+
+    def get_pages(self, card_number: str, **params) -> list[dict]:
+        url = f'{self.prefix}/{card_number}/transactions'
+        pages = list()
+        while True:
+            response = self.client.get(url, params=params)
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(body := response.json())
+            if body['next_cursor'] is None:
+                return pages
+            params['cursor'] = body['next_cursor']
+
+    def test_cursor_continuation(self, session: Session, cards):
+        card_number = cards[0].card_number
+        # Two transactions at the same time fall on both sides of the first page boundary.
+        trans_datetimes = [START, START + timedelta(hours=1), START + timedelta(hours=1), START + timedelta(hours=2)]
+        transactions = self.add_transactions(session, card_number, trans_datetimes + [START - timedelta(hours=1)])
+        self.add_transactions(session, cards[1].card_number, trans_datetimes)
+
+        pages = self.get_pages(card_number, limit=2)
+        assert [len(page['items']) for page in pages] == [2, 2, 1]
+
+        received = [item['trans_id'] for page in pages for item in page['items']]
+        expected = sorted(transactions, key=lambda t: (t.trans_datetime, t.trans_id), reverse=True)
+        assert received == [t.trans_id for t in expected]
+
+    def test_last_full_page_has_no_cursor(self, session: Session, cards):
+        card_number = cards[0].card_number
+        self.add_transactions(session, card_number, [START + timedelta(minutes=i) for i in range(4)])
+
+        pages = self.get_pages(card_number, limit=2)
+        assert [len(page['items']) for page in pages] == [2, 2]
+
+        pages = self.get_pages(card_number, limit=4)
+        assert [len(page['items']) for page in pages] == [4]
+
+    def test_date_range(self, session: Session, cards):
+        card_number = cards[0].card_number
+        transactions = self.add_transactions(session, card_number, [START + timedelta(days=i) for i in range(4)])
+
+        params = {'from': (START + timedelta(days=1)).isoformat(), 'to': (START + timedelta(days=3)).isoformat()}
+        pages = self.get_pages(card_number, limit=1, **params)
+        received = [item['trans_id'] for page in pages for item in page['items']]
+        # Lower bound is inclusive, upper bound is exclusive.
+        assert received == [transactions[2].trans_id, transactions[1].trans_id]
+
+    def test_invalid_cursor(self, cards):
+        url = f'{self.prefix}/{cards[0].card_number}/transactions'
+        response = self.client.get(url, params=dict(cursor='not a cursor'))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_card_without_transactions(self, cards):
+        pages = self.get_pages(cards[0].card_number)
+        assert pages == [dict(items=[], next_cursor=None)]
+
+    def test_unexistent_card(self, cards):
+        response = self.client.get(f'{self.prefix}/{"9" * 16}/transactions')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.run(order=2.03_01)
+class TestDaily(CardTestHelper):
+
+    def get_daily(self, url: str) -> list[dict]:
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def post_transaction(self, card_number: str, trans_amount: str, trans_datetime: datetime) -> None:
+        json = dict(
+            trans_amount=trans_amount,
+            trans_datetime=trans_datetime.isoformat(),
+            processed_datetime=trans_datetime.isoformat(),
+            card_number=card_number,
+        )
+        response = self.client.post('/transactions/', json=json)
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def add_card(self, session: Session, card: Card) -> Card:
+        """Add the second card of the same client."""
+        instance = Card(
+            card_number=f'5{card.card_number[1:]}',
+            card_type=card.card_type,
+            open_date=card.open_date,
+            close_date=card.close_date,
+            processed_datetime=card.processed_datetime,
+            client_id=card.client_id,
+        )
+        session.add(instance)
+        session.commit()
+        return instance
+
+    def test_totals_of_ingested_transactions(self, session: Session, cards):
+        first = cards[0]
+        second = self.add_card(session, first)
+        self.post_transaction(first.card_number, '10.50', START)
+        self.post_transaction(first.card_number, '-0.50', START + timedelta(hours=1))
+        self.post_transaction(first.card_number, '7.00', START + timedelta(days=1))
+        json = [
+            dict(
+                trans_amount='5.00',
+                trans_datetime=START.isoformat(),
+                processed_datetime=START.isoformat(),
+                card_number=second.card_number,
+                idempotency_key='key',
+            )
+        ]
+        response = self.client.post('/transactions/batch', json=json)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        daily = self.get_daily(f'{self.prefix}/{first.card_number}/daily')
+        assert daily == [
+            dict(trans_date='2024-06-01', trans_count=2, trans_amount_sum=10.0),
+            dict(trans_date='2024-06-02', trans_count=1, trans_amount_sum=7.0),
+        ]
+        daily = self.get_daily(f'/clients/{first.client_id}/daily')
+        assert daily == [
+            dict(trans_date='2024-06-01', trans_count=3, trans_amount_sum=15.0),
+            dict(trans_date='2024-06-02', trans_count=1, trans_amount_sum=7.0),
+        ]
+
+        params = '?from=2024-06-02&to=2024-06-02'
+        daily = self.get_daily(f'{self.prefix}/{first.card_number}/daily{params}')
+        assert [d['trans_date'] for d in daily] == ['2024-06-02']
+
+    def test_catch_up(self, session: Session, cards):
+        card_number = cards[0].card_number
+        url = f'{self.prefix}/{card_number}/daily'
+        # Ingested by the API are already in the rollup, catch-up must not count them twice.
+        self.post_transaction(card_number, '1.00', START)
+        self.add_transactions(session, card_number, [START + timedelta(days=i) for i in range(3)])
+        assert len(self.get_daily(url)) == 1
+
+        assert catch_up_transaction_daily(session, chunk_size=2) == 4
+        expected = [
+            dict(trans_date=str(date(2024, 6, 1) + timedelta(days=i)), trans_count=count, trans_amount_sum=amount)
+            for i, (count, amount) in enumerate([(2, 11.0), (1, 10.0), (1, 10.0)])
+        ]
+        assert self.get_daily(url) == expected
+
+        # Nothing new after the watermark, the second run changes nothing.
+        assert catch_up_transaction_daily(session) == 0
+        assert self.get_daily(url) == expected
+
+    def test_catch_up_late_commit(self, session: Session, cards):
+        card_number = cards[0].card_number
+        url = f'{self.prefix}/{card_number}/daily'
+        first, _ = self.add_transactions(session, card_number, [START, START + timedelta(days=1)])
+        # The first transaction isn't committed yet, when catch-up passes its id.
+        first_kwargs = {c.key: getattr(first, c.key) for c in Transaction.__table__.columns}
+        session.delete(first)
+        session.commit()
+        catch_up_transaction_daily(session)
+        assert [d['trans_date'] for d in self.get_daily(url)] == ['2024-06-02']
+
+        session.add(Transaction(**first_kwargs))
+        session.commit()
+        # Id is below the watermark, it's picked up by the trailing window.
+        assert catch_up_transaction_daily(session) == 0
+        assert [d['trans_date'] for d in self.get_daily(url)] == ['2024-06-01', '2024-06-02']
@@ -18,7 +18,7 @@ ClientData: TypeAlias = Client | ClientModelWithRelations | dict[str, Any]
 manager = ClientManager()
 
 
-@pytest.mark.usefixtures('create_and_drop_tables')
+@pytest.mark.usefixtures('session')
 class ClientTestHelper(BaseTestHelper):
     client = TestClient(banking_app)
     factory: ClientFactory = ClientFactory()
@@ -26,6 +26,12 @@ class ClientTestHelper(BaseTestHelper):
     model_dto: type[ClientModelWithRelations] = ClientModelWithRelations
     model_orm: type[Client] = Client
     prefix = '/clients'
+    query_budget = {
+        'GET /list': 3,
+        'GET /list-filtered': 3,
+        'GET /stats': 1,
+        'GET /{pk}': 3,
+    }
 
     @pytest.fixture
     def models_dto(self, clients_dto) -> Sequence[ClientModelWithRelations]:
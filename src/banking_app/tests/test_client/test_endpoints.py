@@ -1,18 +1,23 @@
 import json as _json
 import pytest
 
+from collections import Counter
+from datetime import datetime
 from fastapi import status
 from random import choice
 from sqlalchemy.orm.session import Session
 
+from src.banking_app.models.balance import Balance
 from src.banking_app.schemas import ClientCreate
 from src.banking_app.schemas import ClientFullUpdate
 from src.banking_app.schemas import ClientPartialUpdate
 from src.banking_app.schemas import ClientRetrieve
+from src.banking_app.schemas import ClientUpsert
 from src.banking_app.tests.general.endpoints import BaseTestDelete
 from src.banking_app.tests.general.endpoints import BaseTestFullUpdate
 from src.banking_app.tests.general.endpoints import BaseTestPartialUpdate
 from src.banking_app.tests.general.endpoints import BaseTestPost
+from src.banking_app.tests.general.endpoints import BaseTestQueryBudget
 from src.banking_app.tests.general.endpoints import BaseTestRetrieve
 from src.banking_app.tests.test_client.helpers import ClientTestHelper
 from src.banking_app.tests.test_status.helpers import StatusTestHelper
@@ -106,3 +111,183 @@ class TestDelete(ClientTestHelper, BaseTestDelete):
 
     def test_unexistent_instance_with_pk(self, session: Session, models_orm):
         return super().test_unexistent_instance_with_pk(session, models_orm)
+
+
+@pytest.mark.run(order=2.01_05)
+class TestStats(ClientTestHelper):
+
+    def test_count_all(self, models_orm):
+        url = f'{self.prefix}/stats'
+
+        # Make a GET query that must return the amount of all clients.
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body == {
+            'function': 'count',
+            'field': None,
+            'rows': [{'group': {}, 'value': len(models_orm)}],
+        }
+
+    def test_count_grouped(self, models_orm):
+        url = f'{self.prefix}/stats'
+        params = {'group_by': ['status', 'VIP_flag']}
+
+        # Make a GET query that must return the amount of clients per group.
+        response = self.client.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        received = {
+            (r['group']['status'], r['group']['VIP_flag']): r['value']
+            for r in body['rows']
+        }
+        assert received == Counter((m.status, m.VIP_flag) for m in models_orm)
+
+    def test_count_filtered(self, models_orm):
+        url = f'{self.prefix}/stats'
+        status_code = choice(models_orm).status
+
+        # Make a GET query that must return the amount of filtered clients.
+        response = self.client.get(url, params={'status_code': status_code})
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        found = list(filter(lambda m: m.status == status_code, models_orm))
+        assert body['rows'] == [{'group': {}, 'value': len(found)}]
+
+
+@pytest.mark.run(order=2.01_06)
+class TestQueryBudget(ClientTestHelper, BaseTestQueryBudget):
+
+    def test_budget_not_depends_on_rows(self, session: Session, count_queries, models_orm):
+        return super().test_budget_not_depends_on_rows(session, count_queries, models_orm)
+
+
+@pytest.mark.run(order=2.01_07)
+class TestBulkUpsert(ClientTestHelper):
+
+    def test_insert_and_update(self, session: Session, models_orm):
+        existent = choice(models_orm)
+        new_client_id = self.get_unexistent_numeric_value('client_id', models_orm) + 10
+        updated = ClientUpsert.model_validate(existent).model_copy(update=dict(full_name='Updated Full Name'))
+        inserted = ClientUpsert.model_validate(existent).model_copy(update=dict(client_id=new_client_id))
+        json = [updated.model_dump(mode='json'), inserted.model_dump(mode='json')]
+
+        response = self.client.put(f'{self.prefix}/list', json=json)
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert [c['client_id'] for c in result['inserted']] == [new_client_id]
+        assert [c['client_id'] for c in result['updated']] == [existent.client_id]
+        assert result['updated'][0]['full_name'] == 'Updated Full Name'
+
+        # Sequence was moved forward, so clients created later don't conflict.
+        statement = self.manager.create(**updated.model_dump(exclude={'client_id'}))
+        assert session.scalar(statement).client_id > new_client_id
+
+    def test_unexistent_status(self, session: Session, models_orm):
+        existent = choice(models_orm)
+        json = [ClientUpsert.model_validate(existent).model_dump(mode='json') | dict(status=1)]
+        response = self.client.put(f'{self.prefix}/list', json=json)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.run(order=2.01_08)
+class TestBulkUpdateDelete(ClientTestHelper):
+
+    def test_partial_update(self, session: Session, models_orm):
+        first, second = models_orm[:2]
+        unexistent = self.get_unexistent_numeric_value('client_id', models_orm)
+        json = [
+            dict(client_id=first.client_id, full_name='Updated Full Name'),
+            dict(client_id=second.client_id, status=first.status, sex='FEMALE'),
+            dict(client_id=unexistent, full_name='Not Applied'),
+        ]
+
+        response = self.client.patch(f'{self.prefix}/list', json=json)
+        assert response.status_code == status.HTTP_200_OK
+        result = {c['client_id']: c for c in response.json()}
+        assert set(result) == {first.client_id, second.client_id}
+        assert result[first.client_id]['full_name'] == 'Updated Full Name'
+        assert result[second.client_id]['status'] == first.status
+
+        session.refresh(second)
+        assert second.status == first.status
+
+    def test_unexistent_status(self, models_orm):
+        json = [dict(client_id=choice(models_orm).client_id, status=1)]
+        response = self.client.patch(f'{self.prefix}/list', json=json)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_delete(self, session: Session, models_orm):
+        deleted = models_orm[:2]
+        unexistent = self.get_unexistent_numeric_value('client_id', models_orm)
+        json = [m.client_id for m in deleted] + [unexistent]
+
+        response = self.client.request('DELETE', f'{self.prefix}/list', json=json)
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(c['client_id'] for c in response.json()) == sorted(m.client_id for m in deleted)
+
+        instances = session.scalars(self.manager.filter()).unique().all()
+        assert len(instances) == len(models_orm) - len(deleted)
+
+
+@pytest.mark.run(order=2.01_09)
+class TestBalanceHistory(ClientTestHelper):
+
+    def add_balances(self, session: Session, client_id: int, balances: list[tuple[datetime, str]]) -> None:
+        session.add_all(
+            Balance(
+                client_id=client_id,
+                current_amount=current_amount,
+                actual_flag=False,
+                processed_datetime=processed_datetime,
+            )
+            for processed_datetime, current_amount in balances
+        )
+        session.commit()
+
+    def get_history(self, client_id: int, **params) -> dict:
+        response = self.client.get(f'{self.prefix}/{client_id}/balance-history', params=params)
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def test_last_balance_of_bucket_and_delta(self, session: Session, models_orm):
+        client, other = models_orm[:2]
+        self.add_balances(session, client.client_id, [
+            (datetime(2024, 6, 3, 10), '100.00'),
+            (datetime(2024, 6, 3, 12), '150.00'),  # Last of the day.
+            (datetime(2024, 6, 4, 9), '120.00'),
+            (datetime(2024, 6, 6, 9), '200.00'),   # Days without balances are skipped.
+        ])
+        self.add_balances(session, other.client_id, [(datetime(2024, 6, 4, 10), '999.00')])
+
+        history = self.get_history(client.client_id, bucket='day')
+        assert history == dict(
+            bucket='day',
+            timestamps=['2024-06-03T00:00:00', '2024-06-04T00:00:00', '2024-06-06T00:00:00'],
+            amounts=[150.0, 120.0, 200.0],
+            deltas=[None, -30.0, 80.0],
+        )
+
+        # 2024-06-03 is Monday, all balances are in the same week.
+        history = self.get_history(client.client_id, bucket='week')
+        assert history['timestamps'] == ['2024-06-03T00:00:00']
+        assert history['amounts'] == [200.0]
+        assert history['deltas'] == [None]
+
+    def test_date_range(self, session: Session, models_orm):
+        client = models_orm[0]
+        self.add_balances(session, client.client_id, [
+            (datetime(2024, 6, 3, 10), '100.00'),
+            (datetime(2024, 6, 4, 10), '120.00'),
+            (datetime(2024, 6, 5, 10), '130.00'),
+        ])
+
+        params = {'from': '2024-06-04T00:00:00', 'to': '2024-06-05T10:00:00'}
+        history = self.get_history(client.client_id, bucket='day', **params)
+        # Upper bound is exclusive, delta is counted only inside of the range.
+        assert history['amounts'] == [120.0]
+        assert history['deltas'] == [None]
+
+    def test_client_without_balances(self, models_orm):
+        history = self.get_history(models_orm[0].client_id)
+        assert history == dict(bucket='day', timestamps=[], amounts=[], deltas=[])
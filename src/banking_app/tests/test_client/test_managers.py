@@ -1,8 +1,10 @@
 import pytest
 
+from collections import Counter
 from random import choice
 from sqlalchemy.orm.session import Session
 
+from src.banking_app.managers.base import AGGREGATE_WITHOUT_FIELD_MSG
 from src.banking_app.models.client import Client
 from src.banking_app.tests.general.managers import BaseTestBulkCreate
 from src.banking_app.tests.general.managers import BaseTestCreate
@@ -10,6 +12,7 @@ from src.banking_app.tests.general.managers import BaseTestDelete
 from src.banking_app.tests.general.managers import BaseTestFilter
 from src.banking_app.tests.general.managers import BaseTestUpdate
 from src.banking_app.tests.test_client.conftest import ClientTestHelper
+from src.banking_app.types.general import AggregateFunction
 from src.banking_app.utils.kwargs_parser import KwargsParser
 
 
@@ -125,3 +128,47 @@ class TestDelete(ClientTestHelper, BaseTestDelete):
 
     def test_single_unexistent_instance(self, session: Session, models_orm):
         return super().test_single_unexistent_instance(session, models_orm)
+
+
+@pytest.mark.run(order=1.01_05)
+class TestAggregate(ClientTestHelper):
+
+    def test_count_without_arguments(self, session: Session, models_orm):
+        statement = self.manager.count()
+        assert session.scalar(statement) == len(models_orm)
+
+    def test_count_filtered(self, session: Session, models_orm):
+        status = choice(models_orm).status
+
+        statement = self.manager.count(status=status)
+        found = list(filter(lambda m: m.status == status, models_orm))
+        assert session.scalar(statement) == len(found)
+
+    @pytest.mark.parametrize(
+        argnames='attr',
+        argvalues=(
+            pytest.param('status', id='status'),
+            pytest.param('VIP_flag', id='VIP_flag'),
+            pytest.param('sex', id='sex'),
+        ),
+    )
+    def test_count_grouped_by(self, attr, session: Session, models_orm):
+        statement = self.manager.count(group_by=[attr])
+        rows = session.execute(statement).all()
+
+        received = {row._mapping[attr]: row.value for row in rows}
+        assert received == Counter(getattr(m, attr) for m in models_orm)
+
+    def test_min_max(self, session: Session, models_orm):
+        birth_dates = [m.birth_date for m in models_orm]
+
+        statement = self.manager.min('birth_date')
+        assert session.scalar(statement) == min(birth_dates)
+        statement = self.manager.max('birth_date')
+        assert session.scalar(statement) == max(birth_dates)
+
+    def test_without_field(self):
+        with pytest.raises(ValueError) as error:
+            self.manager.aggregate(AggregateFunction.SUM)
+        msg = AGGREGATE_WITHOUT_FIELD_MSG.format(function=AggregateFunction.SUM)
+        assert str(error.value) == msg
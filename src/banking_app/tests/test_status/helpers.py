@@ -18,7 +18,7 @@ StatusData: TypeAlias = Status | StatusModelWithRelations | dict[str, Any]
 manager = StatusManager()
 
 
-@pytest.mark.usefixtures('create_and_drop_tables')
+@pytest.mark.usefixtures('session')
 class StatusTestHelper(BaseTestHelper):
     client = TestClient(banking_app)
     factory: StatusFactory = StatusFactory()
@@ -26,6 +26,10 @@ class StatusTestHelper(BaseTestHelper):
     model_dto: type[StatusModelWithRelations] = StatusModelWithRelations
     model_orm: type[Status] = Status
     prefix = '/status'
+    query_budget = {
+        'GET /list': 3,
+        'GET /{pk}': 3,
+    }
 
     @pytest.fixture
     def models_dto(self, statuses_dto) -> Sequence[StatusModelWithRelations]:
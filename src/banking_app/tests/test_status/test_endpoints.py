@@ -3,11 +3,16 @@ import pytest
 
 from fastapi import status as _status
 
+from itertools import cycle
+
 from random import choice
 from random import sample
 
 from sqlalchemy.orm.session import Session
 
+from typing import Sequence
+
+from src.banking_app.models.status import Status
 from src.banking_app.schemas import StatusCreate
 from src.banking_app.schemas import StatusFullUpdate
 from src.banking_app.schemas import StatusPartialUpdate
@@ -16,7 +21,9 @@ from src.banking_app.tests.general.endpoints import BaseTestDelete
 from src.banking_app.tests.general.endpoints import BaseTestFullUpdate
 from src.banking_app.tests.general.endpoints import BaseTestPartialUpdate
 from src.banking_app.tests.general.endpoints import BaseTestPost
+from src.banking_app.tests.general.endpoints import BaseTestQueryBudget
 from src.banking_app.tests.general.endpoints import BaseTestRetrieve
+from src.banking_app.tests.test_client.helpers import ClientTestHelper
 from src.banking_app.tests.test_status.helpers import StatusTestHelper
 
 
@@ -116,3 +123,132 @@ class TestDelete(StatusTestHelper, BaseTestDelete):
 
     def test_unexistent_instance_with_pk(self, session: Session, models_orm):
         return super().test_unexistent_instance_with_pk(session, models_orm)
+
+
+@pytest.mark.run(order=2.00_05)
+class TestQueryBudget(StatusTestHelper, BaseTestQueryBudget):
+
+    def test_budget_not_depends_on_rows(self, session: Session, count_queries, models_orm, clients_orm):
+        # Clients are created to check that they are loaded into statuses without N+1.
+        return super().test_budget_not_depends_on_rows(session, count_queries, models_orm)
+
+    def duplicate_rows(self, session: Session, models_orm: Sequence[Status]) -> Sequence[Status]:
+        # New statuses get clients too, otherwise N+1 of status clients
+        # wouldn't change the amount of statements.
+        statuses = super().duplicate_rows(session, models_orm)
+        client_helper = ClientTestHelper()
+        clients = session.scalars(client_helper.manager.filter()).unique().all()
+        list_kwargs = [
+            client_helper.get_orm_data_from_dto(
+                client_helper.get_dto_from_single(client),
+                exclude=client_helper.primary_keys,
+            ) | dict(status=status.status)
+            for client, status in zip(clients, cycle(statuses))
+        ]
+        session.execute(client_helper.manager.bulk_create(list_kwargs))
+        session.commit()
+        return statuses
+
+
+@pytest.mark.run(order=2.00_06)
+class TestBulkUpsert(StatusTestHelper):
+
+    def test_insert_and_update(self, session: Session, models_dto):
+        half = int(len(models_dto) / 2)
+        list_kwargs = [self.get_orm_data_from_dto(m) for m in models_dto[:half]]
+        session.scalars(self.manager.bulk_create(list_kwargs)).unique().all()
+        session.commit()
+
+        json = [dict(status=m.status, description=f'Updated {m.status}') for m in models_dto]
+        response = self.client.put(f'{self.prefix}/list', json=json)
+        assert response.status_code == _status.HTTP_200_OK
+        result = response.json()
+        assert result['received'] == len(models_dto)
+        assert result['skipped'] == 0
+        assert result['duplicates'] == 0
+        assert sorted(s['status'] for s in result['updated']) == sorted(m.status for m in models_dto[:half])
+        assert sorted(s['status'] for s in result['inserted']) == sorted(m.status for m in models_dto[half:])
+
+        instances = session.scalars(self.manager.filter()).unique().all()
+        assert {i.status: i.description for i in instances} == {s['status']: s['description'] for s in json}
+
+    def test_skip_existing(self, session: Session, models_orm):
+        existent = choice(models_orm)
+        json = [dict(status=existent.status, description='Not applied')]
+        response = self.client.put(f'{self.prefix}/list', params=dict(on_conflict='skip'), json=json)
+        assert response.status_code == _status.HTTP_200_OK
+        assert response.json() == dict(received=1, inserted=[], updated=[], skipped=1, duplicates=0)
+
+        session.refresh(existent)
+        assert existent.description != 'Not applied'
+
+    def test_chunks_and_duplicates(self, session: Session, models_dto, monkeypatch):
+        # Two rows of two columns per statement.
+        monkeypatch.setattr('src.banking_app.managers.base.BULK_PARAMETERS_LIMIT', 4)
+        json = [dict(status=m.status, description=f'Inserted {m.status}') for m in models_dto]
+        json.append(dict(status=models_dto[0].status, description='Last one is used'))
+
+        response = self.client.put(f'{self.prefix}/list', json=json)
+        assert response.status_code == _status.HTTP_200_OK
+        result = response.json()
+        assert result['received'] == len(models_dto) + 1
+        assert result['duplicates'] == 1
+        assert result['skipped'] == 0
+        assert sorted(s['status'] for s in result['inserted']) == sorted(m.status for m in models_dto)
+
+        instances = session.scalars(self.manager.filter()).unique().all()
+        assert {i.status: i.description for i in instances} == {s['status']: s['description'] for s in json}
+
+
+@pytest.mark.run(order=2.00_07)
+class TestBulkUpdateDelete(StatusTestHelper):
+
+    def test_partial_update(self, session: Session, models_orm):
+        unexistent = self.get_unexistent_numeric_value('status', models_orm)
+        json = [dict(status=m.status, description=f'Updated {m.status}') for m in models_orm]
+        json.append(dict(status=unexistent, description='Not applied'))
+
+        response = self.client.patch(f'{self.prefix}/list', json=json)
+        assert response.status_code == _status.HTTP_200_OK
+        assert sorted(s['status'] for s in response.json()) == sorted(m.status for m in models_orm)
+
+        instances = session.scalars(self.manager.filter()).unique().all()
+        assert {i.status: i.description for i in instances} == {s['status']: s['description'] for s in json[:-1]}
+
+    def test_delete(self, session: Session, models_orm):
+        deleted = models_orm[:2]
+        unexistent = self.get_unexistent_numeric_value('status', models_orm)
+        json = [m.status for m in deleted] + [unexistent]
+
+        response = self.client.request('DELETE', f'{self.prefix}/list', json=json)
+        assert response.status_code == _status.HTTP_200_OK
+        assert sorted(s['status'] for s in response.json()) == sorted(m.status for m in deleted)
+
+        instances = session.scalars(self.manager.filter()).unique().all()
+        assert len(instances) == len(models_orm) - len(deleted)
+
+
+@pytest.mark.run(order=2.00_08)
+class TestPartialBulkCreate(StatusTestHelper):
+
+    def test_failed_rows_are_reported(self, session: Session, models_orm):
+        existent = choice(models_orm)
+        new_status = self.get_unexistent_numeric_value('status', models_orm)
+        json = [
+            dict(status=new_status, description='Created'),
+            dict(status=existent.status, description='Not applied'),
+            dict(status=new_status + 1, description='Created'),
+            dict(status=new_status, description='Not applied'),
+        ]
+
+        response = self.client.post(f'{self.prefix}/list-partial', json=json)
+        assert response.status_code == _status.HTTP_207_MULTI_STATUS
+        result = response.json()
+        assert result['received'] == len(json)
+        assert [s['status'] for s in result['created']] == [new_status, new_status + 1]
+        assert [e['index'] for e in result['failed']] == [1, 3]
+        assert {e['status_code'] for e in result['failed']} == {_status.HTTP_400_BAD_REQUEST}
+
+        instances = session.scalars(self.manager.filter()).unique().all()
+        assert len(instances) == len(models_orm) + 2
+        assert all(i.description != 'Not applied' for i in instances)
@@ -0,0 +1,4 @@
+import pytest
+
+
+pytest.register_assert_rewrite('src.banking_app.tests')
@@ -0,0 +1,50 @@
+import pytest
+
+from fastapi.testclient import TestClient
+
+from sqlalchemy.orm.session import Session
+
+from typing import Any
+from typing import Sequence
+
+from src.banking_app.main import banking_app
+from src.banking_app.managers.transaction import TransactionManager
+from src.banking_app.models.card import Card
+from src.banking_app.models.transaction import Transaction
+from src.banking_app.schemas import TransactionModelWithRelations
+from src.banking_app.tests.helpers import BaseTestHelper
+
+
+manager = TransactionManager()
+
+
+@pytest.mark.usefixtures('session')
+class TransactionTestHelper(BaseTestHelper):
+    client = TestClient(banking_app)
+    manager: TransactionManager = manager
+    model_dto: type[TransactionModelWithRelations] = TransactionModelWithRelations
+    model_orm: type[Transaction] = Transaction
+    prefix = '/transactions'
+
+    @pytest.fixture
+    def cards(self, cards_orm) -> Sequence[Card]:
+        return cards_orm
+
+    @staticmethod
+    def get_transaction_json(
+            card_number: str,
+            trans_amount: str,
+            *,
+            trans_datetime: str = '2024-06-01T12:00:00',
+            **kwargs,
+    ) -> dict[str, Any]:
+        return dict(
+            trans_amount=trans_amount,
+            trans_datetime=trans_datetime,
+            processed_datetime=trans_datetime,
+            card_number=card_number,
+            **kwargs,
+        )
+
+    def get_transactions(self, session: Session) -> Sequence[Transaction]:
+        return session.scalars(self.manager.filter()).unique().all()
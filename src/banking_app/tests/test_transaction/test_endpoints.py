@@ -0,0 +1,55 @@
+import pytest
+
+from fastapi import status
+from sqlalchemy.orm.session import Session
+
+from src.banking_app.tests.test_transaction.helpers import TransactionTestHelper
+
+
+@pytest.mark.run(order=2.04_00)
+class TestBatchCreate(TransactionTestHelper):
+
+    def test_retried_batch_isnt_inserted_twice(self, session: Session, cards):
+        card_number = cards[0].card_number
+        json = [
+            self.get_transaction_json(card_number, f'{i}.00', idempotency_key=f'key-{i}')
+            for i in range(1, 4)
+        ]
+
+        response = self.client.post(f'{self.prefix}/batch', json=json)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json() == dict(received=3, inserted=3, duplicates=0)
+
+        # The whole batch is retried together with one new transaction.
+        json.append(self.get_transaction_json(card_number, '4.00', idempotency_key='key-4'))
+        response = self.client.post(f'{self.prefix}/batch', json=json)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json() == dict(received=4, inserted=1, duplicates=3)
+
+        instances = self.get_transactions(session)
+        assert sorted(i.idempotency_key for i in instances) == ['key-1', 'key-2', 'key-3', 'key-4']
+
+    def test_repeated_key_inside_of_batch(self, session: Session, cards):
+        card_number = cards[0].card_number
+        json = [
+            self.get_transaction_json(card_number, '1.00', idempotency_key='key'),
+            self.get_transaction_json(card_number, '1.00', idempotency_key='key'),
+        ]
+
+        response = self.client.post(f'{self.prefix}/batch', json=json)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json() == dict(received=2, inserted=1, duplicates=1)
+        assert len(self.get_transactions(session)) == 1
+
+    def test_unexistent_card(self, session: Session, cards):
+        unexistent = '9' * 16
+        json = [
+            self.get_transaction_json(cards[0].card_number, '1.00', idempotency_key='key-1'),
+            self.get_transaction_json(unexistent, '2.00', idempotency_key='key-2'),
+        ]
+
+        response = self.client.post(f'{self.prefix}/batch', json=json)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {'detail': f'Card with card_number=[\'{unexistent}\'] not found.'}
+        # Batch is rejected before anything is inserted.
+        assert len(self.get_transactions(session)) == 0
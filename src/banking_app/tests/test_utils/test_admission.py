@@ -0,0 +1,79 @@
+import anyio
+import pytest
+
+from src.banking_app.conf import RoutePriority
+from src.banking_app.utils.admission import AdmissionController
+from src.banking_app.utils.admission import AdmissionMiddleware
+from src.banking_app.utils.admission import classify_route
+
+
+LIST_ROUTE = 'GET /status/list'
+POINT_ROUTE = 'GET /clients/{client_id}'
+WRITE_ROUTE = 'POST /balances/'
+
+
+@pytest.mark.run(order=3.03_00)
+class TestAdmissionController:
+
+    def test_classify_route(self):
+        assert classify_route('GET', '/clients/{client_id}') == RoutePriority.POINT_READ
+        assert classify_route('PATCH', '/clients/{client_id}') == RoutePriority.WRITE
+        assert classify_route('GET', '/status/list') == RoutePriority.LIST
+
+    def test_lists_with_path_parameters(self):
+        get_priority = AdmissionMiddleware._get_priority
+        assert get_priority('GET /clients/{client_id}/balance-history') == RoutePriority.LIST
+        assert get_priority('GET /cards/{card_number}/transactions') == RoutePriority.LIST
+        assert get_priority('GET /clients/{client_id}') == RoutePriority.POINT_READ
+
+    def test_priority_order(self):
+        controller = AdmissionController(capacity=1)
+        admitted = list()
+
+        async def request(route: str, priority: RoutePriority) -> None:
+            await controller.acquire(route, priority)
+            admitted.append(priority)
+            await anyio.sleep(0)
+            controller.release(route, priority)
+
+        async def main():
+            await controller.acquire(LIST_ROUTE, RoutePriority.LIST)
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(request, LIST_ROUTE, RoutePriority.LIST)
+                tg.start_soon(request, WRITE_ROUTE, RoutePriority.WRITE)
+                tg.start_soon(request, POINT_ROUTE, RoutePriority.POINT_READ)
+                await anyio.sleep(0.01)
+                assert controller.waiting == 3
+                controller.release(LIST_ROUTE, RoutePriority.LIST)
+
+        anyio.run(main)
+        assert admitted == [RoutePriority.POINT_READ, RoutePriority.WRITE, RoutePriority.LIST]
+        assert controller.active == 0
+
+    def test_class_limit_skips_blocked_waiter(self):
+        controller = AdmissionController(capacity=3, class_limits={RoutePriority.LIST: 1})
+
+        async def main():
+            await controller.acquire(LIST_ROUTE, RoutePriority.LIST)
+            with pytest.raises(TimeoutError):
+                with anyio.fail_after(0.01):
+                    await controller.acquire(LIST_ROUTE, RoutePriority.LIST)
+            # Point read isn't queued behind the list, which is at its limit.
+            await controller.acquire(POINT_ROUTE, RoutePriority.POINT_READ)
+
+        anyio.run(main)
+        assert controller.active == 2
+        assert controller.waiting == 0
+
+    def test_route_limit_and_timeout(self):
+        controller = AdmissionController(capacity=3, route_limits={LIST_ROUTE: 1}, timeout=0.01)
+
+        async def main():
+            await controller.acquire(LIST_ROUTE, RoutePriority.LIST)
+            with pytest.raises(TimeoutError):
+                await controller.acquire(LIST_ROUTE, RoutePriority.LIST)
+            await controller.acquire('GET /clients/list', RoutePriority.LIST)
+
+        anyio.run(main)
+        assert controller.route_active == {LIST_ROUTE: 1, 'GET /clients/list': 1}
+        assert controller.waiting == 0
@@ -0,0 +1,224 @@
+import pytest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from threading import Barrier
+from threading import Thread
+
+from time import perf_counter
+from time import sleep
+
+from unittest.mock import MagicMock
+
+from src.banking_app.utils.admission import AdmissionController
+from src.banking_app.utils.admission import AdmissionMiddleware
+from src.banking_app.utils.metrics import Histogram
+from src.banking_app.utils.metrics import MeasuredQueuePool
+from src.banking_app.utils.metrics import MetricsRegistry
+from src.banking_app.utils.metrics import QueryMetricsMiddleware
+from src.banking_app.utils.metrics import QueryStats
+from src.banking_app.utils.metrics import current_query_stats
+from src.banking_app.utils.metrics import instrument_engine
+from src.banking_app.utils.single_flight import SingleFlightMiddleware
+from src.banking_app.utils.single_flight import single_flight
+
+
+@pytest.mark.run(order=3.00_00)
+class TestHistogram:
+
+    def test_observe(self):
+        histogram = Histogram(buckets=(1, 5, 10))
+        [histogram.observe(v) for v in (0, 1, 2, 5, 11)]
+
+        # Value equal to the bucket bound is counted in this bucket.
+        assert histogram.counts == [2, 2, 0, 1]
+        assert histogram.count == 5
+        assert histogram.sum == 19
+
+    def test_render_cumulative_buckets(self):
+        histogram = Histogram(buckets=(1, 5))
+        [histogram.observe(v) for v in (1, 3, 7)]
+
+        lines = histogram.render('name', 'route="/"')
+        assert lines == [
+            'name_bucket{route="/",le="1"} 1',
+            'name_bucket{route="/",le="5"} 2',
+            'name_bucket{route="/",le="+Inf"} 3',
+            'name_sum{route="/"} 11.0',
+            'name_count{route="/"} 3',
+        ]
+
+    def test_render_without_labels(self):
+        histogram = Histogram(buckets=(1,))
+        histogram.observe(2)
+
+        assert histogram.render('name') == [
+            'name_bucket{le="1"} 0',
+            'name_bucket{le="+Inf"} 1',
+            'name_sum 2.0',
+            'name_count 1',
+        ]
+
+
+@pytest.mark.run(order=3.00_01)
+class TestMetricsRegistry:
+
+    def test_observe_request(self):
+        registry = MetricsRegistry(prefix='test')
+        stats = QueryStats(queries=3, db_time=0.002, rows=9)
+        registry.observe_request('GET', '/clients/{client_id}', 200, 0.01, stats)
+        registry.observe_request('GET', '/clients/{client_id}', 200, 0.01, stats)
+
+        text = registry.render()
+        labels = 'method="GET",route="/clients/{client_id}",status="200"'
+        assert '# TYPE test_db_queries_per_request histogram' in text
+        assert f'test_db_queries_per_request_sum{{{labels}}} 6.0' in text
+        assert f'test_db_rows_per_request_count{{{labels}}} 2' in text
+
+    def test_gauge(self):
+        registry = MetricsRegistry(prefix='test')
+        in_use = [3]
+        registry.add_gauge('db_pool_checked_out', 'Connections in use.', lambda: in_use[0])
+
+        assert 'test_db_pool_checked_out 3' in registry.render()
+        in_use[0] = 5
+        # Value is read on each render.
+        assert 'test_db_pool_checked_out 5' in registry.render()
+
+    def test_reset(self):
+        registry = MetricsRegistry(prefix='test')
+        registry.observe_request('GET', '/status/list', 200, 0.01, QueryStats())
+        registry.reset()
+        assert registry.routes == dict()
+
+
+@pytest.mark.run(order=3.00_02)
+class TestMeasuredQueuePool:
+
+    def test_wait_time_on_timeout(self):
+        pool = MeasuredQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0.01)
+        connection = pool.connect()
+
+        with pytest.raises(PoolTimeoutError):
+            pool.connect()
+        assert pool.waiting == 0
+        assert pool.wait_time.count == 2
+        assert pool.wait_time.sum >= 0.01
+
+        connection.close()
+        pool.connect().close()
+        assert pool.wait_time.count == 3
+
+    def test_waiting_counts_only_blocked_checkouts(self):
+        pool = MeasuredQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=5)
+        connection = pool.connect()
+        assert pool.waiting == 0
+
+        blocked = Thread(target=lambda: pool.connect().close())
+        blocked.start()
+        deadline = perf_counter() + 1
+        while pool.waiting == 0 and perf_counter() < deadline:
+            sleep(0.001)
+        assert pool.waiting == 1
+
+        connection.close()
+        blocked.join()
+        assert pool.waiting == 0
+
+    def test_recreate_keeps_wait_time(self):
+        pool = MeasuredQueuePool(MagicMock, pool_size=1, max_overflow=0)
+        pool.connect().close()
+
+        recreated = pool.recreate()
+        assert recreated.wait_time is pool.wait_time
+        assert recreated.waiting == 0
+
+    def test_overflow_of_idle_pool(self):
+        engine = create_engine('sqlite://', poolclass=MeasuredQueuePool, pool_size=5, max_overflow=2)
+        registry = MetricsRegistry(prefix='test')
+        instrument_engine(engine, registry)
+
+        assert engine.pool.overflow() < 0
+        assert 'test_db_pool_overflow 0\n' in registry.render()
+        engine.dispose()
+
+
+@pytest.mark.run(order=3.00_03)
+class TestInstrumentEngine:
+
+    def test_failed_statement_isnt_counted(self):
+        engine = create_engine('sqlite://')
+        instrument_engine(engine, MetricsRegistry(prefix='test'))
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        try:
+            with engine.connect() as connection:
+                with pytest.raises(OperationalError):
+                    connection.execute(text('SELECT * FROM unexistent_table'))
+                start = perf_counter()
+                connection.execute(text('SELECT 1'))
+                elapsed = perf_counter() - start
+        finally:
+            current_query_stats.reset(token)
+            engine.dispose()
+
+        assert stats.queries == 1
+        # Time of the failed statement isn't attributed to the next one.
+        assert 0 <= stats.db_time <= elapsed
+
+
+@pytest.mark.run(order=3.00_04)
+class TestQueryMetricsMiddleware:
+
+    @staticmethod
+    def get_app() -> FastAPI:
+        app = FastAPI()
+
+        @app.get('/items/{item_id}')
+        @single_flight
+        def get_item(item_id: int):
+            sleep(0.2)
+            return {'item_id': item_id}
+
+        return app
+
+    def test_coalesced_requests_keep_route(self):
+        registry = MetricsRegistry(prefix='test')
+        app = self.get_app()
+        app.add_middleware(SingleFlightMiddleware)
+        app.add_middleware(QueryMetricsMiddleware, registry=registry)
+        barrier = Barrier(3)
+
+        def get(client: TestClient) -> None:
+            barrier.wait()
+            client.get('/items/1')
+
+        with TestClient(app) as client:
+            threads = [Thread(target=get, args=(client,)) for _ in range(3)]
+            [thread.start() for thread in threads]
+            [thread.join() for thread in threads]
+
+        # Followers are answered before routing, but aren't counted as unmatched.
+        assert list(registry.routes) == [('GET', '/items/{item_id}', 200)]
+        assert registry.routes['GET', '/items/{item_id}', 200].histograms['request_duration_seconds'].count == 3
+
+    def test_rejected_requests_keep_route(self):
+        registry = MetricsRegistry(prefix='test')
+        app = self.get_app()
+        app.add_middleware(AdmissionMiddleware, controller=AdmissionController(capacity=0, timeout=0.01))
+        app.add_middleware(QueryMetricsMiddleware, registry=registry)
+
+        with TestClient(app) as client:
+            assert client.get('/items/1').status_code == 503
+            assert client.get('/unknown').status_code == 404
+
+        assert list(registry.routes) == [
+            ('GET', '/items/{item_id}', 503),
+            ('GET', '<unmatched>', 404),
+        ]
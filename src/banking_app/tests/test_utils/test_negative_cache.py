@@ -0,0 +1,50 @@
+import pytest
+
+from time import sleep
+
+from src.banking_app.models.client import Client
+from src.banking_app.utils.exceptions import BaseExceptionRaiser
+from src.banking_app.utils.exceptions import ErrorType
+from src.banking_app.utils.negative_cache import NegativeCache
+
+
+def get_raiser(client_id: int) -> BaseExceptionRaiser:
+    return BaseExceptionRaiser(
+        model=Client,
+        error_type=ErrorType.NOT_FOUND_404,
+        kwargs=dict(client_id=client_id),
+    )
+
+
+@pytest.mark.run(order=3.06_00)
+class TestNegativeCache:
+
+    def test_prerendered_response(self):
+        cache = NegativeCache(capacity=10, ttl=60)
+        assert cache.get(('Client', 1)) is None
+
+        cache.add(('Client', 1), get_raiser(1), cache.generation)
+        response = cache.get(('Client', 1))
+        assert response.status_code == 404
+        assert response.body == b'{"detail":"Client with client_id=1 not found."}'
+
+    def test_ttl_and_capacity(self):
+        cache = NegativeCache(capacity=2, ttl=0.05)
+        [cache.add(('Client', i), get_raiser(i), cache.generation) for i in range(3)]
+        # The least recently used key is evicted.
+        assert cache.get(('Client', 0)) is None
+        assert cache.get(('Client', 2)) is not None
+
+        sleep(0.05)
+        assert cache.get(('Client', 2)) is None
+
+    def test_discard(self):
+        cache = NegativeCache(capacity=10, ttl=60)
+        cache.add(('Client', 1), get_raiser(1), cache.generation)
+        generation = cache.generation
+
+        cache.discard([('Client', 1)])
+        assert cache.get(('Client', 1)) is None
+        # Miss of lookup started before the discard may be already outdated.
+        cache.add(('Client', 1), get_raiser(1), generation)
+        assert cache.get(('Client', 1)) is None
@@ -0,0 +1,55 @@
+import marshal
+import pytest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.banking_app.conf import settings
+from src.banking_app.utils.profiling import ProfilingMiddleware
+
+
+ADMIN_TOKEN = 'test_admin_token'
+
+app = FastAPI()
+app.add_middleware(ProfilingMiddleware)
+
+
+@app.get('/busy')
+def busy():
+    return sum(i * i for i in range(200_000))
+
+
+@pytest.mark.run(order=3.02_00)
+class TestProfilingMiddleware:
+    client = TestClient(app)
+
+    @pytest.fixture(autouse=True)
+    def admin_token(self, monkeypatch):
+        monkeypatch.setattr(settings, 'ADMIN_TOKEN', ADMIN_TOKEN)
+
+    def test_not_profiled_without_header(self):
+        response = self.client.get('/busy')
+        assert response.status_code == 200
+        assert 'X-Profiled-Status' not in response.headers
+
+    def test_forbidden_without_valid_token(self):
+        response = self.client.get('/busy', headers={'X-Profile': 'pstats', 'X-Admin-Token': 'wrong'})
+        assert response.status_code == 403
+
+    def test_unknown_format(self):
+        response = self.client.get('/busy', headers={'X-Profile': 'svg', 'X-Admin-Token': ADMIN_TOKEN})
+        assert response.status_code == 400
+
+    def test_pstats(self):
+        response = self.client.get('/busy', headers={'X-Profile': 'pstats', 'X-Admin-Token': ADMIN_TOKEN})
+        assert response.status_code == 200
+        assert response.headers['X-Profiled-Status'] == '200'
+        assert 'profile.pstats' in response.headers['Content-Disposition']
+        assert isinstance(marshal.loads(response.content), dict)
+
+    def test_collapsed(self):
+        response = self.client.get('/busy', headers={'X-Profile': 'collapsed', 'X-Admin-Token': ADMIN_TOKEN})
+        assert response.status_code == 200
+        assert response.headers['X-Profiled-Status'] == '200'
+        # Sync endpoint runs in the threadpool, which is sampled too.
+        assert 'test_profiling.py:busy' in response.text
@@ -0,0 +1,50 @@
+import pytest
+
+from starlette.requests import Request
+
+from unittest.mock import MagicMock
+
+from src.banking_app.conf import settings
+from src.banking_app.main import banking_app
+from src.banking_app.routers.base import LIST_STATEMENT_TIMEOUT_MS
+from src.banking_app.utils.query_deadline import QUERY_DEADLINE_KEY
+from src.banking_app.utils.query_deadline import QueryDeadline
+from src.banking_app.utils.query_deadline import apply_query_deadline
+from src.banking_app.utils.query_deadline import get_query_deadline
+
+
+PATH = '/balances/list-balances-between'
+ROUTE = f'GET {PATH}'
+
+
+def get_request(path: str) -> Request:
+    return Request({'type': 'http', 'method': 'GET', 'path': path, 'app': banking_app, 'headers': []})
+
+
+@pytest.mark.run(order=3.04_00)
+class TestQueryDeadline:
+
+    def test_decorated_endpoint(self):
+        deadline = get_query_deadline(get_request(PATH))
+        assert deadline == QueryDeadline(statement_timeout_ms=LIST_STATEMENT_TIMEOUT_MS)
+
+    def test_settings_override_decorator(self, monkeypatch):
+        monkeypatch.setattr(settings, 'ROUTE_STATEMENT_TIMEOUTS_MS', {ROUTE: 500})
+        monkeypatch.setattr(settings, 'ROUTE_LOCK_TIMEOUTS_MS', {ROUTE: 100})
+
+        deadline = get_query_deadline(get_request(PATH))
+        assert deadline == QueryDeadline(statement_timeout_ms=500, lock_timeout_ms=100)
+
+    def test_unmatched_route(self):
+        assert get_query_deadline(get_request('/unknown')) == QueryDeadline()
+
+    def test_apply_query_deadline(self):
+        session, connection = MagicMock(info=dict()), MagicMock()
+        apply_query_deadline(session, MagicMock(), connection)
+        connection.execute.assert_not_called()
+
+        session.info[QUERY_DEADLINE_KEY] = QueryDeadline(lock_timeout_ms=100)
+        apply_query_deadline(session, MagicMock(), connection)
+        statement, parameters = connection.execute.call_args.args
+        assert str(statement) == "SELECT set_config('lock_timeout', :lock_timeout, true)"
+        assert parameters == {'lock_timeout': '100'}
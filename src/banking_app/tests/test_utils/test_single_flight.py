@@ -0,0 +1,92 @@
+import pytest
+
+from fastapi import FastAPI
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from threading import Barrier
+from threading import Thread
+
+from time import sleep
+
+from src.banking_app.utils.metrics import MetricsRegistry
+from src.banking_app.utils.single_flight import SingleFlightMiddleware
+from src.banking_app.utils.single_flight import single_flight
+
+
+REQUESTS = 5
+
+
+def get_app(calls: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/shared')
+    @single_flight
+    def shared(value: int = 0):
+        calls.append(value)
+        sleep(0.2)
+        return {'value': value}
+
+    @app.get('/not-shared')
+    def not_shared():
+        calls.append(None)
+        sleep(0.2)
+        return {}
+
+    @app.get('/failing')
+    @single_flight
+    def failing():
+        calls.append(None)
+        sleep(0.2)
+        raise HTTPException(status_code=404)
+
+    return app
+
+
+def get_concurrently(client: TestClient, urls: list[str]) -> list[int]:
+    barrier = Barrier(len(urls))
+    status_codes = list()
+
+    def get(url: str) -> None:
+        barrier.wait()
+        status_codes.append(client.get(url).status_code)
+
+    threads = [Thread(target=get, args=(url,)) for url in urls]
+    [thread.start() for thread in threads]
+    [thread.join() for thread in threads]
+    return status_codes
+
+
+@pytest.mark.run(order=3.05_00)
+class TestSingleFlightMiddleware:
+
+    def test_identical_requests_are_coalesced(self):
+        calls, registry = list(), MetricsRegistry(prefix='test')
+        app = get_app(calls)
+        app.add_middleware(SingleFlightMiddleware, registry=registry)
+
+        with TestClient(app) as client:
+            status_codes = get_concurrently(client, ['/shared?value=1'] * REQUESTS + ['/shared?value=2'])
+
+        assert status_codes == [200] * (REQUESTS + 1)
+        assert sorted(calls) == [1, 2]
+        assert 'test_single_flight_coalesced_total 4' in registry.render()
+
+    def test_not_opted_in_route(self):
+        calls = list()
+        app = get_app(calls)
+        app.add_middleware(SingleFlightMiddleware)
+
+        with TestClient(app) as client:
+            get_concurrently(client, ['/not-shared'] * REQUESTS)
+        assert len(calls) == REQUESTS
+
+    def test_error_response_is_shared(self):
+        calls = list()
+        app = get_app(calls)
+        app.add_middleware(SingleFlightMiddleware)
+
+        with TestClient(app) as client:
+            status_codes = get_concurrently(client, ['/failing'] * REQUESTS)
+        assert status_codes == [404] * REQUESTS
+        assert len(calls) == 1
@@ -0,0 +1,63 @@
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.banking_app.utils.slow_queries import SlowQueryRecorder
+from src.banking_app.utils.slow_queries import get_parameters_shape
+from src.banking_app.utils.slow_queries import normalize_statement
+
+
+@pytest.mark.run(order=3.01_00)
+class TestFingerprint:
+
+    def test_normalize_statement(self):
+        statement = (
+            'SELECT client.client_id FROM client\n'
+            "WHERE client.status = %(status_1)s AND client.name = 'Bob' AND client.age > 18\n"
+            'AND client.client_id IN (%(client_id_1_1)s, %(client_id_1_2)s) LIMIT %(param_1)s'
+        )
+        assert normalize_statement(statement) == (
+            'SELECT client.client_id FROM client '
+            'WHERE client.status = ? AND client.name = ? AND client.age > ? '
+            'AND client.client_id IN (?+) LIMIT ?'
+        )
+
+    def test_normalize_statement_ignores_amount_of_values(self):
+        one_row = 'INSERT INTO status (status, description) VALUES (%(status_m0)s, %(description_m0)s)'
+        two_rows = (
+            'INSERT INTO status (status, description) '
+            'VALUES (%(status_m0)s, %(description_m0)s), (%(status_m1)s, %(description_m1)s)'
+        )
+        assert normalize_statement(one_row) == normalize_statement(two_rows)
+
+    def test_normalize_statement_keeps_identifiers(self):
+        statement = 'SELECT anon_1.count_1 FROM anon_1'
+        assert normalize_statement(statement) == statement
+
+    def test_get_parameters_shape(self):
+        parameters = {'status_1': 100, 'name': 'Bob', 'trans_ids': [1, 2, 3]}
+        assert get_parameters_shape(parameters) == {
+            'status_1': 'int',
+            'name': 'str',
+            'trans_ids': 'list[3]',
+        }
+        assert get_parameters_shape((1, 'Bob')) == {'0': 'int', '1': 'str'}
+        assert get_parameters_shape(None) == dict()
+
+
+@pytest.mark.run(order=3.01_01)
+class TestSlowQueryRecorder:
+
+    def test_failed_statement_isnt_recorded(self):
+        engine = create_engine('sqlite://')
+        log = SlowQueryRecorder(threshold_ms=0, capacity=10, explain=False)
+        log.instrument(engine)
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text('SELECT * FROM unexistent_table'))
+            connection.execute(text('SELECT 1'))
+        engine.dispose()
+
+        assert [r.statement for r in log.get_records()] == ['SELECT ?']
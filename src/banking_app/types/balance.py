@@ -0,0 +1,12 @@
+from src.banking_app.types.general import BaseEnum
+
+
+class TimeBucket(str, BaseEnum):
+    DAY = 'day'
+    WEEK = 'week'
+    MONTH = 'month'
+
+
+class BalanceGroupField(str, BaseEnum):
+    CLIENT_ID = 'client_id'
+    ACTUAL_FLAG = 'actual_flag'
@@ -4,3 +4,9 @@ from src.banking_app.types.general import BaseEnum
 class SexEnum(str, BaseEnum):
     MALE = 'MALE'
     FEMALE = 'FEMALE'
+
+
+class ClientGroupField(str, BaseEnum):
+    STATUS = 'status'
+    VIP_FLAG = 'VIP_flag'
+    SEX = 'sex'
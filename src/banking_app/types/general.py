@@ -24,3 +24,15 @@ class BaseEnum(Enum):
 
     def __repr__(self):
         return f'{type(self).__name__}.{self.name}'
+
+
+class AggregateFunction(str, BaseEnum):
+    COUNT = 'count'
+    SUM = 'sum'
+    MIN = 'min'
+    MAX = 'max'
+
+
+class ConflictAction(str, BaseEnum):
+    UPDATE = 'update'
+    SKIP = 'skip'
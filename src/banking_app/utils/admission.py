@@ -0,0 +1,193 @@
+import anyio
+
+from bisect import insort
+
+from collections import Counter
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from itertools import count
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from src.banking_app.conf import RoutePriority
+from src.banking_app.conf import settings
+from src.banking_app.routers.base import match_api_route
+from src.banking_app.utils.exceptions import ErrorType
+from src.banking_app.utils.metrics import MetricsRegistry
+from src.banking_app.utils.metrics import metrics
+
+
+READ_METHODS = frozenset({'GET', 'HEAD'})
+
+
+@dataclass(eq=False)
+class _Waiter:
+    route: str
+    priority: RoutePriority
+    seq: int
+    event: anyio.Event = field(default_factory=anyio.Event)
+    admitted: bool = False
+
+
+class AdmissionController:
+    """
+    Limit amount of requests handled at once. Waiting requests are admitted
+    in priority order, a waiter whose class or route is at its limit is
+    skipped, so it doesn't block requests of other routes behind it.
+
+    Lives in the event loop thread, so counters need no locks.
+    """
+
+    def __init__(
+            self,
+            capacity: int,
+            class_limits: dict[RoutePriority, int] | None = None,
+            route_limits: dict[str, int] | None = None,
+            timeout: float | None = None,
+    ):
+        self.capacity = capacity
+        self.class_limits = class_limits or dict()
+        self.route_limits = route_limits or dict()
+        self.timeout = timeout
+        self.active = 0
+        self.class_active: Counter[RoutePriority] = Counter()
+        self.route_active: Counter[str] = Counter()
+        self._waiters: list[_Waiter] = list()
+        self._seq = count()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def instrument(self, registry: MetricsRegistry = metrics) -> None:
+        registry.add_gauge('admission_active', 'Requests admitted by admission control.', lambda: self.active)
+        registry.add_gauge('admission_waiting', 'Requests waiting for admission.', lambda: self.waiting)
+
+    async def acquire(self, route: str, priority: RoutePriority) -> None:
+        waiter = _Waiter(route=route, priority=priority, seq=next(self._seq))
+        insort(self._waiters, waiter, key=lambda w: (w.priority.rank, w.seq))
+        self._admit_waiters()
+        if waiter.admitted:
+            return
+        try:
+            with anyio.fail_after(self.timeout):
+                await waiter.event.wait()
+        except BaseException:
+            if waiter.admitted:
+                # Admitted at the moment of timeout or cancellation.
+                self.release(route, priority)
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, route: str, priority: RoutePriority) -> None:
+        self.active -= 1
+        self.class_active[priority] -= 1
+        self.route_active[route] -= 1
+        self._admit_waiters()
+
+    def _can_admit(self, route: str, priority: RoutePriority) -> bool:
+        class_limit = self.class_limits.get(priority)
+        route_limit = self.route_limits.get(route)
+        if self.active >= self.capacity:
+            return False
+        if class_limit is not None and self.class_active[priority] >= class_limit:
+            return False
+        return route_limit is None or self.route_active[route] < route_limit
+
+    def _admit_waiters(self) -> None:
+        for waiter in list(self._waiters):
+            if self.active >= self.capacity:
+                return
+            if not self._can_admit(waiter.route, waiter.priority):
+                continue
+            self._waiters.remove(waiter)
+            self.active += 1
+            self.class_active[waiter.priority] += 1
+            self.route_active[waiter.route] += 1
+            waiter.admitted = True
+            waiter.event.set()
+
+
+def classify_route(method: str, path: str) -> RoutePriority:
+    """
+    Writes are any not read methods, reads of a single object are reads with
+    path parameters, e.g. `GET /clients/{client_id}`, the others are lists.
+    Reads of many rows of one object, e.g. `GET /clients/{client_id}/daily`,
+    are lists too, they are set in `ADMISSION_ROUTE_PRIORITIES` defaults.
+    """
+    if method not in READ_METHODS:
+        return RoutePriority.WRITE
+    if '{' in path:
+        return RoutePriority.POINT_READ
+    return RoutePriority.LIST
+
+
+class AdmissionMiddleware:
+    """
+    Pure ASGI middleware which matches request to a route before routers do
+    and passes it through `AdmissionController`. Requests waiting longer than
+    `ADMISSION_QUEUE_TIMEOUT` get 503 with `Retry-After`.
+
+    Only API routes are limited, docs and routes from `ADMISSION_EXEMPT_ROUTES`
+    (keys like `GET /metrics`) are passed through.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or (route := self._get_route_key(scope)) is None:
+            await self.app(scope, receive, send)
+            return
+
+        priority = self._get_priority(route)
+        try:
+            await self.controller.acquire(route, priority)
+        except TimeoutError:
+            await self._reject(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route, priority)
+
+    @staticmethod
+    def _get_route_key(scope: Scope) -> str | None:
+        if (route := match_api_route(scope)) is None:
+            return None
+        key = f'{scope["method"]} {route.path}'
+        return None if key in settings.ADMISSION_EXEMPT_ROUTES else key
+
+    @staticmethod
+    def _get_priority(route: str) -> RoutePriority:
+        if (priority := settings.ADMISSION_ROUTE_PRIORITIES.get(route)) is not None:
+            return priority
+        method, path = route.split(' ', 1)
+        return classify_route(method, path)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        error_detail = ErrorType.ADMISSION_TIMEOUT_503.value
+        detail = error_detail.error_message.detail.format(timeout=f'{settings.ADMISSION_QUEUE_TIMEOUT:g}')
+        response = JSONResponse(
+            status_code=error_detail.status_code,
+            content={'detail': detail},
+            headers={'Retry-After': str(settings.RETRY_AFTER_SECONDS)},
+        )
+        await response(scope, receive, send)
+
+
+admission_controller = AdmissionController(
+    capacity=settings.admission_concurrency,
+    class_limits=settings.ADMISSION_CLASS_LIMITS,
+    route_limits=settings.ADMISSION_ROUTE_LIMITS,
+    timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+)
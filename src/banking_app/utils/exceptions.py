@@ -1,7 +1,9 @@
 from enum import Enum
 
 from fastapi import HTTPException
+from fastapi import Request
 from fastapi import status
+from fastapi.responses import JSONResponse
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -10,9 +12,18 @@ from typing import Any
 from typing import NamedTuple
 from typing import NoReturn
 
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.banking_app.conf import settings
 from src.banking_app.models.base import Base
 
 
+# SQLSTATE of errors raised by statement_timeout and lock_timeout.
+QUERY_CANCELED = '57014'
+LOCK_NOT_AVAILABLE = '55P03'
+
+
 class BaseErrorMessage(BaseModel):
     detail: str = Field(default='', examples=[''])
 
@@ -40,6 +51,41 @@ class EmptyBodyOnPatchMessage(BaseErrorMessage):
     )
 
 
+class InvalidCursorMessage(BaseErrorMessage):
+    detail: str = Field(
+        default='{model} can\'t be paginated from {kwargs}, cursor is invalid.',
+        examples=['{model} can\'t be paginated from cursor={value}, cursor is invalid.'],
+    )
+
+
+class PoolTimeoutMessage(BaseErrorMessage):
+    detail: str = Field(
+        default='Service is overloaded, no database connection became free in {timeout} seconds.',
+        examples=['Service is overloaded, no database connection became free in 5 seconds.'],
+    )
+
+
+class AdmissionTimeoutMessage(BaseErrorMessage):
+    detail: str = Field(
+        default='Service is overloaded, request wasn\'t admitted in {timeout} seconds.',
+        examples=['Service is overloaded, request wasn\'t admitted in 5 seconds.'],
+    )
+
+
+class QueryTimeoutMessage(BaseErrorMessage):
+    detail: str = Field(
+        default='Query exceeded its deadline and was canceled.',
+        examples=['Query exceeded its deadline and was canceled.'],
+    )
+
+
+class LockTimeoutMessage(BaseErrorMessage):
+    detail: str = Field(
+        default='Data is locked by another request, lock wasn\'t acquired in time.',
+        examples=['Data is locked by another request, lock wasn\'t acquired in time.'],
+    )
+
+
 class ErrorTypeDetail(NamedTuple):
     status_code: int
     error_message: BaseErrorMessage
@@ -58,6 +104,26 @@ class ErrorType(Enum):
         status_code=status.HTTP_400_BAD_REQUEST,
         error_message=EmptyBodyOnPatchMessage(),
     )
+    INVALID_CURSOR_400 = ErrorTypeDetail(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        error_message=InvalidCursorMessage(),
+    )
+    POOL_TIMEOUT_503 = ErrorTypeDetail(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        error_message=PoolTimeoutMessage(),
+    )
+    ADMISSION_TIMEOUT_503 = ErrorTypeDetail(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        error_message=AdmissionTimeoutMessage(),
+    )
+    QUERY_TIMEOUT_504 = ErrorTypeDetail(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        error_message=QueryTimeoutMessage(),
+    )
+    LOCK_TIMEOUT_503 = ErrorTypeDetail(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        error_message=LockTimeoutMessage(),
+    )
 
 
 class BaseExceptionRaiser(BaseModel):
@@ -66,13 +132,18 @@ class BaseExceptionRaiser(BaseModel):
     kwargs: dict[str, Any]
 
     def raise_exception(self) -> NoReturn:
-        error_detail = self.error_type.value
-        status_code = error_detail.status_code
-        detail = error_detail.error_message.detail.format(
+        raise HTTPException(status_code=self.status_code, detail=self.detail)
+
+    @property
+    def status_code(self) -> int:
+        return self.error_type.value.status_code
+
+    @property
+    def detail(self) -> str:
+        return self.error_type.value.error_message.detail.format(
             model=self._model,
             kwargs=self._kwargs,
         )
-        raise HTTPException(status_code=status_code, detail=detail)
 
     @property
     def _model(self) -> str:
@@ -81,3 +152,34 @@ class BaseExceptionRaiser(BaseModel):
     @property
     def _kwargs(self) -> str:
         return ', '.join([f'{k}={v}'for k, v in self.kwargs.items()])
+
+
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError) -> JSONResponse:
+    """Respond 503 fast when connection pool checkout exceeds `ENGINE_POOL_TIMEOUT`."""
+
+    error_detail = ErrorType.POOL_TIMEOUT_503.value
+    detail = error_detail.error_message.detail.format(timeout=f'{settings.ENGINE_POOL_TIMEOUT:g}')
+    return JSONResponse(
+        status_code=error_detail.status_code,
+        content={'detail': detail},
+        headers={'Retry-After': str(settings.RETRY_AFTER_SECONDS)},
+    )
+
+
+async def query_timeout_handler(request: Request, exc: OperationalError) -> JSONResponse:
+    """Respond 504 on statement_timeout and 503 on lock_timeout, other errors are re-raised."""
+
+    sqlstate = getattr(exc.orig, 'sqlstate', None)
+    if sqlstate == QUERY_CANCELED:
+        error_detail = ErrorType.QUERY_TIMEOUT_504.value
+        headers = None
+    elif sqlstate == LOCK_NOT_AVAILABLE:
+        error_detail = ErrorType.LOCK_TIMEOUT_503.value
+        headers = {'Retry-After': str(settings.RETRY_AFTER_SECONDS)}
+    else:
+        raise exc
+    return JSONResponse(
+        status_code=error_detail.status_code,
+        content={'detail': error_detail.error_message.detail},
+        headers=headers,
+    )
@@ -0,0 +1,315 @@
+from anyio import CapacityLimiter
+
+from bisect import bisect_left
+
+from contextvars import ContextVar
+
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from threading import Lock
+
+from time import perf_counter
+
+from typing import Callable
+from typing import Sequence
+
+from src.banking_app.routers.base import match_api_route
+
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERIES_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+ROWS_BUCKETS = (0, 1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """DB usage of a single request."""
+
+    queries: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    'current_query_stats',
+    default=None,
+)
+
+
+class Histogram:
+    """Histogram with cumulative buckets as Prometheus expects them."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # The last one is +Inf.
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str = '') -> list[str]:
+        bucket_labels = f'{labels},' if labels else ''
+        labels = f'{{{labels}}}' if labels else ''
+        lines = list()
+        cumulative = 0
+        for bound, amount in zip(self.buckets, self.counts):
+            cumulative += amount
+            lines.append(f'{name}_bucket{{{bucket_labels}le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{bucket_labels}le="+Inf"}} {self.count}')
+        lines.append(f'{name}_sum{labels} {self.sum}')
+        lines.append(f'{name}_count{labels} {self.count}')
+        return lines
+
+
+class RouteMetrics:
+    """Histograms of all requests which were handled by the same route."""
+
+    HISTOGRAMS = {
+        'request_duration_seconds': (
+            'Request handling time.',
+            DURATION_BUCKETS,
+        ),
+        'db_queries_per_request': (
+            'Amount of SQL statements executed per request.',
+            QUERIES_BUCKETS,
+        ),
+        'db_time_seconds_per_request': (
+            'Total time spent in SQL statements per request.',
+            DURATION_BUCKETS,
+        ),
+        'db_rows_per_request': (
+            'Total amount of rows returned or affected by SQL statements per request.',
+            ROWS_BUCKETS,
+        ),
+    }
+
+    def __init__(self):
+        self.histograms = {
+            name: Histogram(buckets)
+            for name, (_, buckets) in self.HISTOGRAMS.items()
+        }
+
+    def observe(self, duration: float, stats: QueryStats) -> None:
+        self.histograms['request_duration_seconds'].observe(duration)
+        self.histograms['db_queries_per_request'].observe(stats.queries)
+        self.histograms['db_time_seconds_per_request'].observe(stats.db_time)
+        self.histograms['db_rows_per_request'].observe(stats.rows)
+
+
+class MetricsRegistry:
+    """In-process storage of per route metrics."""
+
+    def __init__(self, prefix: str = 'banking_app'):
+        self.prefix = prefix
+        self.routes: dict[tuple[str, str, int], RouteMetrics] = dict()
+        self.gauges: dict[str, tuple[str, Callable[[], float]]] = dict()
+        self.counters: dict[str, tuple[str, Callable[[], float]]] = dict()
+        self.histograms: dict[str, tuple[str, Histogram]] = dict()
+        self._lock = Lock()
+
+    def add_gauge(self, name: str, description: str, callback: Callable[[], float]) -> None:
+        """Register gauge which current value is returned by callback on render."""
+        self.gauges[name] = (description, callback)
+
+    def add_counter(self, name: str, description: str, callback: Callable[[], float]) -> None:
+        """Register counter which total is returned by callback on render."""
+        self.counters[name] = (description, callback)
+
+    def add_histogram(self, name: str, description: str, histogram: Histogram) -> None:
+        """Register histogram without labels, which is observed by its owner."""
+        self.histograms[name] = (description, histogram)
+
+    def observe_request(
+            self,
+            method: str,
+            route: str,
+            status_code: int,
+            duration: float,
+            stats: QueryStats,
+    ) -> None:
+        key = (method, route, status_code)
+        with self._lock:
+            if (route_metrics := self.routes.get(key)) is None:
+                route_metrics = self.routes[key] = RouteMetrics()
+            route_metrics.observe(duration, stats)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+
+        lines = list()
+        with self._lock:
+            for name, (description, _) in RouteMetrics.HISTOGRAMS.items():
+                full_name = f'{self.prefix}_{name}'
+                lines.append(f'# HELP {full_name} {description}')
+                lines.append(f'# TYPE {full_name} histogram')
+                for (method, route, status_code), metrics in self.routes.items():
+                    labels = f'method="{method}",route="{route}",status="{status_code}"'
+                    lines.extend(metrics.histograms[name].render(full_name, labels))
+        for name, (description, callback) in self.gauges.items():
+            full_name = f'{self.prefix}_{name}'
+            lines.append(f'# HELP {full_name} {description}')
+            lines.append(f'# TYPE {full_name} gauge')
+            lines.append(f'{full_name} {callback()}')
+        for name, (description, callback) in self.counters.items():
+            full_name = f'{self.prefix}_{name}'
+            lines.append(f'# HELP {full_name} {description}')
+            lines.append(f'# TYPE {full_name} counter')
+            lines.append(f'{full_name} {callback()}')
+        for name, (description, histogram) in self.histograms.items():
+            full_name = f'{self.prefix}_{name}'
+            lines.append(f'# HELP {full_name} {description}')
+            lines.append(f'# TYPE {full_name} histogram')
+            lines.extend(histogram.render(full_name))
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes.clear()
+
+
+metrics = MetricsRegistry()
+
+
+def instrument_engine(engine: Engine, registry: MetricsRegistry = metrics) -> None:
+    """
+    Attribute all statements executed by the engine to the current request
+    and expose usage of the engine connection pool.
+    """
+
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+    # Callbacks read engine.pool on each render, since pool is recreated on dispose.
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        registry.add_gauge('db_pool_size', 'Configured size of the connection pool.', lambda: engine.pool.size())
+        registry.add_gauge('db_pool_checked_out', 'Connections in use by requests.', lambda: engine.pool.checkedout())
+        # QueuePool.overflow() starts from -pool_size, it's negative until the pool is full.
+        registry.add_gauge(
+            'db_pool_overflow',
+            'Connections opened above pool size.',
+            lambda: max(engine.pool.overflow(), 0),
+        )
+    if isinstance(pool, MeasuredQueuePool):
+        registry.add_gauge('db_pool_waiting', 'Threads waiting for a connection.', lambda: engine.pool.waiting)
+        registry.add_histogram('db_pool_wait_seconds', 'Time spent waiting for a connection.', pool.wait_time)
+
+
+def instrument_threadpool(limiter: CapacityLimiter, registry: MetricsRegistry = metrics) -> None:
+    """Expose usage of the limiter of threads running sync endpoints."""
+
+    registry.add_gauge('threadpool_size', 'Max amount of threads running sync code.', lambda: limiter.total_tokens)
+    registry.add_gauge('threadpool_busy', 'Threads running sync code.', lambda: limiter.borrowed_tokens)
+    registry.add_gauge(
+        'threadpool_waiting',
+        'Sync calls waiting for a free thread.',
+        lambda: limiter.statistics().tasks_waiting,
+    )
+
+
+class MeasuredQueuePool(QueuePool):
+    """
+    QueuePool which counts threads blocked until a connection is returned and
+    measures checkout time of all connections.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.wait_time = Histogram(DURATION_BUCKETS)
+        self._measure_lock = Lock()
+
+    def recreate(self) -> 'MeasuredQueuePool':
+        pool = super().recreate()
+        pool.wait_time = self.wait_time
+        return pool
+
+    def _do_get(self):
+        # Only checkouts which can't be served at once wait, max_overflow=-1 means no limit.
+        blocked = -1 < self._max_overflow and self.size() + self._max_overflow <= self.checkedout()
+        with self._measure_lock:
+            self.waiting += blocked
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            with self._measure_lock:
+                self.waiting -= blocked
+                self.wait_time.observe(perf_counter() - start)
+
+
+# Start time is kept on the execution context of the statement, since
+# after_cursor_execute isn't called for failed statements.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = perf_counter() - context._query_start_time
+    if (stats := current_query_stats.get()) is None:
+        return
+    stats.queries += 1
+    stats.db_time += elapsed
+    stats.rows += max(cursor.rowcount, 0)
+
+
+class QueryMetricsMiddleware:
+    """
+    Pure ASGI middleware (no per request task or stream overhead) which collects
+    DB usage of each request and stores it into `metrics` under the template
+    path of the matched route, e.g. `/clients/{client_id}`.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        status_code = 500
+        start = perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_query_stats.reset(token)
+            self.registry.observe_request(
+                method=scope['method'],
+                route=self._get_route_path(scope),
+                status_code=status_code,
+                duration=perf_counter() - start,
+                stats=stats,
+            )
+
+    @staticmethod
+    def _get_route_path(scope: Scope) -> str:
+        # Resolved from the scope, not from the endpoint set by routing, so
+        # requests answered by inner middlewares keep their route label too.
+        route = match_api_route(scope)
+        return UNMATCHED_ROUTE if route is None else route.path
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+
+from threading import Lock
+
+from time import monotonic
+
+from typing import Hashable
+from typing import Iterable
+
+from src.banking_app.conf import settings
+from src.banking_app.utils.exceptions import BaseExceptionRaiser
+
+
+class NegativeCache:
+    """
+    Bounded LRU of recently missed keys, e.g. `('Client', 42)`, with error
+    bodies rendered on the miss, so repeated lookups of the same missing key
+    are answered without the database and without building the error again.
+
+    Endpoints creating objects discard their keys. Misses of lookups which
+    were running during a discard aren't added, since the object could be
+    created after their query. Other processes see creations after `ttl`.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, tuple[float, int, bytes]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Response | None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            expires_at, status_code, body = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return Response(content=body, status_code=status_code, media_type='application/json')
+
+    def add(self, key: Hashable, raiser: BaseExceptionRaiser, generation: int) -> None:
+        """Add miss of lookup which started at `generation`."""
+        if self.capacity <= 0:
+            return
+        body = JSONResponse(content={'detail': raiser.detail}).body
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (monotonic() + self.ttl, raiser.status_code, body)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def discard(self, keys: Iterable[Hashable]) -> None:
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+not_found_cache = NegativeCache(
+    capacity=settings.NEGATIVE_CACHE_SIZE if settings.NEGATIVE_CACHE_ENABLED else 0,
+    ttl=settings.NEGATIVE_CACHE_TTL_SECONDS,
+)
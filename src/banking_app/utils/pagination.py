@@ -0,0 +1,33 @@
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
+
+from binascii import Error as DecodeError
+
+from datetime import datetime
+
+from typing import NamedTuple
+
+
+class KeysetCursor(NamedTuple):
+    """
+    Position of the last row of the page, rows of the next page are strictly
+    after (`position`, `row_id`) in the ordering of the statement.
+    """
+
+    position: datetime
+    row_id: int
+
+    def encode(self) -> str:
+        raw = f'{self.position.isoformat()}|{self.row_id}'
+        return urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> 'KeysetCursor':
+        """Decode cursor received from client, raise ValueError if invalid."""
+
+        try:
+            raw = urlsafe_b64decode(cursor.encode()).decode()
+            position, row_id = raw.split('|')
+            return cls(datetime.fromisoformat(position), int(row_id))
+        except (DecodeError, UnicodeDecodeError, ValueError):
+            raise ValueError(f'Invalid cursor `{cursor}`.')
@@ -0,0 +1,158 @@
+import cProfile
+import marshal
+import os
+import selectors
+import sys
+import threading
+
+from collections import Counter
+
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse
+from starlette.responses import Response
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from time import sleep
+
+from src.banking_app.conf import settings
+
+
+PROFILE_HEADER = 'x-profile'
+ADMIN_TOKEN_HEADER = 'x-admin-token'
+
+COLLAPSED = 'collapsed'
+PSTATS = 'pstats'
+PROFILE_FORMATS = (COLLAPSED, PSTATS)
+
+# Threads which innermost frame is in these modules wait for work, their
+# samples are noise: idle threadpool workers and the event loop selector.
+IDLE_FILES = frozenset({threading.__file__, selectors.__file__})
+
+
+class SamplingProfiler:
+    """
+    Sample stacks of all threads every `interval` seconds in a background
+    thread and count them in the collapsed format, which is read by
+    flamegraph.pl and speedscope: `file:function;file:function count`.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def render(self) -> str:
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stopped.is_set():
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident or frame.f_code.co_filename in IDLE_FILES:
+                    continue
+                self.stacks[self._collapse(frame)] += 1
+            sleep(self.interval)
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        names = list()
+        while frame is not None:
+            code = frame.f_code
+            names.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+
+
+class ProfilingMiddleware:
+    """
+    Run request under a profiler if it carries `X-Profile: collapsed|pstats`
+    header and valid `X-Admin-Token`, and respond with the profile as an
+    attachment instead of the endpoint response, whose status is returned
+    in `X-Profiled-Status` header.
+
+    `collapsed` - sampling profiler of all threads, so sync endpoints running
+    in the threadpool are included (as well as concurrent requests).
+    `pstats` - deterministic cProfile, since Python 3.12 it sees all threads,
+    before it sees only the event loop thread. Load it with `pstats.Stats`.
+
+    Profiled requests are served one at a time, the others get 409.
+    """
+
+    def __init__(self, app: ASGIApp, sample_interval: float = 0.001):
+        self.app = app
+        self.sample_interval = sample_interval
+        self._lock = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if (profile_format := headers.get(PROFILE_HEADER)) is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not settings.is_admin_token(headers.get(ADMIN_TOKEN_HEADER)):
+            response: Response = PlainTextResponse('Forbidden', status_code=403)
+        elif profile_format not in PROFILE_FORMATS:
+            response = PlainTextResponse(
+                content=f'{PROFILE_HEADER} must be one of: {", ".join(PROFILE_FORMATS)}.',
+                status_code=400,
+            )
+        elif not self._lock.acquire(blocking=False):
+            response = PlainTextResponse('Another request is being profiled.', status_code=409)
+        else:
+            try:
+                response = await self._profile(profile_format, scope, receive)
+            finally:
+                self._lock.release()
+        await response(scope, receive, send)
+
+    async def _profile(self, profile_format: str, scope: Scope, receive: Receive) -> Response:
+        status_code = 500
+
+        async def discard_response(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+
+        if profile_format == COLLAPSED:
+            sampler = SamplingProfiler(interval=self.sample_interval)
+            sampler.start()
+            try:
+                await self.app(scope, receive, discard_response)
+            finally:
+                sampler.stop()
+            content, media_type, extension = sampler.render(), 'text/plain', 'txt'
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, discard_response)
+            finally:
+                profiler.disable()
+            profiler.create_stats()
+            # Same content as pstats.Stats.dump_stats() writes into the file.
+            content, media_type, extension = marshal.dumps(profiler.stats), 'application/octet-stream', 'pstats'
+
+        return Response(
+            content=content,
+            media_type=media_type,
+            headers={
+                'Content-Disposition': f'attachment; filename="profile.{extension}"',
+                'X-Profiled-Status': str(status_code),
+            },
+        )
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+
+from fastapi import Request
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import SessionTransaction
+
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+
+from src.banking_app.conf import settings
+from src.banking_app.routers.base import match_api_route
+
+
+QUERY_DEADLINE_KEY = 'query_deadline'
+# Attribute of endpoint function, is set by `query_deadline` decorator.
+ENDPOINT_ATTRIBUTE = '__query_deadline__'
+
+Endpoint = TypeVar('Endpoint', bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class QueryDeadline:
+    statement_timeout_ms: int | None = None
+    lock_timeout_ms: int | None = None
+
+    def __bool__(self) -> bool:
+        return self.statement_timeout_ms is not None or self.lock_timeout_ms is not None
+
+    def get_config(self) -> dict[str, str]:
+        config = dict()
+        if self.statement_timeout_ms is not None:
+            config['statement_timeout'] = str(self.statement_timeout_ms)
+        if self.lock_timeout_ms is not None:
+            config['lock_timeout'] = str(self.lock_timeout_ms)
+        return config
+
+
+def query_deadline(
+        statement_timeout_ms: int | None = None,
+        lock_timeout_ms: int | None = None,
+) -> Callable[[Endpoint], Endpoint]:
+    """
+    Set timeouts of queries executed by endpoint, they are overridden by
+    `ROUTE_STATEMENT_TIMEOUTS_MS` and `ROUTE_LOCK_TIMEOUTS_MS` settings.
+    """
+    def decorator(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, ENDPOINT_ATTRIBUTE, QueryDeadline(statement_timeout_ms, lock_timeout_ms))
+        return endpoint
+    return decorator
+
+
+def get_query_deadline(request: Request) -> QueryDeadline:
+    if (api_route := match_api_route(request.scope)) is None:
+        return QueryDeadline()
+    deadline = getattr(api_route.endpoint, ENDPOINT_ATTRIBUTE, QueryDeadline())
+    route = f'{request.method} {api_route.path}'
+    return QueryDeadline(
+        statement_timeout_ms=settings.ROUTE_STATEMENT_TIMEOUTS_MS.get(route, deadline.statement_timeout_ms),
+        lock_timeout_ms=settings.ROUTE_LOCK_TIMEOUTS_MS.get(route, deadline.lock_timeout_ms),
+    )
+
+
+def apply_query_deadline(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+    """
+    Listener of `after_begin` session event, SET LOCAL lasts until the end of
+    transaction, so timeouts are set at the start of each one. `set_config`
+    is used since SET can't take bound parameters, and it sets both timeouts
+    in one round trip.
+    """
+    deadline: QueryDeadline | None = session.info.get(QUERY_DEADLINE_KEY)
+    if not deadline:
+        return
+    config = deadline.get_config()
+    columns = ', '.join(f"set_config('{name}', :{name}, true)" for name in config)
+    connection.execute(text(f'SELECT {columns}'), config)
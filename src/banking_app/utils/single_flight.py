@@ -0,0 +1,118 @@
+import anyio
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+
+from src.banking_app.conf import settings
+from src.banking_app.routers.base import match_api_route
+from src.banking_app.utils.metrics import MetricsRegistry
+
+
+# Attribute of endpoint function, is set by `single_flight` decorator.
+ENDPOINT_ATTRIBUTE = '__single_flight__'
+
+Endpoint = TypeVar('Endpoint', bound=Callable[..., Any])
+
+
+def single_flight(endpoint: Endpoint) -> Endpoint:
+    """Opt in GET endpoint to share response between identical concurrent requests."""
+    setattr(endpoint, ENDPOINT_ATTRIBUTE, True)
+    return endpoint
+
+
+@dataclass(eq=False)
+class _Flight:
+    done: anyio.Event = field(default_factory=anyio.Event)
+    messages: list[Message] | None = None
+
+
+class SingleFlightMiddleware:
+    """
+    Pure ASGI middleware which runs only the first (leader) of identical
+    concurrent GET requests to opted in routes, the others (followers) wait
+    for it and receive a copy of its response, so they share one DB query
+    and one serialization. Requests are identical if their path and query
+    string are equal.
+
+    Follower which arrives after a write was committed may get the result
+    of read started before it, as if it had arrived slightly earlier. If the
+    leader fails without a complete response, followers run on their own.
+
+    Routes are opted in by `single_flight` decorator or `SINGLE_FLIGHT_ROUTES`
+    setting (keys like `GET /status/list`).
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry | None = None):
+        self.app = app
+        self.leaders = 0
+        self.coalesced = 0
+        self._flights: dict[str, _Flight] = dict()
+        if registry is not None:
+            self.instrument(registry)
+
+    def instrument(self, registry: MetricsRegistry) -> None:
+        registry.add_counter(
+            'single_flight_leaders_total',
+            'Requests which were executed for themselves and followers.',
+            lambda: self.leaders,
+        )
+        registry.add_counter(
+            'single_flight_coalesced_total',
+            'Requests which received response of a concurrent identical request.',
+            lambda: self.coalesced,
+        )
+        registry.add_gauge(
+            'single_flight_in_flight',
+            'Requests being executed for themselves and followers.',
+            lambda: len(self._flights),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] != 'GET' or not self._is_opted_in(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key = f'{scope["path"]}?{scope["query_string"].decode("latin-1")}'
+        if (flight := self._flights.get(key)) is not None:
+            await flight.done.wait()
+            if flight.messages is None:
+                await self.app(scope, receive, send)
+                return
+            self.coalesced += 1
+            for message in flight.messages:
+                await send(message)
+            return
+
+        flight = self._flights[key] = _Flight()
+        self.leaders += 1
+        messages: list[Message] = list()
+
+        async def send_and_keep(message: Message) -> None:
+            messages.append(message)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_keep)
+            if messages and not messages[-1].get('more_body', False):
+                flight.messages = messages
+        finally:
+            del self._flights[key]
+            flight.done.set()
+
+    @staticmethod
+    def _is_opted_in(scope: Scope) -> bool:
+        if (route := match_api_route(scope)) is None:
+            return False
+        if getattr(route.endpoint, ENDPOINT_ATTRIBUTE, False):
+            return True
+        return f'GET {route.path}' in settings.SINGLE_FLIGHT_ROUTES
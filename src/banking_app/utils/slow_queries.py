@@ -0,0 +1,177 @@
+import re
+
+from collections import deque
+
+from dataclasses import dataclass
+
+from datetime import datetime
+from datetime import timezone
+
+from hashlib import sha1
+
+from logging import getLogger
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from threading import Lock
+
+from time import perf_counter
+
+from typing import Any
+
+from src.banking_app.conf import settings
+
+
+logger = getLogger(__name__)
+
+EXPLAINABLE = ('select', 'insert', 'update', 'delete', 'with')
+EXPLAIN_SAVEPOINT = 'slow_query_explain'
+
+_FINGERPRINT_REPLACEMENTS = (
+    (re.compile(r"'(?:[^']|'')*'"), '?'),                   # String literals.
+    (re.compile(r'%\([^)]+\)s|%s'), '?'),                   # Bound parameters.
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),                # Numeric literals.
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(?+)'),    # IN (...) and VALUES (...).
+    (re.compile(r'\(\?\+\)(?:\s*,\s*\(\?\+\))+'), '(?+)'),  # Multi-row VALUES.
+    (re.compile(r'\s+'), ' '),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class SlowQuery:
+    fingerprint: str
+    statement: str
+    parameters_shape: dict[str, str]
+    batch_size: int
+    duration_ms: float
+    captured_at: datetime
+    plan: Any = None
+
+
+def normalize_statement(statement: str) -> str:
+    """Replace literals and parameters, so same shaped statements are equal."""
+
+    for pattern, replacement in _FINGERPRINT_REPLACEMENTS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+def get_parameters_shape(parameters: Any) -> dict[str, str]:
+    """Types (and sizes of sequences) of the parameters, without values."""
+
+    if isinstance(parameters, dict):
+        items = parameters.items()
+    elif isinstance(parameters, (list, tuple)):
+        items = enumerate(parameters)
+    else:
+        return dict()
+
+    shape = dict()
+    for key, value in items:
+        type_name = type(value).__name__
+        if isinstance(value, (list, tuple)):
+            type_name = f'{type_name}[{len(value)}]'
+        shape[str(key)] = type_name
+    return shape
+
+
+class SlowQueryRecorder:
+    """
+    Keep the latest statements which took longer than `threshold_ms` in a
+    bounded ring buffer together with their `EXPLAIN (FORMAT JSON)` plan.
+
+    With `analyze=True` plans of SELECT statements are captured with ANALYZE,
+    which executes the statement the second time.
+    """
+
+    def __init__(
+            self,
+            threshold_ms: float,
+            capacity: int,
+            *,
+            explain: bool = True,
+            analyze: bool = False,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.analyze = analyze
+        self.records: deque[SlowQuery] = deque(maxlen=capacity)
+        self._lock = Lock()
+
+    def instrument(self, engine: Engine) -> None:
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def get_records(self) -> list[SlowQuery]:
+        """Captured records from the newest to the oldest."""
+        with self._lock:
+            return list(reversed(self.records))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Kept on the statement context, after_cursor_execute isn't called for failed statements.
+        context._slow_query_start_time = perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = perf_counter() - context._slow_query_start_time
+        if elapsed < self.threshold:
+            return
+
+        normalized = normalize_statement(statement)
+        plan = None
+        if self.explain and not executemany:
+            plan = self._explain(conn, statement, parameters)
+
+        record = SlowQuery(
+            fingerprint=sha1(normalized.encode()).hexdigest()[:16],
+            statement=normalized,
+            parameters_shape=get_parameters_shape(
+                parameters[0] if executemany and len(parameters) > 0 else parameters
+            ),
+            batch_size=len(parameters) if executemany else 1,
+            duration_ms=round(elapsed * 1000, 3),
+            captured_at=datetime.now(tz=timezone.utc),
+            plan=plan,
+        )
+        with self._lock:
+            self.records.append(record)
+
+    def _explain(self, conn, statement: str, parameters: Any) -> Any:
+        """
+        Explain statement on the same connection but with a separate cursor,
+        under a savepoint so a failed EXPLAIN can't abort the transaction.
+        """
+
+        kind = statement.lstrip().split(None, 1)[0].lower()
+        if kind not in EXPLAINABLE:
+            return None
+        options = 'ANALYZE, FORMAT JSON' if self.analyze and kind == 'select' else 'FORMAT JSON'
+
+        cursor = conn.connection.dbapi_connection.cursor()
+        in_transaction = conn.in_transaction()
+        try:
+            if in_transaction:
+                cursor.execute(f'SAVEPOINT {EXPLAIN_SAVEPOINT}')
+            cursor.execute(f'EXPLAIN ({options}) {statement}', parameters)
+            plan = cursor.fetchone()[0]
+            if in_transaction:
+                cursor.execute(f'RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}')
+            return plan
+        except Exception as error:
+            logger.warning('Slow query can\'t be explained: %s', error)
+            if in_transaction:
+                cursor.execute(f'ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}')
+            return None
+        finally:
+            cursor.close()
+
+
+slow_query_recorder = SlowQueryRecorder(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    capacity=settings.SLOW_QUERY_LOG_SIZE,
+    analyze=settings.SLOW_QUERY_EXPLAIN_ANALYZE,
+)
@@ -0,0 +1,86 @@
+from logging import getLogger
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import Executable
+
+from time import perf_counter
+
+from typing import Callable
+
+from src.banking_app.managers.balance import BalanceManager
+from src.banking_app.managers.client import ClientManager
+from src.banking_app.managers.status import StatusManager
+from src.banking_app.managers.transaction import TransactionManager
+from src.banking_app.managers.transaction_daily import TransactionDailyManager
+from src.banking_app.routers.base import DeferredTypeAdapter
+from src.banking_app.types.balance import TimeBucket
+
+
+logger = getLogger(__name__)
+
+status_manager = StatusManager()
+client_manager = ClientManager()
+balance_manager = BalanceManager()
+transaction_manager = TransactionManager()
+daily_manager = TransactionDailyManager()
+
+# Shapes of the read statements executed by routers, values of parameters
+# don't matter: compiled cache is keyed by the statement structure.
+WARMUP_STATEMENTS: tuple[Callable[[], Executable], ...] = (
+    lambda: status_manager.filter(),
+    lambda: status_manager.filter(status=0),
+    lambda: client_manager.filter(),
+    lambda: client_manager.filter(client_id=0),
+    lambda: client_manager.count(),
+    lambda: balance_manager.filter(),
+    lambda: balance_manager.history(0, TimeBucket.DAY),
+    lambda: transaction_manager.card_history('', limit=1),
+    lambda: transaction_manager.existing_card_numbers(['']),
+    lambda: daily_manager.card_daily(''),
+    lambda: daily_manager.client_daily(0),
+)
+
+
+def warm_up_pool(engine: Engine, size: int) -> None:
+    """Open `size` connections at once, so they stay in the pool."""
+
+    connections = list()
+    try:
+        for _ in range(size):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.exec_driver_sql('SELECT 1')
+    finally:
+        [connection.close() for connection in connections]
+
+
+def warm_up_statements(session_maker: sessionmaker) -> None:
+    """
+    Execute each statement shape once to fill the compiled cache. Statements
+    run with server side cursor which is closed without fetching, so Postgres
+    only plans them, and the transaction is rolled back.
+    """
+
+    with session_maker() as session:
+        for get_statement in WARMUP_STATEMENTS:
+            session.execute(get_statement(), execution_options=dict(stream_results=True)).close()
+        session.rollback()
+
+
+def warm_up_adapters() -> None:
+    """Build response adapters, which are built lazily on the first request."""
+    [adapter.adapter for adapter in DeferredTypeAdapter.instances]
+
+
+def warm_up(engine: Engine, session_maker: sessionmaker, pool_size: int) -> None:
+    """Run all warmups, failed DB warmup doesn't stop the application."""
+
+    start = perf_counter()
+    warm_up_adapters()
+    try:
+        warm_up_pool(engine, pool_size)
+        warm_up_statements(session_maker)
+    except Exception:
+        logger.exception('DB warmup failed, first requests will be slower.')
+    logger.info('Warmup finished in %.3f s.', perf_counter() - start)